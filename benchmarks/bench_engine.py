@@ -0,0 +1,210 @@
+"""
+Benchmarks of the Game of Life engine kernels.
+Run with `make bench` or `python benchmarks/bench_engine.py`.
+"""
+
+import argparse
+import functools
+import timeit
+from typing import Callable
+
+import numpy as np
+
+from game_of_life.config import BOARD_DTYPE, NEIGHBOR_METHODS
+from game_of_life.engine.bitboard import BitBoard
+from game_of_life.engine.board import Board, count_neighbors, evolve_per_cell, evolve_vectorized
+from game_of_life.engine.ensemble import Ensemble
+from game_of_life.engine.rule import Rule
+from game_of_life.engine.statistics import StatisticsCollector
+from game_of_life.gui.consts import COLORS
+from game_of_life.visualization.texture import board_to_rgba, build_palette
+
+
+def random_board(size: int, players: int = 2, density: float = 0.3, seed: int = 0) -> np.ndarray:
+    """
+    Create a random square board with the given number of players.
+
+    Args:
+        size: width and height of the board
+        players: number of players on the board
+        density: probability that a cell is alive
+        seed: seed of the random generator
+    """
+
+    rng = np.random.default_rng(seed)
+    alive = rng.random((size, size)) < density
+    return np.where(alive, rng.integers(1, players + 1, (size, size)), 0).astype(BOARD_DTYPE)
+
+
+def bench_evolve_per_cell(size: int) -> Callable:
+    """ Evolve a multi-player board with the per-cell reference loop. """
+
+    data = random_board(size)
+    return lambda: evolve_per_cell(data)
+
+
+def bench_evolve_vectorized(size: int) -> Callable:
+    """ Evolve a multi-player board with the vectorized kernel. """
+
+    data = random_board(size)
+    return lambda: evolve_vectorized(data)
+
+
+def bench_bitboard_evolve(size: int) -> Callable:
+    """ Evolve a single player board packed to one bit per cell. """
+
+    bitboard = BitBoard.from_board(Board(random_board(size, players=1)))
+    return bitboard.evolve
+
+
+def bench_board_evolve_single(size: int) -> Callable:
+    """ Evolve a single player board with Board.evolve, compare with evolve_blocks on the same board. """
+
+    board = Board(random_board(size, players=1))
+    return board.evolve
+
+
+def bench_evolve_blocks(size: int) -> Callable:
+    """ Evolve a single player board with the 4x4 to 2x2 block lookup table. """
+
+    board = Board(random_board(size, players=1))
+    return board.evolve_blocks
+
+
+def bench_evolve_tiled(size: int) -> Callable:
+    """ Evolve a sparse board where only a small random soup is active, skipping the quiet tiles and reusing the buffers. """
+
+    data = np.zeros((size, size), dtype=BOARD_DTYPE)
+    data[:64, :64] = random_board(64)
+    boards = [Board(data).evolve_tiled()]
+
+    def step():
+        boards[0] = boards[0].evolve_tiled()
+
+    return step
+
+
+def bench_boards_loop(size: int) -> Callable:
+    """ Evolve `size` small 32x32 boards one after another. """
+
+    boards = [Board(random_board(32, seed=seed)) for seed in range(size)]
+    return lambda: [board.evolve() for board in boards]
+
+
+def bench_ensemble_step(size: int) -> Callable:
+    """ Evolve `size` small 32x32 boards as one ensemble, created anew per call so that no board is finished. """
+
+    data = np.stack([random_board(32, seed=seed) for seed in range(size)])
+
+    def step():
+        ensemble = Ensemble(data.copy())
+        ensemble.step()
+
+    return step
+
+
+def bench_evolve_n(size: int) -> Callable:
+    """ Evolve a multi-player board by 10 generations with preallocated buffers. """
+
+    board = Board(random_board(size))
+    return lambda: board.evolve_n(10)
+
+
+def bench_evolve_10(size: int) -> Callable:
+    """ Evolve a multi-player board by 10 generations with repeated Board.evolve calls. """
+
+    board = Board(random_board(size))
+
+    def evolve():
+        current = board
+        for _ in range(10):
+            current = current.evolve()
+
+    return evolve
+
+
+def bench_count_neighbors(size: int, method: str, dtype: type) -> Callable:
+    """ Count the neighbors of a single player board of the given dtype with the given method. """
+
+    data = random_board(size, players=1).astype(dtype)
+    return lambda: count_neighbors(data, method=method)
+
+
+def bench_rule_step(size: int, rulestring: str) -> Callable:
+    """ Evolve a multi-player board by one generation of the given rule. """
+
+    rule = Rule.parse(rulestring)
+    data = random_board(size)
+    return lambda: rule.step(data)
+
+
+def bench_statistics_record(size: int) -> Callable:
+    """ Record the statistics of a freshly evolved three player board, compare with evolve_vectorized. """
+
+    board = Board(random_board(size, players=3)).evolve()
+    board.player_counts()
+    next_data = evolve_vectorized(board.data)
+    collector = StatisticsCollector(players=3)
+
+    # every call records a new successor, which counts its transitions again like every generation of a running game
+    return lambda: collector.record(board.successor(next_data), 1)
+
+
+def bench_board_to_rgba(size: int) -> Callable:
+    """ Map a three player board to the RGBA pixels of the texture view. """
+
+    data = random_board(size, players=3)
+    palette = build_palette(COLORS)
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    return lambda: board_to_rgba(data, palette, out=pixels)
+
+
+BENCHMARKS = {
+    "evolve_per_cell": bench_evolve_per_cell,
+    "evolve_vectorized": bench_evolve_vectorized,
+    "bitboard_evolve": bench_bitboard_evolve,
+    "board_evolve_single": bench_board_evolve_single,
+    "evolve_blocks": bench_evolve_blocks,
+    "evolve_tiled": bench_evolve_tiled,
+    "boards_loop": bench_boards_loop,
+    "ensemble_step": bench_ensemble_step,
+    "evolve_10": bench_evolve_10,
+    "evolve_n": bench_evolve_n,
+    "statistics_record": bench_statistics_record,
+    "board_to_rgba": bench_board_to_rgba,
+}
+
+for method in NEIGHBOR_METHODS:
+    for dtype in (bool, np.uint8, np.int32):
+        BENCHMARKS[f"count_neighbors_{method}_{np.dtype(dtype).name}"] = functools.partial(bench_count_neighbors, method=method, dtype=dtype)
+
+for name, rulestring in [("highlife", "B36/S23"), ("ltl_r2", "R2,C0,M1,S6..12,B8..10,NM"), ("ltl_r10", "R10,C0,M1,S100..200,B120..160,NM")]:
+    BENCHMARKS[f"rule_{name}"] = functools.partial(bench_rule_step, rulestring=rulestring)
+
+
+def run(names: list[str], sizes: list[int], repeat: int) -> None:
+    """
+    Run the selected benchmarks and print the best time per call.
+
+    Args:
+        names: names of the benchmarks to run
+        sizes: board sizes to run the benchmarks on
+        repeat: number of repetitions, the best one is reported
+    """
+
+    print(f"{'benchmark':<30}{'size':>8}{'time [ms]':>14}")
+    for name in names:
+        for size in sizes:
+            fn = BENCHMARKS[name](size)
+            best = min(timeit.repeat(fn, number=1, repeat=repeat))
+            print(f"{name:<30}{size:>8}{best * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.names, args.sizes, args.repeat)
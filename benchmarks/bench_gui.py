@@ -0,0 +1,135 @@
+"""
+Benchmarks of the Game of Life board views.
+Run with `make bench-gui` or `python benchmarks/bench_gui.py`.
+
+Kivy runs with the mock GL backend and no window by default, so the benchmarks measure the cost of updating
+the widgets and their canvas instructions per frame without a display. Pass --render to open a window
+(e.g. with SDL_VIDEODRIVER=dummy on a headless machine) and draw every frame as well.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import timeit
+from typing import Callable
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+if "--render" not in sys.argv:
+    os.environ.setdefault("KIVY_GL_BACKEND", "mock")
+
+# Kivy reads the environment on import
+import numpy as np
+from kivy.graphics import Color
+from kivy.uix.widget import Widget
+
+from game_of_life.config import BOARD_DTYPE
+from game_of_life.engine.board import Board
+from game_of_life.gui.consts import COLORS
+from game_of_life.gui.widgets.board_game_view import BoardGameView
+from game_of_life.gui.widgets.board_texture_view import BoardTextureView
+from game_of_life.gui.widgets.cell_view import CellView
+
+
+class LegacyCellView(CellView):
+    """ CellView updated the way it was before the Color instruction was reused, for comparison. """
+
+    def update(self, value: int) -> None:
+        """ Rebuild the canvas with a new Color instruction. """
+
+        self.canvas.before.clear()
+        self.canvas.before.add(Color(*COLORS[value]))
+        self.canvas.before.add(self.rect)
+
+
+class LegacyBoardGameView(BoardGameView):
+    """ BoardGameView made of LegacyCellView cells. """
+
+    cell_class = LegacyCellView
+
+
+def random_generations(size: int, generations: int, players: int = 2, density: float = 0.3, seed: int = 0) -> list[Board]:
+    """
+    Evolve a random square board and keep every generation.
+
+    Args:
+        size: width and height of the board
+        generations: number of generations to keep, including the random one
+        players: number of players on the board
+        density: probability that a cell is alive
+        seed: seed of the random generator
+    """
+
+    rng = np.random.default_rng(seed)
+    alive = rng.random((size, size)) < density
+    board = Board(np.where(alive, rng.integers(1, players + 1, (size, size)), 0).astype(BOARD_DTYPE))
+
+    boards = [board]
+    for _ in range(generations - 1):
+        boards.append(boards[-1].evolve())
+    return boards
+
+
+def frame_loop(view: Widget, boards: list[Board], render: bool) -> Callable:
+    """ Reflect the next generation in the view on every call, cycling through the generations. """
+
+    if render:
+        from kivy.base import EventLoop
+
+        EventLoop.ensure_window()
+        EventLoop.window.clear_widgets()
+        EventLoop.window.add_widget(view)
+
+    frames = itertools.count()
+
+    def frame():
+        view.reflect_model(boards[next(frames) % len(boards)])
+        if render:
+            EventLoop.idle()
+
+    return frame
+
+
+BENCHMARKS = {
+    "legacy_cells": LegacyBoardGameView,
+    "cells": BoardGameView,
+    "texture": BoardTextureView,
+}
+
+
+def run(names: list[str], size: int, frames: int, repeat: int, render: bool) -> None:
+    """
+    Run the selected benchmarks and print the mean time per frame of the best repetition.
+
+    Args:
+        names: names of the benchmarks to run
+        size: width and height of the board
+        frames: number of frames per repetition
+        repeat: number of repetitions, the best one is reported
+        render: whether to draw every frame in a window
+    """
+
+    boards = random_generations(size, generations=frames + 1)
+
+    print(f"{'benchmark':<20}{'size':>8}{'build [s]':>12}{'frame [ms]':>14}")
+    for name in names:
+        start = timeit.default_timer()
+        view = BENCHMARKS[name](model=boards[0])
+        build = timeit.default_timer() - start
+
+        fn = frame_loop(view, boards[1:], render)
+        best = min(timeit.repeat(fn, number=frames, repeat=repeat)) / frames
+        print(f"{name:<20}{size:>8}{build:>12.2f}{best * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--render", action="store_true", help="draw every frame in a window")
+    args = parser.parse_args()
+
+    run(args.names, args.size, args.frames, args.repeat, args.render)
@@ -5,4 +5,10 @@ setup(
     version="1.0",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    entry_points={
+        "console_scripts": [
+            "game-of-life-batch=game_of_life.cli:main",
+            "game-of-life-tournament=game_of_life.cli:tournament_main",
+        ],
+    },
 )
@@ -0,0 +1,337 @@
+"""
+This module implements headless command line tools of the Game of Life.
+The batch runner loads boards and patterns from the database or from files, runs every input as a separate game
+until it reaches the number of steps or terminates, and writes out its final board and statistics.
+The tournament runner plays the patterns of the database against each other, see Tournament.
+Inputs and matches are independent, so they are spread over a pool of worker processes. Nothing here imports Kivy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from game_of_life.config import (
+    BOUNDARIES,
+    DEFAULT_BATCH_BOARD_HEIGHT,
+    DEFAULT_BATCH_BOARD_WIDTH,
+    DEFAULT_BOUNDARY,
+    DEFAULT_RULE,
+    DEFAULT_SCORING,
+    DEFAULT_STATISTICS_CAPACITY,
+    DEFAULT_STEPS,
+    DEFAULT_TOURNAMENT_PLAYERS,
+    SCORINGS,
+)
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.pattern import Pattern, load_all_patterns
+from game_of_life.engine.statistics import StatisticsCollector
+from game_of_life.engine.tournament import Tournament
+from game_of_life.utils.path_manager import PathManager
+
+STATISTICS_FORMATS = ("npz", "csv")
+SUMMARY_FIELDS = ("input", "generations", "alive", "transient", "period", "board", "statistics")
+STANDINGS_FIELDS = ("pattern", "wins", "draws", "losses")
+
+
+def place_centered(pattern: Pattern, width: int, height: int, boundary: str = DEFAULT_BOUNDARY) -> Board:
+    """
+    Create an empty board and place the pattern in its center for player 1.
+
+    Args:
+        pattern: pattern to place
+        width: width of the board
+        height: height of the board
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+    """
+
+    board = Board.new(width, height, boundary=boundary)
+
+    x0, y0 = (width - pattern.width) // 2, (height - pattern.height) // 2
+    if not board.can_place_pattern(pattern, x0, y0):
+        raise ValueError(f"Pattern {pattern.name} of size {pattern.width}x{pattern.height} does not fit a {width}x{height} board")
+
+    board.place_pattern(pattern, x0, y0)
+    return board
+
+
+def load_input(
+    source: str,
+    root: str = ".",
+    width: int = DEFAULT_BATCH_BOARD_WIDTH,
+    height: int = DEFAULT_BATCH_BOARD_HEIGHT,
+    boundary: str = DEFAULT_BOUNDARY,
+) -> tuple[str, Board]:
+    """
+    Load the board of a batch input.
+    The source is either a file (.npy board or .pkl pattern) or the name of a board or pattern in the database,
+    boards are looked up first. Patterns are placed in the center of an empty board.
+
+    Args:
+        source: path or database name of the input
+        root: root directory of the database
+        width: width of the board patterns are placed on
+        height: height of the board patterns are placed on
+        boundary: boundary of the loaded board
+
+    Returns:
+        name of the input used for the output files and its board
+    """
+
+    path = Path(source)
+    if not path.is_file():
+        path_manager = PathManager(root)
+        path = next((p for p in (path_manager.get_board_path(source), path_manager.get_pattern_path(source)) if p.is_file()), None)
+        if path is None:
+            raise ValueError(f"No board or pattern named {source} in the database at {path_manager.db_root}")
+
+    if path.suffix == ".npy":
+        return path.stem, Board.load(path, boundary=boundary)
+
+    if path.suffix == ".pkl":
+        return path.stem, place_centered(Pattern.load(path), width, height, boundary=boundary)
+
+    raise ValueError(f"Unknown input format {path.suffix}, expected an .npy board or a .pkl pattern")
+
+
+def run_input(
+    source: str,
+    output: str,
+    root: str = ".",
+    steps: int = DEFAULT_STEPS,
+    rule: str = DEFAULT_RULE,
+    boundary: str = DEFAULT_BOUNDARY,
+    width: int = DEFAULT_BATCH_BOARD_WIDTH,
+    height: int = DEFAULT_BATCH_BOARD_HEIGHT,
+    stop_on_cycle: bool = False,
+    statistics_format: str = STATISTICS_FORMATS[0],
+) -> dict[str, str | int | None]:
+    """
+    Run the game of one input and write its final board and statistics to the output directory.
+    The game runs until the number of steps or until all cells die,
+    and with stop_on_cycle also until the board repeats an earlier generation.
+    The first repeated generation is reported either way.
+    No history is kept, the statistics are streamed to the file while the game runs.
+
+    Args:
+        source: path or database name of the input, see load_input
+        output: directory the results are written to
+        root: root directory of the database
+        steps: maximal number of generations to run
+        rule: rulestring the board evolves by
+        boundary: boundary of the board
+        width: width of the board patterns are placed on
+        height: height of the board patterns are placed on
+        stop_on_cycle: whether to stop once the board repeats an earlier generation
+        statistics_format: "npz" or "csv" file format of the statistics
+
+    Returns:
+        summary of the run with the fields in SUMMARY_FIELDS
+    """
+
+    name, board = load_input(source, root=root, width=width, height=height, boundary=boundary)
+
+    os.makedirs(output, exist_ok=True)
+    board_path = os.path.join(output, f"{name}.npy")
+    statistics_path = os.path.join(output, f"{name}_statistics.{statistics_format}")
+
+    players = max(int(board.data.max()), 1)
+    statistics = StatisticsCollector(players, capacity=min(steps + 1, DEFAULT_STATISTICS_CAPACITY), path=statistics_path)
+
+    game = Game(board, steps=steps, rule=rule, detect_cycles=True, stop_on_cycle=stop_on_cycle, statistics=statistics)
+    statistics.record(game.board, game.i)
+
+    while game.run_step():
+        pass
+
+    statistics.close()
+    game.board.save(board_path)
+
+    return {
+        "input": source,
+        "generations": game.i,
+        "alive": game.board.count_alive_cells(),
+        "transient": game.transient,
+        "period": game.period,
+        "board": board_path,
+        "statistics": statistics_path,
+    }
+
+
+def _run_input(source: str, options: dict) -> dict[str, str | int | None] | str:
+    """ Run one input in a worker process, a failure is returned as its message so other inputs keep running. """
+
+    try:
+        return run_input(source, **options)
+    except (OSError, ValueError) as error:
+        return f"{source}: {error}"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the batch runner.
+
+    Args:
+        argv: arguments without the program name, None to use sys.argv
+    """
+
+    parser = argparse.ArgumentParser(prog="game-of-life-batch", description="Run Game of Life simulations without the GUI.")
+    parser.add_argument("inputs", nargs="*", help="database names of boards or patterns, or paths to .npy boards and .pkl patterns")
+    parser.add_argument("--all-boards", action="store_true", help="run all boards in the database")
+    parser.add_argument("--all-patterns", action="store_true", help="run all patterns in the database")
+    parser.add_argument("--root", default=".", help="root directory of the database (default: %(default)s)")
+    parser.add_argument("-o", "--output", default="results", help="directory to write the results to (default: %(default)s)")
+    parser.add_argument("-n", "--steps", type=int, default=DEFAULT_STEPS, help="maximal number of generations (default: %(default)s)")
+    parser.add_argument("--rule", default=DEFAULT_RULE, help="rulestring to evolve by (default: %(default)s)")
+    parser.add_argument("--boundary", choices=BOUNDARIES, default=DEFAULT_BOUNDARY, help="boundary of the boards (default: %(default)s)")
+    parser.add_argument("--width", type=int, default=DEFAULT_BATCH_BOARD_WIDTH, help="width of the board patterns are placed on (default: %(default)s)")
+    parser.add_argument("--height", type=int, default=DEFAULT_BATCH_BOARD_HEIGHT, help="height of the board patterns are placed on (default: %(default)s)")
+    parser.add_argument("--stop-on-cycle", action="store_true", help="stop once the board repeats an earlier generation")
+    parser.add_argument("--statistics-format", choices=STATISTICS_FORMATS, default=STATISTICS_FORMATS[0], help="file format of the statistics (default: %(default)s)")
+    parser.add_argument("-j", "--processes", type=int, default=1, help="number of worker processes, 0 for the number of CPUs (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+
+    if args.steps < 0:
+        parser.error(f"steps must be non-negative, got {args.steps}")
+    if args.processes < 0:
+        parser.error(f"processes must be non-negative, got {args.processes}")
+
+    path_manager = PathManager(args.root) if args.all_boards or args.all_patterns else None
+    if args.all_boards:
+        args.inputs += sorted(str(path) for path in path_manager.get_all_boards())
+    if args.all_patterns:
+        args.inputs += sorted(str(path) for path in path_manager.get_all_patterns())
+
+    if not args.inputs:
+        parser.error("no inputs given")
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of the batch runner, prints a tab separated summary line for every input.
+
+    Args:
+        argv: arguments without the program name, None to use sys.argv
+
+    Returns:
+        exit code, 1 if any input failed
+    """
+
+    args = parse_args(argv)
+
+    options = {
+        "output": args.output,
+        "root": args.root,
+        "steps": args.steps,
+        "rule": args.rule,
+        "boundary": args.boundary,
+        "width": args.width,
+        "height": args.height,
+        "stop_on_cycle": args.stop_on_cycle,
+        "statistics_format": args.statistics_format,
+    }
+
+    processes = args.processes or os.cpu_count()
+    sources = args.inputs
+    if processes == 1 or len(sources) == 1:
+        results = [_run_input(source, options) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, len(sources))) as executor:
+            results = list(executor.map(_run_input, sources, [options] * len(sources)))
+
+    print("\t".join(SUMMARY_FIELDS))
+
+    failed = False
+    for result in results:
+        if isinstance(result, str):
+            print(result, file=sys.stderr)
+            failed = True
+        else:
+            print("\t".join("-" if result[field] is None else str(result[field]) for field in SUMMARY_FIELDS))
+
+    return 1 if failed else 0
+
+
+def parse_tournament_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the tournament runner.
+
+    Args:
+        argv: arguments without the program name, None to use sys.argv
+    """
+
+    parser = argparse.ArgumentParser(prog="game-of-life-tournament", description="Play the patterns of the database against each other.")
+    parser.add_argument("patterns", nargs="*", help="database names of the patterns to play, all patterns of the database if none are given")
+    parser.add_argument("--root", default=".", help="root directory of the database (default: %(default)s)")
+    parser.add_argument("-r", "--results", default="tournament.jsonl", help="JSON lines file the results are stored in and resumed from (default: %(default)s)")
+    parser.add_argument("-p", "--players", type=int, default=DEFAULT_TOURNAMENT_PLAYERS, help="number of players in every match (default: %(default)s)")
+    parser.add_argument("-n", "--steps", type=int, default=DEFAULT_STEPS, help="number of generations of every match (default: %(default)s)")
+    parser.add_argument("--rule", default=DEFAULT_RULE, help="rulestring to evolve by (default: %(default)s)")
+    parser.add_argument("--scoring", choices=SCORINGS, default=DEFAULT_SCORING, help="population deciding the winner (default: %(default)s)")
+    parser.add_argument("--boundary", choices=BOUNDARIES, default=DEFAULT_BOUNDARY, help="boundary of the boards (default: %(default)s)")
+    parser.add_argument("--width", type=int, default=DEFAULT_BATCH_BOARD_WIDTH, help="width of the boards (default: %(default)s)")
+    parser.add_argument("--height", type=int, default=DEFAULT_BATCH_BOARD_HEIGHT, help="height of the boards (default: %(default)s)")
+    parser.add_argument("-j", "--processes", type=int, default=1, help="number of worker processes, 0 for the number of CPUs (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+
+    if args.steps < 0:
+        parser.error(f"steps must be non-negative, got {args.steps}")
+    if args.processes < 0:
+        parser.error(f"processes must be non-negative, got {args.processes}")
+
+    return args
+
+
+def tournament_main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of the tournament runner, prints the tab separated standings of the patterns.
+
+    Args:
+        argv: arguments without the program name, None to use sys.argv
+
+    Returns:
+        exit code, 1 if the tournament could not be played
+    """
+
+    args = parse_tournament_args(argv)
+    path_manager = PathManager(args.root)
+
+    try:
+        if args.patterns:
+            patterns = [Pattern.load(path_manager.get_pattern_path(name)) for name in args.patterns]
+        else:
+            patterns = load_all_patterns(path_manager)
+
+        tournament = Tournament(
+            patterns,
+            args.results,
+            players=args.players,
+            steps=args.steps,
+            rule=args.rule,
+            scoring=args.scoring,
+            width=args.width,
+            height=args.height,
+            boundary=args.boundary,
+        )
+        results = tournament.run(args.processes or None)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print("\t".join(STANDINGS_FIELDS))
+    for row in tournament.standings(results):
+        print("\t".join(str(row[field]) for field in STANDINGS_FIELDS))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
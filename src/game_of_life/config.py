@@ -5,13 +5,65 @@ Specifically default values and strings for simple file db.
 
 import numpy as np
 
-BOARD_DTYPE = np.int32
+# cells hold player indices, boards use the narrowest of these dtypes which fits all players
+PLAYER_DTYPES = (np.uint8, np.uint16, np.uint32)
+BOARD_DTYPE = PLAYER_DTYPES[0]
 DEFAULT_BOARD_WIDTH = 10
 DEFAULT_BOARD_HEIGHT = 10
 
+# cells outside of the board are dead ("fill") or the board wraps around as a torus ("wrap")
+BOUNDARY_FILL = "fill"
+BOUNDARY_WRAP = "wrap"
+BOUNDARIES = (BOUNDARY_FILL, BOUNDARY_WRAP)
+DEFAULT_BOUNDARY = BOUNDARY_FILL
+
+# neighbors are counted by separable sums of shifted slices ("slices") or by scipy.signal.convolve2d ("convolve")
+NEIGHBOR_METHOD_SLICES = "slices"
+NEIGHBOR_METHOD_CONVOLVE = "convolve"
+NEIGHBOR_METHODS = (NEIGHBOR_METHOD_SLICES, NEIGHBOR_METHOD_CONVOLVE)
+DEFAULT_NEIGHBOR_METHOD = NEIGHBOR_METHOD_SLICES
+
+# rulestring of the default rule, see Rule.parse for the supported formats
+DEFAULT_RULE = "B3/S23"
+
 DEFAULT_FREQUENCY = 10
 DEFAULT_STEPS = 100
 
+DEFAULT_HASHLIFE_CACHE_SIZE = 1_000_000
+
+# engine which computed a jump of the game, HashLife ("hashlife") or stepping the board ("steps")
+JUMP_HASHLIFE = "hashlife"
+JUMP_STEPS = "steps"
+
+DEFAULT_TILE_SIZE = 64
+
+# the history stores a full board every keyframe interval steps and only the changed cells in between
+DEFAULT_HISTORY_KEYFRAME_INTERVAL = 32
+DEFAULT_HISTORY_MEMORY_BUDGET = 256 * 2 ** 20
+
+# the game keeps a full board every checkpoint interval generations, seeking recomputes from the nearest one
+DEFAULT_CHECKPOINT_INTERVAL = 100
+
+# seconds a parallel worker waits for the others to finish a generation before it gives up
+DEFAULT_PARALLEL_TIMEOUT = 60.0
+
+# number of frames the background runner keeps for a display which falls behind, poll skips to the newest one
+DEFAULT_RUNNER_BUFFER_SIZE = 8
+
+# number of generations the statistics collector holds in memory before it flushes them
+DEFAULT_STATISTICS_CAPACITY = 1024
+
+# boards the batch runner places single patterns on, when no size is given
+DEFAULT_BATCH_BOARD_WIDTH = 100
+DEFAULT_BATCH_BOARD_HEIGHT = 100
+
+# tournament matches are won by the most cells at the last generation ("final") or summed over all generations ("integrated")
+SCORING_FINAL = "final"
+SCORING_INTEGRATED = "integrated"
+SCORINGS = (SCORING_FINAL, SCORING_INTEGRATED)
+DEFAULT_SCORING = SCORING_INTEGRATED
+DEFAULT_TOURNAMENT_PLAYERS = 2
+
 DB_ROOT = "db"
 DB_BOARD_DIR = "boards"
 DB_PATTERN_DIR = "entities"
@@ -0,0 +1,214 @@
+"""
+This module implements a bit-packed single player Game of Life board.
+Every row is stored as 64-bit words, one bit per cell, and evolved with bit-parallel adders.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from game_of_life.config import BOUNDARY_FILL
+from game_of_life.engine.board import Board
+from game_of_life.utils.utils import get_players
+from game_of_life.visualization.visualization import stringify_board
+
+WORD_DTYPE = np.uint64
+WORD_BITS = 64
+
+
+def pack_rows(alive: np.ndarray) -> np.ndarray:
+    """
+    Pack a boolean board into rows of 64-bit words.
+    Bit i of word j in a row holds the cell in column 64 * j + i.
+
+    Args:
+        alive: 2D boolean array of alive cells
+
+    Returns:
+        2D array of words with shape (height, ceil(width / 64))
+    """
+
+    height, width = alive.shape
+    num_words = max(1, -(-width // WORD_BITS))
+
+    padded = np.zeros((height, num_words * WORD_BITS), dtype=bool)
+    padded[:, :width] = alive
+
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").astype(WORD_DTYPE, copy=False)
+
+
+def unpack_rows(words: np.ndarray, width: int) -> np.ndarray:
+    """
+    Unpack rows of 64-bit words into a boolean board, inverse of pack_rows.
+
+    Args:
+        words: 2D array of packed words
+        width: width of the unpacked board
+
+    Returns:
+        2D boolean array of alive cells
+    """
+
+    bits = np.unpackbits(words.astype("<u8", copy=False).view(np.uint8), axis=1, bitorder="little")
+    return bits[:, :width].astype(bool)
+
+
+def evolve_words(words: np.ndarray, last_word_mask: np.ndarray) -> np.ndarray:
+    """
+    Evolve packed rows by one generation of the B3/S23 rules.
+    Neighbor counts are summed bit-parallel with full adders, 64 cells per operation.
+
+    Args:
+        words: 2D array of packed words
+        last_word_mask: mask of valid bits in the last word of every row
+
+    Returns:
+        2D array of packed words of the next generation
+    """
+
+    one = WORD_DTYPE(1)
+    carry_shift = WORD_DTYPE(WORD_BITS - 1)
+
+    # west neighbor of bit i is bit i - 1, the carry comes from the top bit of the previous word
+    west = words << one
+    west[:, 1:] |= words[:, :-1] >> carry_shift
+    # east neighbor of bit i is bit i + 1, the carry comes from the bottom bit of the next word
+    east = words >> one
+    east[:, :-1] |= words[:, 1:] << carry_shift
+
+    # two-bit sum of the west and east neighbors (lo + 2 * hi)
+    pair_lo = west ^ east
+    pair_hi = west & east
+
+    # two-bit sum of the three horizontal cells of a row, used for the rows above and below
+    row_lo = pair_lo ^ words
+    row_hi = pair_hi | (pair_lo & words)
+
+    up_lo = np.zeros_like(words)
+    up_hi = np.zeros_like(words)
+    up_lo[1:] = row_lo[:-1]
+    up_hi[1:] = row_hi[:-1]
+
+    down_lo = np.zeros_like(words)
+    down_hi = np.zeros_like(words)
+    down_lo[:-1] = row_lo[1:]
+    down_hi[:-1] = row_hi[1:]
+
+    # full adder of the weight 1 bits
+    bit0 = up_lo ^ down_lo ^ pair_lo
+    carry0 = (up_lo & down_lo) | (pair_lo & (up_lo ^ down_lo))
+
+    # full adder of the weight 2 bits plus the carry, anything of weight 4 or more is never 2 or 3
+    hi_sum = up_hi ^ down_hi ^ pair_hi
+    hi_carry = (up_hi & down_hi) | (pair_hi & (up_hi ^ down_hi))
+    bit1 = hi_sum ^ carry0
+    overflow = hi_carry | (hi_sum & carry0)
+
+    # count == 3, or count == 2 and the cell is alive
+    new_words = bit1 & ~overflow & (bit0 | words)
+    new_words[:, -1] &= last_word_mask
+
+    return new_words
+
+
+class BitBoard:
+    """
+    This class represents a single player Game of Life board packed to one bit per cell.
+    It follows the same B3/S23 rules as Board, and converts to and from Board for the game and GUI.
+    """
+
+    @staticmethod
+    def new(width: int, height: int, player: int = 1) -> BitBoard:
+        """
+        Create an empty bit board with the given width and height.
+
+        Args:
+            width: width of the board
+            height: height of the board
+            player: player index used when converting back to Board
+        """
+
+        return BitBoard(pack_rows(np.zeros((height, width), dtype=bool)), width, player)
+
+    @staticmethod
+    def from_board(board: Board) -> BitBoard:
+        """
+        Pack the given single player board.
+
+        Args:
+            board: board to pack
+
+        Returns:
+            packed bit board
+        """
+
+        if board.boundary != BOUNDARY_FILL:
+            raise ValueError("BitBoard supports only the fill boundary")
+
+        players = get_players(board.data)
+        if len(players) > 1:
+            raise ValueError("BitBoard supports only a single player")
+
+        player = int(players[0]) if len(players) == 1 else 1
+        return BitBoard(pack_rows(board.data != 0), board.width, player)
+
+    def __init__(self, words: np.ndarray, width: int, player: int = 1) -> None:
+        """
+        Initialize the bit board with the given packed words.
+        Should not be used directly, used mainly for inner methods.
+
+        Args:
+            words: 2D array of packed words
+            width: width of the board in cells
+            player: player index used when converting back to Board
+        """
+
+        self.words = words
+        self.height = words.shape[0]
+        self.width = width
+        self.player = player
+
+        valid_bits = width - (words.shape[1] - 1) * WORD_BITS
+        self.last_word_mask = WORD_DTYPE((1 << valid_bits) - 1)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(height={self.height}, width={self.width}, alive={self.count_alive_cells()})"
+
+    def __str__(self) -> str:
+        return stringify_board(self.to_board().data)
+
+    @property
+    def nbytes(self) -> int:
+        """ Number of bytes used by the packed cells. """
+
+        return self.words.nbytes
+
+    def to_board(self) -> Board:
+        """ Unpack the bit board into a regular Board. """
+
+        board = Board.new(width=self.width, height=self.height, players=self.player)
+        board.data[unpack_rows(self.words, self.width)] = self.player
+        return board
+
+    def copy(self) -> BitBoard:
+        """ Returns a copy of the bit board. """
+
+        return BitBoard(self.words.copy(), self.width, self.player)
+
+    def count_alive_cells(self) -> int:
+        """ Counts the number of alive cells on the board. """
+
+        return int(np.bitwise_count(self.words).sum())
+
+    def is_equal(self, other: BitBoard) -> bool:
+        """ Compare two bit boards for equality. """
+
+        if self.height != other.height or self.width != other.width:
+            return False
+
+        return np.array_equal(self.words, other.words)
+
+    def evolve(self) -> BitBoard:
+        """ Evolve the board to the next generation according to the rules of the Game of Life. """
+
+        return BitBoard(evolve_words(self.words, self.last_word_mask), self.width, self.player)
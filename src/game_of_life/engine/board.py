@@ -4,31 +4,308 @@ This module implements the multi-player Game of Life board and related helper fu
 
 from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING
+
 import numpy as np
-from scipy.signal import convolve2d
 
-from game_of_life.config import BOARD_DTYPE, DEFAULT_BOARD_HEIGHT, DEFAULT_BOARD_WIDTH
+from game_of_life.config import (
+    BOUNDARIES,
+    BOUNDARY_FILL,
+    BOUNDARY_WRAP,
+    DEFAULT_BOARD_HEIGHT,
+    DEFAULT_BOARD_WIDTH,
+    DEFAULT_BOUNDARY,
+    DEFAULT_NEIGHBOR_METHOD,
+    DEFAULT_TILE_SIZE,
+    NEIGHBOR_METHOD_CONVOLVE,
+    NEIGHBOR_METHODS,
+)
+from game_of_life.engine.block_table import evolve_blocks
 from game_of_life.engine.pattern import Pattern
-from game_of_life.utils.utils import fill_nonzero, safe_8_neighborhood
+from game_of_life.utils.utils import compact, count_players, fill_nonzero, safe_8_neighborhood, select_dtype
 from game_of_life.visualization.visualization import stringify_board
 
+if TYPE_CHECKING:
+    from game_of_life.engine.rule import Rule
+
+
+BOX_KERNEL = np.ones((3, 3), dtype=np.int32)
+
+# zobrist keys are derived from (row, col, player) packed into 64 bits
+ZOBRIST_ROW_SHIFT = np.uint64(42)
+ZOBRIST_COL_SHIFT = np.uint64(21)
+
+
+def zobrist_keys(rows: np.ndarray, cols: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """
+    Compute the Zobrist keys of cells owned by the given players.
+    The keys are not stored in a table, they are computed on the fly by the splitmix64 finalizer.
+
+    Args:
+        rows: row indices of the cells
+        cols: column indices of the cells
+        players: player indices of the cells
+
+    Returns:
+        uint64 array of the keys
+    """
+
+    x = np.asarray(rows, dtype=np.uint64) << ZOBRIST_ROW_SHIFT
+    x ^= np.asarray(cols, dtype=np.uint64) << ZOBRIST_COL_SHIFT
+    x ^= np.asarray(players, dtype=np.uint64)
+
+    x += np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def zobrist_hash(arr: np.ndarray) -> int:
+    """
+    Compute the Zobrist hash of the board from scratch, i.e. the XOR of the keys of all alive cells.
+
+    Args:
+        arr: 2D numpy array representing the board
+    """
+
+    rows, cols = np.nonzero(arr)
+    return int(np.bitwise_xor.reduce(zobrist_keys(rows, cols, arr[rows, cols])))
+
+
+def zobrist_delta(old: np.ndarray, new: np.ndarray, r0: int = 0, c0: int = 0) -> int:
+    """
+    Compute the XOR which turns the Zobrist hash of the old board into the hash of the new one.
+    Only the changed cells contribute, the old player is removed and the new one added.
 
-NEIGHBOR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+    Args:
+        old: 2D numpy array with the old cells
+        new: 2D numpy array with the new cells
+        r0: row of the board where the arrays start
+        c0: column of the board where the arrays start
+    """
 
+    rows, cols = np.nonzero(old != new)
+    return zobrist_change(rows + r0, cols + c0, old[rows, cols], new[rows, cols])
 
-def count_neighbors(arr: np.ndarray) -> np.ndarray:
+
+def zobrist_change(rows: np.ndarray, cols: np.ndarray, old_players: np.ndarray, new_players: np.ndarray) -> int:
+    """
+    Compute the XOR which changes the given cells from the old players to the new ones in the Zobrist hash.
+
+    Args:
+        rows: row indices of the changed cells
+        cols: column indices of the changed cells
+        old_players: player indices of the cells before the change
+        new_players: player indices of the cells after the change
+    """
+
+    removed = old_players != 0
+    added = new_players != 0
+    keys = np.concatenate([
+        zobrist_keys(rows[removed], cols[removed], old_players[removed]),
+        zobrist_keys(rows[added], cols[added], new_players[added]),
+    ])
+    return int(np.bitwise_xor.reduce(keys))
+
+
+def _fill_line_sum(arr: np.ndarray, out: np.ndarray) -> None:
+    """
+    Sum every cell with its two neighbors along the last axis, cells outside of the array are 0.
+
+    Args:
+        arr: array to sum
+        out: integer array of the same shape to write the sums to
+    """
+
+    np.copyto(out, arr, casting="unsafe")
+    np.add(out[..., 1:], arr[..., :-1], out=out[..., 1:], dtype=out.dtype)
+    np.add(out[..., :-1], arr[..., 1:], out=out[..., :-1], dtype=out.dtype)
+
+
+def _wrap_line_sum(arr: np.ndarray, out: np.ndarray) -> None:
+    """
+    Sum every cell with its two neighbors along the last axis, wrapping around the edges.
+    Edge cells are summed separately, so no padded copy of the array is needed.
+
+    Args:
+        arr: array to sum
+        out: integer array of the same shape to write the sums to
+    """
+
+    n = arr.shape[-1]
+
+    if n < 3:
+        # tiny boards wrap onto the same cells several times
+        indices = np.arange(n)
+        out[...] = sum(np.take(arr, (indices + d) % n, axis=-1).astype(out.dtype) for d in (-1, 0, 1))
+        return
+
+    np.add(arr[..., :-2], arr[..., 1:-1], out=out[..., 1:-1], dtype=out.dtype)
+    np.add(out[..., 1:-1], arr[..., 2:], out=out[..., 1:-1], dtype=out.dtype)
+
+    np.add(arr[..., -1], arr[..., 0], out=out[..., 0], dtype=out.dtype)
+    np.add(out[..., 0], arr[..., 1], out=out[..., 0], dtype=out.dtype)
+
+    np.add(arr[..., -2], arr[..., -1], out=out[..., -1], dtype=out.dtype)
+    np.add(out[..., -1], arr[..., 0], out=out[..., -1], dtype=out.dtype)
+
+
+def box_sum(arr: np.ndarray, boundary: str = BOUNDARY_FILL, out: np.ndarray | None = None, scratch: np.ndarray | None = None) -> np.ndarray:
+    """
+    Sum the 3x3 neighborhood of every cell including the cell itself.
+    The sum is separable, so it is computed as a row pass followed by a column pass over shifted slices.
+    Works on a single board as well as on a batch of boards stacked along the leading axes.
+
+    Args:
+        arr: numpy array with the boards in the last two axes
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        out: optional integer array of the same shape to write the sums to
+        scratch: optional integer array of the same shape used for the row pass
+
+    Returns:
+        numpy array with the 3x3 sums
+    """
+
+    line_sum = _wrap_line_sum if boundary == BOUNDARY_WRAP else _fill_line_sum
+
+    rows = np.empty(arr.shape, dtype=np.int32) if scratch is None else scratch
+    line_sum(arr, rows)
+
+    out = np.empty(arr.shape, dtype=np.int32) if out is None else out
+    line_sum(rows.swapaxes(-1, -2), out.swapaxes(-1, -2))
+    return out
+
+
+def wrap_box_sum(arr: np.ndarray) -> np.ndarray:
+    """
+    Sum the 3x3 neighborhood of every cell including the cell itself on a toroidal board.
+
+    Args:
+        arr: numpy array with the boards in the last two axes
+
+    Returns:
+        numpy array with the 3x3 sums
+    """
+
+    return box_sum(arr, BOUNDARY_WRAP)
+
+
+def transition_counts(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """
+    Count the cells going from every player to every player between two generations by a single bincount.
+    Player 0 stands for dead cells, so the first row holds births and the first column deaths.
+
+    Args:
+        old: numpy array of the previous generation
+        new: numpy array of the next generation of the same shape
+
+    Returns:
+        square matrix with the number of cells going from player (row) to player (column)
+    """
+
+    size = int(max(old.max(initial=0), new.max(initial=0))) + 1
+    # the narrowest codes are the cheapest to build, bincount is fast on any of them
+    dtype = select_dtype(size * size - 1) if size * size <= 1 << 32 else np.int64
+
+    codes = np.multiply(old, size, dtype=dtype, casting="unsafe")
+    np.add(codes, new, out=codes, casting="unsafe")
+    return np.bincount(codes.ravel(), minlength=size * size).reshape(size, size)
+
+
+def pad_square(matrix: np.ndarray, size: int) -> np.ndarray:
+    """
+    Pad a square matrix with zeros to the given size, larger matrices are returned unchanged.
+
+    Args:
+        matrix: square matrix to pad
+        size: minimal size of the result
+    """
+
+    if len(matrix) >= size:
+        return matrix
+
+    return np.pad(matrix, (0, size - len(matrix)))
+
+
+def window_sum(arr: np.ndarray, radius: int, boundary: str = BOUNDARY_FILL) -> np.ndarray:
+    """
+    Sum the (2 * radius + 1)^2 square neighborhood of every cell including the cell itself.
+    Radius 1 is summed by box_sum, larger radii by a summed-area table, so the cost does not grow with the radius.
+
+    Args:
+        arr: numpy array with the boards in the last two axes
+        radius: radius of the square neighborhood
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+
+    Returns:
+        numpy array with the neighborhood sums
+    """
+
+    if radius == 1:
+        return box_sum(arr, boundary)
+
+    size = 2 * radius + 1
+    pad_width = [(0, 0)] * (arr.ndim - 2) + [(radius, radius)] * 2
+    padded = np.pad(arr, pad_width, mode="wrap" if boundary == BOUNDARY_WRAP else "constant")
+
+    # the table has a leading row and column of zeros, so every window is four lookups
+    table = np.zeros(padded.shape[:-2] + (padded.shape[-2] + 1, padded.shape[-1] + 1), dtype=np.int32)
+    np.cumsum(padded, axis=-2, dtype=np.int32, out=table[..., 1:, 1:])
+    np.cumsum(table[..., 1:, 1:], axis=-1, out=table[..., 1:, 1:])
+
+    return table[..., size:, size:] - table[..., :-size, size:] - table[..., size:, :-size] + table[..., :-size, :-size]
+
+
+def neighborhood_sum(arr: np.ndarray, boundary: str = BOUNDARY_FILL, method: str = DEFAULT_NEIGHBOR_METHOD, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Sum the 3x3 neighborhood of every cell including the cell itself with the selected method.
+    The "slices" method needs only numpy, "convolve" imports scipy on first use and handles single boards only,
+    batches of boards are always summed by slices.
+
+    Args:
+        arr: 2D numpy array representing the board, or a batch of boards stacked along the first axis
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        method: "slices" or "convolve"
+        out: optional integer array of the same shape to write the sums to
+
+    Returns:
+        numpy array with the 3x3 sums
+    """
+
+    if method not in NEIGHBOR_METHODS:
+        raise ValueError(f"Unknown neighbor method {method}, expected one of {NEIGHBOR_METHODS}")
+
+    if method == NEIGHBOR_METHOD_CONVOLVE and arr.ndim == 2:
+        from scipy.signal import convolve2d
+
+        sums = convolve2d(arr, BOX_KERNEL, mode="same", boundary=boundary)
+        if out is None:
+            return sums
+        np.copyto(out, sums, casting="unsafe")
+        return out
+
+    return box_sum(arr, boundary, out=out)
+
+
+def count_neighbors(arr: np.ndarray, boundary: str = BOUNDARY_FILL, method: str = DEFAULT_NEIGHBOR_METHOD, out: np.ndarray | None = None) -> np.ndarray:
     """
     Compute 8 neighborhood matrix for the given board.
     This function considers all players as equal, i.e. all players contribute to the count with 1.
 
     Args:
-        arr: 2D numpy array representing the board
+        arr: 2D numpy array representing the board, or a batch of boards stacked along the first axis
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        method: "slices" or "convolve", see neighborhood_sum
+        out: optional integer array of the same shape to write the counts to
 
     Returns:
-        2D numpy array representing the 8 neighborhood matrix
+        numpy array representing the 8 neighborhood matrix
     """
 
-    return convolve2d(arr, NEIGHBOR_KERNEL, mode="same", boundary="fill", fillvalue=0)
+    counts = neighborhood_sum(arr, boundary, method, out)
+    np.subtract(counts, arr, out=counts, casting="unsafe")
+    return counts
 
 
 def get_majority_player(arr: np.ndarray) -> int:
@@ -60,34 +337,277 @@ def get_majority_player(arr: np.ndarray) -> int:
     return sorted_counts[0]
 
 
+def count_player_neighbors(arr: np.ndarray, player: int, boundary: str = BOUNDARY_FILL, method: str = DEFAULT_NEIGHBOR_METHOD) -> np.ndarray:
+    """
+    Count cells of the given player in the 3x3 neighborhood of every cell, including the cell itself.
+    This is the array counterpart of counting the player in safe_8_neighborhood for each cell.
+
+    Args:
+        arr: 2D numpy array representing the board, or a batch of boards stacked along the first axis
+        player: index of the player to count
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        method: "slices" or "convolve", see neighborhood_sum
+
+    Returns:
+        numpy array with the per-cell counts of the player
+    """
+
+    return neighborhood_sum(arr == player, boundary, method)
+
+
+def resolve_majority(
+    arr: np.ndarray,
+    mask: np.ndarray,
+    boundary: str = BOUNDARY_FILL,
+    method: str = DEFAULT_NEIGHBOR_METHOD,
+    radius: int = 1,
+) -> np.ndarray:
+    """
+    Assign the majority player of the 3x3 neighborhood to every cell selected by the mask.
+    The neighborhood counts are built as one plane per player, ties are resolved to 0 (mutual annihilation).
+
+    Args:
+        arr: 2D numpy array representing the board, or a batch of boards stacked along the first axis
+        mask: boolean array of cells which should be alive in the next generation
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        method: "slices" or "convolve", see neighborhood_sum
+        radius: radius of the square neighborhood the majority is taken from, see window_sum
+
+    Returns:
+        numpy array with the majority player in the masked cells and 0 elsewhere
+    """
+
+    players = count_players(arr)
+
+    # with a single player there is nothing to resolve
+    if len(players) <= 1:
+        winner = players[0] if len(players) == 1 else 0
+        return np.where(mask, winner, 0).astype(arr.dtype)
+
+    best_player = np.zeros(arr.shape, dtype=arr.dtype)
+    best_count = np.zeros(arr.shape, dtype=np.int32)
+    tie = np.zeros(arr.shape, dtype=bool)
+
+    for player in players:
+        if radius == 1:
+            counts = count_player_neighbors(arr, player, boundary, method)
+        else:
+            counts = window_sum(arr == player, radius, boundary)
+
+        greater = counts > best_count
+        equal = (counts == best_count) & (counts > 0)
+
+        best_player[greater] = player
+        tie = (tie | equal) & ~greater
+        np.maximum(best_count, counts, out=best_count)
+
+    return np.where(mask & ~tie, best_player, 0).astype(arr.dtype)
+
+
+def evolve_per_cell(arr: np.ndarray) -> np.ndarray:
+    """
+    Evolve the board data to the next generation by resolving every candidate cell separately.
+    This is the original reference implementation, kept to verify and benchmark the vectorized kernel.
+
+    Args:
+        arr: 2D numpy array representing the board
+
+    Returns:
+        2D numpy array representing the next generation
+    """
+
+    new_data = np.zeros_like(arr)
+
+    neighbor_counts = count_neighbors(fill_nonzero(arr, fill_value=1))
+    cells_to_check = np.where((neighbor_counts == 3) | ((arr != 0) & (neighbor_counts == 2)))
+
+    for r, c in zip(*cells_to_check):
+        new_data[r, c] = get_majority_player(safe_8_neighborhood(arr, r, c))
+
+    return new_data
+
+
+def evolve_vectorized(arr: np.ndarray, boundary: str = BOUNDARY_FILL, method: str = DEFAULT_NEIGHBOR_METHOD) -> np.ndarray:
+    """
+    Evolve the board data to the next generation using whole-array operations only.
+    Returns exactly the same result as evolve_per_cell.
+
+    Args:
+        arr: 2D numpy array representing the board, or a batch of boards stacked along the first axis
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        method: "slices" or "convolve", see neighborhood_sum
+
+    Returns:
+        numpy array representing the next generation
+    """
+
+    alive = arr != 0
+    neighbor_counts = count_neighbors(alive, boundary, method)
+    survives = (neighbor_counts == 3) | (alive & (neighbor_counts == 2))
+
+    return resolve_majority(arr, survives, boundary, method)
+
+
+class EvolveWorkspace:
+    """
+    Preallocated buffers for evolving a board of a fixed shape many times.
+    The two data buffers are swapped between generations, the scratch arrays are reused.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype) -> None:
+        """
+        Allocate all buffers for the given board shape.
+
+        Args:
+            shape: shape of the board
+            dtype: dtype of the board
+        """
+
+        self.current = np.zeros(shape, dtype=dtype)
+        self.next = np.zeros(shape, dtype=dtype)
+
+        self.alive = np.empty(shape, dtype=bool)
+        self.survives = np.empty(shape, dtype=bool)
+        self.flags = np.empty(shape, dtype=bool)
+        self.rows = np.empty(shape, dtype=np.int32)
+        self.counts = np.empty(shape, dtype=np.int32)
+
+        self.best_player = np.empty(shape, dtype=dtype)
+        self.best_count = np.empty(shape, dtype=np.int32)
+        self.greater = np.empty(shape, dtype=bool)
+        self.tie = np.empty(shape, dtype=bool)
+
+    def swap(self) -> None:
+        """ Make the next generation the current one. """
+
+        self.current, self.next = self.next, self.current
+
+
+def evolve_into(workspace: EvolveWorkspace, players: np.ndarray, boundary: str = BOUNDARY_FILL) -> None:
+    """
+    Evolve workspace.current into workspace.next without allocating any array.
+    The rules are the same as in evolve_vectorized, written as in-place ufunc calls.
+
+    Args:
+        workspace: preallocated buffers, the result is written to workspace.next
+        players: indices of all players which can appear on the board
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+    """
+
+    ws = workspace
+
+    # neighbor counts of all players together
+    np.not_equal(ws.current, 0, out=ws.alive)
+    box_sum(ws.alive, boundary, out=ws.counts, scratch=ws.rows)
+    np.subtract(ws.counts, ws.alive, out=ws.counts, dtype=np.int32)
+
+    # (neighbors == 3) | (alive & (neighbors == 2))
+    np.equal(ws.counts, 3, out=ws.survives)
+    np.equal(ws.counts, 2, out=ws.flags)
+    np.logical_and(ws.flags, ws.alive, out=ws.flags)
+    np.logical_or(ws.survives, ws.flags, out=ws.survives)
+
+    if len(players) <= 1:
+        winner = players[0] if len(players) == 1 else 0
+        np.multiply(ws.survives, winner, out=ws.next, casting="unsafe")
+        return
+
+    ws.best_player.fill(0)
+    ws.best_count.fill(0)
+    ws.tie.fill(False)
+
+    for player in players:
+        np.equal(ws.current, player, out=ws.flags)
+        box_sum(ws.flags, boundary, out=ws.counts, scratch=ws.rows)
+
+        # tie = (tie | (counts == best_count) & (counts > 0)) & ~(counts > best_count)
+        np.greater(ws.counts, ws.best_count, out=ws.greater)
+        np.equal(ws.counts, ws.best_count, out=ws.flags)
+        np.logical_and(ws.flags, ws.counts, out=ws.flags, casting="unsafe")
+        np.logical_or(ws.tie, ws.flags, out=ws.tie)
+        np.logical_not(ws.greater, out=ws.flags)
+        np.logical_and(ws.tie, ws.flags, out=ws.tie)
+
+        np.copyto(ws.best_player, player, where=ws.greater, casting="unsafe")
+        np.maximum(ws.best_count, ws.counts, out=ws.best_count)
+
+    np.logical_not(ws.tie, out=ws.flags)
+    np.logical_and(ws.survives, ws.flags, out=ws.survives)
+    np.multiply(ws.best_player, ws.survives, out=ws.next, casting="unsafe")
+
+
 class Board:
     """
     This class represents the multi-player Game of Life board.
     """
 
     @staticmethod
-    def new(width: int = DEFAULT_BOARD_WIDTH, height: int = DEFAULT_BOARD_HEIGHT) -> Board:
+    def new(width: int = DEFAULT_BOARD_WIDTH, height: int = DEFAULT_BOARD_HEIGHT, boundary: str = DEFAULT_BOUNDARY, players: int = 1) -> Board:
         """
         Create an empty board with the given width and height.
+        The dtype of the board is the narrowest one which fits the number of players.
 
         Args:
             width: width of the board
             height: height of the board
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+            players: number of players which will be placed on the board
         """
 
-        return Board(np.zeros((height, width), dtype=BOARD_DTYPE))
+        return Board(np.zeros((height, width), dtype=select_dtype(players)), boundary=boundary)
 
-    def __init__(self, data: np.ndarray) -> None:
+    @staticmethod
+    def from_array(data: np.ndarray, boundary: str = DEFAULT_BOUNDARY) -> Board:
+        """
+        Create a board from an array of player indices, converted to the narrowest dtype.
+
+        Args:
+            data: 2D numpy array representing the board
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        """
+
+        return Board(compact(data), boundary=boundary)
+
+    def __init__(self, data: np.ndarray, boundary: str = DEFAULT_BOUNDARY) -> None:
         """
         Initialize the board with the given data and save the shape.
         Should not be used directly, used mainly for inner methods.
 
         Args:
             data: 2D numpy array representing the board
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
         """
 
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Unknown boundary {boundary}, expected one of {BOUNDARIES}")
+
         self.height, self.width = data.shape
         self.data = data
+        self.boundary = boundary
+
+        # tiles which changed in the last generation, None when unknown (e.g. after manual edits)
+        self.tile_size = None
+        self.changed_tiles = None
+
+        # generations left to decay for dying cells of Generations rules, None for two state rules
+        self.ages = None
+
+        # Zobrist hash of the cells, computed on first use and then updated incrementally
+        self._zobrist = None
+        # cells, hash and counts of the board this one evolved from, the hash and the transitions are derived from them on first use
+        self._parent = None
+        self._parent_zobrist = None
+        self._parent_counts = None
+        # flat indices of the cells which differ from the parent and their players on the parent, computed once
+        self._changes = None
+        self._parent_values = None
+        # whether the cells are the parent of another board, they are copied before being modified in place
+        self._shared = False
+
+        # number of cells of every player (index 0 are the dead cells), computed on first use
+        self._counts = None
+        # cells going from player to player since the board this one evolved from, computed on first use
+        self._transitions = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(height={self.height}, width={self.width}, alive={self.count_alive_cells()})"
@@ -98,12 +618,146 @@ class Board:
     def clear(self) -> None:
         """ Clears the board by setting all cells to 0. """
 
-        self.data = np.zeros((self.height, self.width), dtype=BOARD_DTYPE)
+        self.data = np.zeros((self.height, self.width), dtype=self.data.dtype)
+        self._forget_parent()
+        self.changed_tiles = None
+        self.ages = None
+        self._zobrist = 0
+        self._counts = np.array([self.data.size])
 
     def copy(self) -> Board:
         """ Returns a copy of the board. """
 
-        return Board(self.data.copy())
+        board = Board(self.data.copy(), self.boundary)
+        board.tile_size = self.tile_size
+        board.changed_tiles = self.changed_tiles
+        board.ages = None if self.ages is None else self.ages.copy()
+        board._zobrist = self._zobrist
+        board._counts = self._counts
+        board._transitions = self._transitions
+        return board
+
+    @staticmethod
+    def load(path: str, boundary: str = DEFAULT_BOUNDARY) -> Board:
+        """
+        Load a board saved by Board.save.
+
+        Args:
+            path: path to the .npy file
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+        """
+
+        return Board.from_array(np.load(path), boundary=boundary)
+
+    def save(self, path: str) -> None:
+        """
+        Save the cells of the board to an .npy file, the caches and the boundary are not stored.
+
+        Args:
+            path: path to the .npy file
+        """
+
+        np.save(path, self.data)
+
+    def successor(self, data: np.ndarray) -> Board:
+        """
+        Create the board of the next generation with the given data.
+        The new board keeps the cells, the hash and the counts of this board, so its own hash
+        and transitions are derived from the changed cells only once they are needed.
+
+        Args:
+            data: 2D numpy array of the next generation
+        """
+
+        board = Board(data, self.boundary)
+        board._parent = self.data
+        board._parent_zobrist = self._zobrist
+        board._parent_counts = self._counts
+        self._shared = True
+        return board
+
+    @property
+    def zobrist(self) -> int:
+        """ Zobrist hash of the cells keyed by (row, col, player), equal boards have equal hashes. """
+
+        if self._zobrist is None:
+            if self._parent_zobrist is not None:
+                changes, old = self._parent_cells()
+                rows, cols = np.divmod(changes, self.width)
+                self._zobrist = self._parent_zobrist ^ zobrist_change(rows, cols, old, self.data.ravel()[changes])
+            else:
+                self._zobrist = zobrist_hash(self.data)
+
+        return self._zobrist
+
+    def _changed_cells(self) -> np.ndarray:
+        """ Flat indices of the cells which differ from the parent, only the changed tiles are compared if they are known. """
+
+        if self._changes is None:
+            if self.changed_tiles is None:
+                self._changes = np.flatnonzero(self._parent != self.data)
+            else:
+                size = self.tile_size
+                changes = [np.empty(0, dtype=np.intp)]
+                for tr, tc in zip(*np.nonzero(self.changed_tiles)):
+                    r0, c0 = tr * size, tc * size
+                    rows, cols = np.nonzero(self._parent[r0:r0 + size, c0:c0 + size] != self.data[r0:r0 + size, c0:c0 + size])
+                    changes.append((rows + r0) * self.width + cols + c0)
+                self._changes = np.concatenate(changes)
+
+        return self._changes
+
+    def _parent_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """ Flat indices of the cells which differ from the parent and their players on the parent. """
+
+        if self._parent_values is None:
+            self._parent_values = self._parent.ravel()[self._changed_cells()]
+
+        return self._changes, self._parent_values
+
+    def _has_parent(self) -> bool:
+        """ Whether the board evolved from another one and the changed cells are known or can be found. """
+
+        return self._parent is not None or self._parent_values is not None
+
+    def _take_parent(self) -> np.ndarray | None:
+        """
+        Take over the cells of the parent to be overwritten, if nothing but this board references them.
+        The changed cells are kept, so the hash and the transitions can still be derived without the parent.
+        """
+
+        parent = self._parent
+        # like ndarray.resize, the references are counted: this board, the local name and the argument of getrefcount
+        if parent is None or parent.base is not None or sys.getrefcount(parent) > 3:
+            return None
+
+        self._parent_cells()
+        self._parent = None
+        return parent
+
+    def _forget_parent(self) -> None:
+        """ Drop the parent and the transitions from it, the cells are about to change. """
+
+        self._parent = None
+        self._parent_zobrist = None
+        self._parent_counts = None
+        self._changes = None
+        self._parent_values = None
+        self._transitions = None
+
+    def _own_data(self) -> None:
+        """ Copy the cells before they are modified in place if another board evolved from them. """
+
+        if self._shared:
+            self.data = self.data.copy()
+            self._shared = False
+
+    def _fit_player(self, player: int) -> None:
+        """ Widen the dtype of the board if the player index does not fit into it. """
+
+        if player > np.iinfo(self.data.dtype).max:
+            self.data = self.data.astype(select_dtype(player))
+            self._shared = False
 
     def toggle_cell(self, r: int, c: int, value: int = 1) -> None:
         """
@@ -116,15 +770,104 @@ class Board:
             value: value to set the cell to (i.e. player index)
         """
 
-        if self.data[r, c] == 0:
+        self._fit_player(value)
+        self._own_data()
+        self._forget_parent()
+        old = self.data[r, c]
+        if old == 0:
             self.data[r, c] = value
         else:
             self.data[r, c] = 0
 
+        if self._zobrist is not None:
+            self._zobrist ^= zobrist_delta(np.array([[old]]), self.data[r:r + 1, c:c + 1], r, c)
+
+        self.changed_tiles = None
+        if self.ages is not None:
+            self.ages[r, c] = 0
+
+        if self._counts is not None:
+            new = self.data[r, c]
+            self._counts = np.pad(self._counts, (0, max(0, int(new) + 1 - len(self._counts))))
+            self._counts[old] -= 1
+            self._counts[new] += 1
+
+    @property
+    def transitions(self) -> np.ndarray | None:
+        """
+        Cells going from player (row) to player (column) since the board this one evolved from, None if it did not evolve.
+        Only the changed cells are counted, the cells which kept their player are taken from the counts of the parent.
+        """
+
+        if self._transitions is None and self._has_parent():
+            changes, old = self._parent_cells()
+            moved = transition_counts(old, self.data.ravel()[changes])
+
+            parent_counts = self._parent_counts
+            if parent_counts is None and self._parent is not None:
+                parent_counts = np.bincount(self._parent.ravel())
+            elif parent_counts is None:
+                # the parent was overwritten, its counts are the own counts with the changed cells moved back
+                size = max(len(moved), int(self.data.max()) + 1)
+                parent_counts = np.bincount(self.data.ravel(), minlength=size)
+                parent_counts[:len(moved)] += moved.sum(axis=1) - moved.sum(axis=0)
+
+            transitions = pad_square(np.diag(parent_counts), len(moved))
+            transitions[np.diag_indices_from(moved)] -= moved.sum(axis=1)
+            transitions[:len(moved), :len(moved)] += moved
+            self._transitions = transitions
+
+        return self._transitions
+
+    @transitions.setter
+    def transitions(self, transitions: np.ndarray | None) -> None:
+        self._transitions = transitions
+
+    def player_counts(self) -> np.ndarray:
+        """ Counts the cells of every player, index 0 holds the number of dead cells. """
+
+        if self._counts is None:
+            # the transitions keep a slot for every player of the parent, even for the ones which died out
+            if self.transitions is not None:
+                self._counts = self.transitions.sum(axis=0)
+            else:
+                self._counts = np.bincount(self.data.ravel())
+
+        return self._counts
+
     def count_alive_cells(self) -> int:
         """ Counts the number of alive cells on the board. """
 
-        return np.sum(self.data != 0)
+        if self._counts is None:
+            return int(np.count_nonzero(self.data))
+
+        return int(self.data.size - self._counts[0])
+
+    def births(self) -> np.ndarray | None:
+        """
+        Number of cells born for every player since the board this one evolved from, None if the board did not evolve.
+        After evolve_n these are the net changes over all the generations, not the births of the last one.
+        """
+
+        if self.transitions is None:
+            return None
+
+        births = self.transitions[0].copy()
+        births[0] = 0
+        return births
+
+    def deaths(self) -> np.ndarray | None:
+        """
+        Number of cells of every player which died since the board this one evolved from, None if the board did not evolve.
+        After evolve_n these are the net changes over all the generations, not the deaths of the last one.
+        """
+
+        if self.transitions is None:
+            return None
+
+        deaths = self.transitions[:, 0].copy()
+        deaths[0] = 0
+        return deaths
 
     def is_equal(self, other: Board) -> bool:
         """ Compare two boards for equality. """
@@ -132,6 +875,17 @@ class Board:
         if self.height != other.height or self.width != other.width:
             return False
 
+        # different hashes always mean different cells
+        if self._zobrist is not None and other._zobrist is not None and self._zobrist != other._zobrist:
+            return False
+
+        # dying cells are dead, but they still make the boards different
+        if self.ages is not None or other.ages is not None:
+            ages = np.zeros(self.data.shape, dtype=np.uint8) if self.ages is None else self.ages
+            other_ages = np.zeros(other.data.shape, dtype=np.uint8) if other.ages is None else other.ages
+            if not np.array_equal(ages, other_ages):
+                return False
+
         return np.all(self.data == other.data)
 
     def resize(self, height: int, width: int) -> None:
@@ -148,7 +902,7 @@ class Board:
         old_height, old_width = self.height, self.width
         new_height, new_width = height, width
 
-        new_data = np.zeros((new_height, new_width), dtype=BOARD_DTYPE)
+        new_data = np.zeros((new_height, new_width), dtype=self.data.dtype)
 
         dh = abs(old_height - new_height) // 2
         dw = abs(old_width - new_width) // 2
@@ -163,7 +917,12 @@ class Board:
             new_data[dh:dh + old_height, dw:dw + old_width] = self.data
 
         self.data = new_data
+        self._forget_parent()
         self.height, self.width = new_height, new_width
+        self.changed_tiles = None
+        self.ages = None
+        self._zobrist = None
+        self._counts = None
 
     def can_place_pattern(self, pattern: Pattern, x0: int, y0: int, player: int = 1) -> bool:
         """
@@ -200,17 +959,37 @@ class Board:
         """
 
         pattern = pattern.assign_to_player(player)
+        self._fit_player(player)
+        self._own_data()
+        self._forget_parent()
 
         dy, dx = pattern.height, pattern.width
         # only place the alive cells, do not overwrite existing ones with dead cells
         alive_mask = pattern.data != 0
-        self.data[y0:y0 + dy, x0:x0 + dx][alive_mask] = pattern.data[alive_mask]
+        placement = self.data[y0:y0 + dy, x0:x0 + dx]
+        old = placement.copy()
+        placement[alive_mask] = pattern.data[alive_mask]
+
+        if self._zobrist is not None:
+            self._zobrist ^= zobrist_delta(old, placement, y0, x0)
 
-    def evolve(self) -> Board:
+        self._counts = None
+        self.changed_tiles = None
+        if self.ages is not None:
+            self.ages[y0:y0 + dy, x0:x0 + dx][alive_mask] = 0
+
+    def evolve(self, method: str = DEFAULT_NEIGHBOR_METHOD, rule: Rule | None = None) -> Board:
         """
         Evolve the board to the next generation according to the extended rules of the Game of Life.
+
+        Args:
+            method: how the neighbors are counted, "slices" or "convolve", see neighborhood_sum
+            rule: rule to evolve by instead of B3/S23, see Rule.evolve
         """
 
+        if rule is not None and not rule.is_conway():
+            return rule.evolve(self)
+
         # (1) any live cell with fewer than two live neighbours dies
         # (2) any live cell with two or three live neighbours lives on to the next generation
         # (3) any live cell with more than three live neighbours dies
@@ -218,15 +997,100 @@ class Board:
         # (5) when there are multiple players and cell should become alive, it becomes alive as the majority player
         # (6) in case of a tie, the cell dies (mutual annihilation)
 
-        new_data = np.zeros_like(self.data)
+        return self.successor(evolve_vectorized(self.data, self.boundary, method))
 
-        neighbor_counts = count_neighbors(fill_nonzero(self.data, fill_value=1))
-        cells_to_check = np.where((neighbor_counts == 3) | ((self.data != 0) & (neighbor_counts == 2)))
+    def evolve_blocks(self) -> Board:
+        """
+        Evolve a single player board to the next generation using the 4x4 to 2x2 block lookup table.
+        Returns the same board as evolve, see block_table.evolve_blocks.
+        """
 
-        for r, c in zip(*cells_to_check):
-            new_data[r, c] = get_majority_player(safe_8_neighborhood(self.data, r, c))
+        players = count_players(self.data)
+        if len(players) > 1:
+            raise ValueError("Block lookup table evolution supports only a single player")
 
-        return Board(new_data)
+        player = players[0] if len(players) == 1 else 1
+        new_data = evolve_blocks(self.data != 0, self.boundary).astype(self.data.dtype) * self.data.dtype.type(player)
+        return self.successor(new_data)
+
+    def evolve_n(self, generations: int) -> Board:
+        """
+        Evolve the board by the given number of generations and return only the final board.
+        All buffers are allocated once, there are no allocations per generation.
+
+        Args:
+            generations: number of generations to evolve
+        """
+
+        workspace = EvolveWorkspace(self.data.shape, self.data.dtype)
+        workspace.current[...] = self.data
+
+        # players can only disappear during the game, never appear
+        players = count_players(self.data)
+
+        for _ in range(generations):
+            evolve_into(workspace, players, self.boundary)
+            workspace.swap()
+
+        return self.successor(workspace.current)
+
+    def evolve_tiled(self, tile_size: int = DEFAULT_TILE_SIZE) -> Board:
+        """
+        Evolve the board to the next generation, recomputing only the tiles which can change.
+        A tile can change only if it or one of its neighboring tiles changed in the last generation,
+        all other tiles are carried over. The changed tiles are remembered on the returned board.
+
+        The cells of the previous generation are overwritten instead of copying the whole board
+        if nothing else references them, so only the changed tiles are written.
+
+        Args:
+            tile_size: side of the square tiles the board is split into
+        """
+
+        tile_rows = -(-self.height // tile_size)
+        tile_cols = -(-self.width // tile_size)
+
+        if self.changed_tiles is None or self.tile_size != tile_size:
+            active = np.ones((tile_rows, tile_cols), dtype=bool)
+            new_data = self.data.copy()
+        else:
+            active = box_sum(self.changed_tiles, self.boundary) > 0
+            new_data = self._take_parent()
+
+            if new_data is None:
+                new_data = self.data.copy()
+            else:
+                # the previous generation differs from this one only in the tiles which changed since
+                for tr, tc in zip(*np.nonzero(self.changed_tiles)):
+                    tile = np.s_[tr * tile_size:(tr + 1) * tile_size, tc * tile_size:(tc + 1) * tile_size]
+                    new_data[tile] = self.data[tile]
+
+        changed = np.zeros((tile_rows, tile_cols), dtype=bool)
+
+        for tr, tc in zip(*np.nonzero(active)):
+            r0, r1 = tr * tile_size, min(self.height, (tr + 1) * tile_size)
+            c0, c1 = tc * tile_size, min(self.width, (tc + 1) * tile_size)
+
+            # evolve the tile with a one cell halo, the halo itself is discarded
+            if self.boundary == BOUNDARY_WRAP:
+                rows = np.arange(r0 - 1, r1 + 1) % self.height
+                cols = np.arange(c0 - 1, c1 + 1) % self.width
+                tile = evolve_vectorized(self.data[np.ix_(rows, cols)])[1:-1, 1:-1]
+            else:
+                hr0, hc0 = max(0, r0 - 1), max(0, c0 - 1)
+                halo = evolve_vectorized(self.data[hr0:min(self.height, r1 + 1), hc0:min(self.width, c1 + 1)])
+                tile = halo[r0 - hr0:r1 - hr0, c0 - hc0:c1 - hc0]
+
+            old_tile = self.data[r0:r1, c0:c1]
+            if not np.array_equal(tile, old_tile):
+                new_data[r0:r1, c0:c1] = tile
+                changed[tr, tc] = True
+
+        # the hash and the transitions of the new board compare only the changed tiles once they are needed
+        board = self.successor(new_data)
+        board.tile_size = tile_size
+        board.changed_tiles = changed
+        return board
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""
+This module implements batched evolution of many Game of Life boards at once.
+All boards of an ensemble share a shape and are stored as a single 3D array.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from game_of_life.config import DEFAULT_BOUNDARY
+from game_of_life.engine.board import Board, evolve_vectorized
+
+
+class Ensemble:
+    """
+    Class holding a batch of boards which are evolved together by a single vectorized step.
+    A board is finished once it is extinct or equal to its previous generation, like in Game.can_go_next,
+    finished boards are not evolved anymore.
+    """
+
+    @staticmethod
+    def from_boards(boards: list[Board]) -> Ensemble:
+        """
+        Create an ensemble from boards of the same shape and boundary.
+
+        Args:
+            boards: boards to evolve together
+        """
+
+        boundaries = {board.boundary for board in boards}
+        if len(boundaries) != 1:
+            raise ValueError("All boards of an ensemble must have the same boundary")
+
+        return Ensemble(np.stack([board.data for board in boards]), boundary=boundaries.pop())
+
+    def __init__(self, data: np.ndarray, boundary: str = DEFAULT_BOUNDARY) -> None:
+        """
+        Initialize the ensemble with the given boards.
+
+        Args:
+            data: 3D numpy array with the boards stacked along the first axis
+            boundary: boundary of all boards
+        """
+
+        self.data = data
+        self.boundary = boundary
+        self.size, self.height, self.width = data.shape
+
+        self.alive_counts = np.count_nonzero(data, axis=(1, 2))
+        self.finished = self.alive_counts == 0
+        self.generations = np.zeros(self.size, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size}, height={self.height}, width={self.width}, finished={int(self.finished.sum())})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def board(self, index: int) -> Board:
+        """
+        Get a copy of a single board of the ensemble.
+
+        Args:
+            index: index of the board
+        """
+
+        return Board(self.data[index].copy(), self.boundary)
+
+    def boards(self) -> list[Board]:
+        """ Get copies of all boards of the ensemble. """
+
+        return [self.board(index) for index in range(self.size)]
+
+    def step(self) -> bool:
+        """
+        Evolve all boards which are not finished by one generation.
+
+        Returns:
+            True if any board was evolved, False if all boards are finished
+        """
+
+        active = np.flatnonzero(~self.finished)
+        if len(active) == 0:
+            return False
+
+        old = self.data[active]
+        new = evolve_vectorized(old, self.boundary)
+
+        self.data[active] = new
+        self.generations[active] += 1
+        self.alive_counts[active] = np.count_nonzero(new, axis=(1, 2))
+
+        unchanged = np.all(new == old, axis=(1, 2))
+        self.finished[active] = (self.alive_counts[active] == 0) | unchanged
+
+        return True
+
+    def run(self, steps: int) -> int:
+        """
+        Evolve the ensemble for the given number of steps or until all boards are finished.
+
+        Args:
+            steps: maximal number of steps
+
+        Returns:
+            number of steps which were run
+        """
+
+        for i in range(steps):
+            if not self.step():
+                return i
+
+        return steps
@@ -1,7 +1,25 @@
 """ Module handling parameters and board for the Game of Life """
 
-from game_of_life.config import DEFAULT_FREQUENCY, DEFAULT_STEPS
+import numpy as np
+
+from game_of_life.config import (
+    BOUNDARY_WRAP,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_FREQUENCY,
+    DEFAULT_HASHLIFE_CACHE_SIZE,
+    DEFAULT_HISTORY_KEYFRAME_INTERVAL,
+    DEFAULT_HISTORY_MEMORY_BUDGET,
+    DEFAULT_RULE,
+    DEFAULT_STEPS,
+    JUMP_HASHLIFE,
+    JUMP_STEPS,
+)
 from game_of_life.engine.board import Board
+from game_of_life.engine.hashlife import HashLife
+from game_of_life.engine.history import History
+from game_of_life.engine.parallel import ParallelEvolver
+from game_of_life.engine.rule import Rule
+from game_of_life.engine.statistics import StatisticsCollector
 
 
 class Game:
@@ -10,7 +28,21 @@ class Game:
     Separation of next/previous step logic and running logic.
     """
 
-    def __init__(self, board: Board, frequency: int = DEFAULT_FREQUENCY, steps: int = DEFAULT_STEPS) -> None:
+    def __init__(
+        self,
+        board: Board,
+        frequency: int = DEFAULT_FREQUENCY,
+        steps: int = DEFAULT_STEPS,
+        hashlife_cache_size: int = DEFAULT_HASHLIFE_CACHE_SIZE,
+        tile_size: int | None = None,
+        rule: str | Rule = DEFAULT_RULE,
+        detect_cycles: bool = False,
+        stop_on_cycle: bool = False,
+        history_keyframe_interval: int = DEFAULT_HISTORY_KEYFRAME_INTERVAL,
+        history_memory_budget: int | None = DEFAULT_HISTORY_MEMORY_BUDGET,
+        checkpoint_interval: int | None = DEFAULT_CHECKPOINT_INTERVAL,
+        statistics: StatisticsCollector | None = None,
+    ) -> None:
         """
         Initialize the Game of Life with the given board and parameters.
 
@@ -18,22 +50,57 @@ class Game:
             board: board to use for the Game of Life
             frequency: frequency of the game
             steps: number of steps to run
+            hashlife_cache_size: cache size of the HashLife engine used by jump
+            tile_size: if set, evolve only the active tiles of this size (see Board.evolve_tiled)
+            rule: rule or rulestring the board evolves by, see Rule.parse
+            detect_cycles: if set, the generations are indexed by their hash to find the first one the board repeats,
+                see transient and period, without it no cycles are detected and no hashes are computed
+            stop_on_cycle: if set, run_step stops once the board repeats an earlier generation, implies detect_cycles
+            history_keyframe_interval: number of history entries between two full boards, see History
+            history_memory_budget: maximal number of bytes used by the history, None for no limit
+            checkpoint_interval: generations between two checkpoints used by seek, a smaller interval makes
+                seeking faster at the cost of one stored board per interval, None to keep only the original board,
+                then the game goes back only through the history
+            statistics: collector recording every generation reached by next_step and run_step
         """
 
         self.board = board
         self.original_board = board.copy()
-        self.boards = []
+        self.history = History(history_keyframe_interval, history_memory_budget)
 
         self.frequency = frequency
         self.time_delay = 1 / frequency
         self.steps = steps
         self.i = 0
 
+        self.hashlife_cache_size = hashlife_cache_size
+        self.hashlife = None
+        # board of the generation the universe of an unbounded jump holds, the next unbounded jump continues from it
+        self._hashlife_board = None
+
+        self.rule = Rule.parse(rule) if isinstance(rule, str) else rule
+        if tile_size is not None and not self.rule.is_conway():
+            raise ValueError("Tiled evolution supports only the B3/S23 rule")
+
+        self.tile_size = tile_size
+
+        if checkpoint_interval is not None and checkpoint_interval < 1:
+            raise ValueError(f"Checkpoint interval must be at least 1, got {checkpoint_interval}")
+
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = {0: self.original_board}
+
+        self.statistics = statistics
+
+        self.detect_cycles = detect_cycles or stop_on_cycle
+        self.stop_on_cycle = stop_on_cycle
+        self._reset_cycle_detection()
+
     def __repr__(self) -> str:
         return str(self)
 
     def __str__(self) -> str:
-        return f"Game(board=({self.board.width}, {self.board.height}), frequency={self.frequency}, time_delay={self.time_delay})"
+        return f"Game(board=({self.board.width}, {self.board.height}), rule={self.rule}, frequency={self.frequency}, time_delay={self.time_delay})"
 
     def set_frequency(self, frequency: int) -> None:
         """
@@ -60,37 +127,163 @@ class Game:
         """ Restart the game, i.e. reset the board and step counter to the original state. """
 
         self.board = self.original_board.copy()
-        self.boards = []
+        self.history.clear()
         self.i = 0
+        self.checkpoints = {0: self.original_board}
+        self._reset_cycle_detection()
+
+    def _reset_cycle_detection(self) -> None:
+        """
+        Forget all indexed generations and index the current board as the first one.
+        Generations are indexed by the Zobrist hash of their board, and a repeated hash is confirmed
+        by replaying the generations from the anchor board, so no boards are stored for the index.
+        Without detect_cycles nothing is indexed.
+        """
+
+        self.generation_index = {}
+        self.anchor_board = self.board.copy() if self.detect_cycles else None
+        self.anchor_step = self.i
+
+        # first generation of the found cycle (i.e. the transient length) and its period
+        self.transient = None
+        self.period = None
+
+        self._record_generation()
+
+    def _board_at(self, step: int) -> Board:
+        """ Replay the evolution to the given step from the nearest checkpoint after the anchor board. """
+
+        start = max((s for s in self.checkpoints if self.anchor_step <= s <= step), default=None)
+        board, start = (self.anchor_board, self.anchor_step) if start is None else (self.checkpoints[start], start)
+
+        for _ in range(step - start):
+            board = self._evolve(board)
+
+        return board
+
+    def _record_generation(self) -> None:
+        """ Index the current board and check if it repeats an earlier generation. """
+
+        if not self.detect_cycles or self.period is not None:
+            return
+
+        steps = self.generation_index.setdefault(self.board.zobrist, [])
+        if self.i in steps:
+            return
+
+        # different boards can share a hash, only an exact match is a cycle
+        for step in steps:
+            if step < self.i and self._board_at(step).is_equal(self.board):
+                self.transient = step
+                self.period = self.i - step
+                return
+
+        steps.append(self.i)
+
+    def found_cycle(self) -> bool:
+        """ Check if the board repeated an earlier generation, see transient and period. Requires detect_cycles. """
+
+        return self.period is not None
+
+    def _evolve(self, board: Board) -> Board:
+        """ Evolve the board once with the evolve mode selected for this game. """
+
+        if self.tile_size is not None:
+            return board.evolve_tiled(self.tile_size)
+
+        return board.evolve(rule=self.rule)
+
+    def _require_conway(self, name: str) -> None:
+        """ Raise an error if the game does not use the B3/S23 rule, which the given engine is limited to. """
+
+        if not self.rule.is_conway():
+            raise ValueError(f"{name} supports only the B3/S23 rule, the game uses {self.rule}")
+
+    def _push_history(self, board: Board) -> None:
+        """ Store the board of the current step in the history. """
+
+        self.history.push(board, self.i)
+
+    def _record_checkpoint(self) -> None:
+        """ Store the current board as a checkpoint if checkpoints are enabled and the generation is on the interval. """
+
+        if self.checkpoint_interval is not None and self.i % self.checkpoint_interval == 0 and self.i not in self.checkpoints:
+            self.checkpoints[self.i] = self.board.copy()
+
+    def _record_statistics(self) -> None:
+        """ Pass the current board to the statistics collector, if there is one. """
+
+        if self.statistics is not None:
+            self.statistics.record(self.board, self.i)
+
+    def _advance(self) -> None:
+        """ Evolve the board once and update the cycle detection and checkpoints. """
+
+        self.board = self._evolve(self.board)
+        self.i += 1
+        self._record_generation()
+        self._record_checkpoint()
 
     def next_step(self) -> None:
         """ Evolve the board once to the next generation. """
 
-        self.boards.append(self.board.copy())
-        self.board = self.board.evolve()
-        self.i += 1
+        self._push_history(self.board)
+        self._advance()
+        self._record_statistics()
+
+    def next_steps(self, generations: int) -> None:
+        """
+        Evolve the board by the given number of generations at once, see Board.evolve_n.
+        Only the board before the jump is added to the history, not the intermediate generations.
+
+        Args:
+            generations: number of generations to evolve
+        """
+
+        self._push_history(self.board)
+
+        if self.rule.is_conway():
+            self.board = self.board.evolve_n(generations)
+        else:
+            for _ in range(generations):
+                self.board = self._evolve(self.board)
+
+        self.i += generations
+        self._record_checkpoint()
+        # the skipped generations are not indexed, so the cycle detection starts over
+        self._reset_cycle_detection()
 
     def previous_step(self) -> None:
-        """ Go back to the previous step by looking at history. """
+        """ Go back to the previous step by looking at history, or recompute it from a checkpoint when the history is empty. """
+
+        if len(self.history) == 0:
+            self.seek(self.i - 1)
+            return
 
-        self.board = self.boards[-1]
-        self.boards.pop()
-        self.i -= 1
+        self.board, self.i = self.history.pop()
+
+        # generations after the anchor stay valid, the evolution is deterministic
+        if self.i < self.anchor_step:
+            self._reset_cycle_detection()
 
     def can_go_previous(self) -> bool:
-        """ Check if the game can go back to the previous step. """
+        """ Check if the game can go back to the previous step, without checkpoints only through the history. """
 
-        return len(self.boards) > 0
+        # without checkpoints the previous board would be replayed from the original one
+        return len(self.history) > 0 or (self.checkpoint_interval is not None and self.i > 0)
 
     def can_go_next(self) -> bool:
         """ Check if the game can evolve to the next step. """
 
         is_alive = self.board.count_alive_cells() > 0
 
-        if len(self.boards) == 0:
+        if self.stop_on_cycle and self.found_cycle():
+            return False
+
+        if len(self.history) == 0:
             return is_alive
 
-        return is_alive and not self.board.is_equal(self.boards[-1])
+        return is_alive and not self.board.is_equal(self.history.last())
 
     def run_step(self) -> bool:
         """ Evolve the board once to the next generation as the game is running. """
@@ -98,6 +291,129 @@ class Game:
         if not self.can_go_next() or self.i >= self.steps:
             return False
 
-        self.board = self.board.evolve()
-        self.i += 1
+        self._advance()
+        self._record_statistics()
         return True
+
+    def seek(self, generation: int) -> None:
+        """
+        Move the game to the given generation in either direction.
+        The board is recomputed from the nearest checkpoint before the generation, or from the current board
+        if it is closer, so at most checkpoint_interval generations are evolved.
+        Without a checkpoint interval, going back recomputes the board from the original one.
+        The history of previous steps is cleared, previous_step recomputes the boards from checkpoints instead.
+
+        Args:
+            generation: generation to move to
+        """
+
+        if generation < 0:
+            raise ValueError(f"Generation must be non-negative, got {generation}")
+
+        if generation == self.i:
+            return
+
+        start = max(step for step in self.checkpoints if step <= generation)
+        if not self.i <= generation or self.i < start:
+            self.board, self.i = self.checkpoints[start].copy(), start
+
+        self.history.clear()
+        if self.i < self.anchor_step:
+            self._reset_cycle_detection()
+
+        while self.i < generation:
+            self._advance()
+
+    def jump(self, exponent: int, unbounded: bool = False) -> str:
+        """
+        Advance a single player board by 2^exponent generations at once.
+        HashLife simulates an unbounded plane, so by default it is used only if no cell can reach the edge
+        of the board during the jump, otherwise the board is evolved by next_steps and the jump costs as much as stepping.
+        With unbounded, HashLife is always used and the board is the window [0, height) x [0, width) of the plane.
+        Cells leaving the board live on in the universe and the next unbounded jump continues from it,
+        e.g. the gliders of a gun keep flying away. Generations after such a jump differ from stepping the board,
+        so seek recomputes them from the checkpoint stored by the jump.
+        The memoized results are kept between jumps.
+
+        Args:
+            exponent: log2 of the number of generations to advance
+            unbounded: whether to evolve the board as a window of the unbounded plane
+
+        Returns:
+            JUMP_HASHLIFE if HashLife computed the board, JUMP_STEPS if it was stepped by next_steps
+        """
+
+        self._require_conway("HashLife")
+        if unbounded and self.board.boundary == BOUNDARY_WRAP:
+            raise ValueError("Unbounded jump is not possible on a wrapping board")
+
+        generations = 2 ** exponent
+        if not unbounded and not self._stays_inside(generations):
+            self.next_steps(generations)
+            return JUMP_STEPS
+
+        if self.hashlife is None:
+            self.hashlife = HashLife(cache_size=self.hashlife_cache_size)
+
+        # the universe still holds the cells which left the board in the last unbounded jump
+        if not unbounded or self._hashlife_board is not self.board:
+            self.hashlife.load_board(self.board)
+        self.hashlife.step_pow2(exponent)
+
+        self._push_history(self.board)
+        self.board = self.hashlife.to_board(self.board.height, self.board.width)
+        self.i += generations
+
+        if unbounded:
+            # stepping from the earlier checkpoints does not lead here, later ones would be stepped from them
+            self.checkpoints = {step: board for step, board in self.checkpoints.items() if step < self.i}
+            self.checkpoints[self.i] = self.board.copy()
+            self._hashlife_board = self.board
+        else:
+            self._record_checkpoint()
+            self._hashlife_board = None
+
+        self._reset_cycle_detection()
+        return JUMP_HASHLIFE
+
+    def _stays_inside(self, generations: int) -> bool:
+        """
+        Check if the cells cannot reach the edge of the board in the given number of generations,
+        i.e. the bounding box of the alive cells is at least that far from every edge of a non-wrapping board.
+        Cells spread by at most one cell per generation, so the evolution equals the one on an unbounded plane.
+        """
+
+        if self.board.boundary == BOUNDARY_WRAP:
+            return False
+
+        rows = np.flatnonzero(self.board.data.any(axis=1))
+        cols = np.flatnonzero(self.board.data.any(axis=0))
+        if len(rows) == 0:
+            return True
+
+        return (
+            rows[0] >= generations and self.board.height - 1 - rows[-1] >= generations
+            and cols[0] >= generations and self.board.width - 1 - cols[-1] >= generations
+        )
+
+    def run_parallel(self, generations: int, processes: int | None = None) -> None:
+        """
+        Advance the board by the given number of generations on a pool of worker processes.
+        The board is split into stripes kept in shared memory, see ParallelEvolver.
+
+        Args:
+            generations: number of generations to advance
+            processes: number of worker processes, defaults to the number of CPUs
+        """
+
+        self._require_conway("Parallel evolution")
+
+        with ParallelEvolver(self.board, processes) as evolver:
+            evolver.run(generations)
+            board = evolver.board()
+
+        self._push_history(self.board)
+        self.board = board
+        self.i += generations
+        self._record_checkpoint()
+        self._reset_cycle_detection()
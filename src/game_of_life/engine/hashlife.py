@@ -0,0 +1,465 @@
+"""
+This module implements the HashLife algorithm for long single player runs of the Game of Life.
+The universe is a memoized quadtree of canonical nodes on an unbounded plane,
+which allows advancing repetitive patterns by 2^k generations at once.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import numpy as np
+
+from game_of_life.config import BOARD_DTYPE, BOUNDARY_FILL, DEFAULT_HASHLIFE_CACHE_SIZE
+from game_of_life.engine.board import Board
+from game_of_life.engine.pattern import Pattern
+from game_of_life.utils.utils import get_players
+
+
+class Node:
+    """
+    Immutable quadtree node covering a square of 2^level x 2^level cells.
+    Nodes are canonical within a HashLife instance, so they are compared and hashed by identity.
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw: Node | None, ne: Node | None, sw: Node | None, se: Node | None, level: int, population: int) -> None:
+        """
+        Initialize the node, should not be used directly, use HashLife.join instead.
+
+        Args:
+            nw: north-west quadrant
+            ne: north-east quadrant
+            sw: south-west quadrant
+            se: south-east quadrant
+            level: level of the node, the node covers 2^level cells per side
+            population: number of alive cells in the node
+        """
+
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(level={self.level}, population={self.population})"
+
+
+DEAD = Node(None, None, None, None, 0, 0)
+ALIVE = Node(None, None, None, None, 0, 1)
+
+
+def _life_rule(alive: bool, neighbors: int) -> bool:
+    """ Decide the next state of a cell according to the B3/S23 rules. """
+
+    return neighbors == 3 or (alive and neighbors == 2)
+
+
+class HashLife:
+    """
+    HashLife universe holding a single player pattern on an unbounded plane.
+    Cell (r, c) of the universe corresponds to the cell (r, c) of the imported board.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_HASHLIFE_CACHE_SIZE, player: int = 1) -> None:
+        """
+        Initialize an empty universe.
+
+        Args:
+            cache_size: maximal number of memoized results and canonical nodes kept between steps
+            player: player index used when exporting to Board
+        """
+
+        self.cache_size = cache_size
+        self.player = player
+
+        self._nodes: dict[tuple, Node] = {}
+        self._results: OrderedDict[tuple[Node, int], Node] = OrderedDict()
+        self._empty = [DEAD]
+
+        self.root = self.empty(3)
+        self.top, self.left = 0, 0
+        self.generation = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(level={self.root.level}, generation={self.generation}, alive={self.count_alive_cells()})"
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """
+        Get the canonical node composed of the given quadrants.
+
+        Args:
+            nw: north-west quadrant
+            ne: north-east quadrant
+            sw: south-west quadrant
+            se: south-east quadrant
+        """
+
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw, ne, sw, se, nw.level + 1, population)
+            self._nodes[key] = node
+        return node
+
+    def empty(self, level: int) -> Node:
+        """
+        Get the canonical empty node of the given level.
+
+        Args:
+            level: level of the node
+        """
+
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self.join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def count_alive_cells(self) -> int:
+        """ Counts the number of alive cells in the universe. """
+
+        return self.root.population
+
+    def cache_info(self) -> dict[str, int]:
+        """ Report the number of canonical nodes and memoized results. """
+
+        return {"nodes": len(self._nodes), "results": len(self._results), "cache_size": self.cache_size}
+
+    def collect(self) -> None:
+        """
+        Evict the memoized results and rebuild the node table from the nodes reachable from the root.
+        This is called automatically after a step when the node table grows over the cache size.
+        """
+
+        self._results.clear()
+        self._nodes = {}
+        self._empty = [DEAD]
+
+        stack = [self.root]
+        reachable = {}
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in reachable:
+                continue
+            reachable[id(node)] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+
+        for node in reachable.values():
+            self._nodes[(node.nw, node.ne, node.sw, node.se)] = node
+
+    # --- import and export ---
+
+    def _build(self, arr: np.ndarray, level: int) -> Node:
+        """ Build a node of the given level from a square boolean array. """
+
+        if level == 0:
+            return ALIVE if arr[0, 0] else DEAD
+        if not arr.any():
+            return self.empty(level)
+
+        half = 1 << (level - 1)
+        return self.join(
+            self._build(arr[:half, :half], level - 1),
+            self._build(arr[:half, half:], level - 1),
+            self._build(arr[half:, :half], level - 1),
+            self._build(arr[half:, half:], level - 1),
+        )
+
+    def load_array(self, arr: np.ndarray, top: int = 0, left: int = 0) -> None:
+        """
+        Replace the universe by the alive cells of the given array, the caches are kept.
+
+        Args:
+            arr: 2D array, all non-zero cells are alive
+            top: row of the universe where the first row of the array is placed
+            left: column of the universe where the first column of the array is placed
+        """
+
+        height, width = arr.shape
+        level = max(3, int(np.ceil(np.log2(max(height, width, 1)))))
+        size = 1 << level
+
+        square = np.zeros((size, size), dtype=bool)
+        square[:height, :width] = arr != 0
+
+        self.root = self._build(square, level)
+        self.top, self.left = top, left
+        self.generation = 0
+
+    def load_board(self, board: Board) -> None:
+        """
+        Replace the universe by the given single player board.
+
+        Args:
+            board: board to import
+        """
+
+        if board.boundary != BOUNDARY_FILL:
+            raise ValueError("HashLife supports only the fill boundary")
+
+        players = get_players(board.data)
+        if len(players) > 1:
+            raise ValueError("HashLife supports only a single player")
+        if len(players) == 1:
+            self.player = int(players[0])
+
+        self.load_array(board.data)
+
+    def load_pattern(self, pattern: Pattern, x0: int = 0, y0: int = 0) -> None:
+        """
+        Replace the universe by the given pattern.
+
+        Args:
+            pattern: pattern to import
+            x0: x-coordinate of the top-left corner of the pattern
+            y0: y-coordinate of the top-left corner of the pattern
+        """
+
+        self.load_array(pattern.data, top=y0, left=x0)
+
+    def _fill(self, node: Node, top: int, left: int, out: np.ndarray, r0: int, c0: int) -> None:
+        """ Write the alive cells of the node placed at (top, left) into the window of out starting at (r0, c0). """
+
+        size = 1 << node.level
+        height, width = out.shape
+        if node.population == 0 or top >= r0 + height or left >= c0 + width or top + size <= r0 or left + size <= c0:
+            return
+
+        if node.level == 0:
+            out[top - r0, left - c0] = True
+            return
+
+        half = size >> 1
+        self._fill(node.nw, top, left, out, r0, c0)
+        self._fill(node.ne, top, left + half, out, r0, c0)
+        self._fill(node.sw, top + half, left, out, r0, c0)
+        self._fill(node.se, top + half, left + half, out, r0, c0)
+
+    def to_array(self, top: int, left: int, height: int, width: int) -> np.ndarray:
+        """
+        Export a window of the universe as a boolean array.
+
+        Args:
+            top: first row of the window
+            left: first column of the window
+            height: height of the window
+            width: width of the window
+        """
+
+        out = np.zeros((height, width), dtype=bool)
+        self._fill(self.root, self.top, self.left, out, top, left)
+        return out
+
+    def _node_bounds(self, node: Node, memo: dict[Node, tuple[int, int, int, int]]) -> tuple[int, int, int, int]:
+        """ Get the inclusive (top, left, bottom, right) bounds of alive cells relative to the corner of a non-empty node. """
+
+        if node.level == 0:
+            return 0, 0, 0, 0
+
+        bounds = memo.get(node)
+        if bounds is None:
+            half = 1 << (node.level - 1)
+            parts = []
+            for child, dr, dc in ((node.nw, 0, 0), (node.ne, 0, half), (node.sw, half, 0), (node.se, half, half)):
+                if child.population > 0:
+                    top, left, bottom, right = self._node_bounds(child, memo)
+                    parts.append((top + dr, left + dc, bottom + dr, right + dc))
+
+            bounds = (
+                min(part[0] for part in parts),
+                min(part[1] for part in parts),
+                max(part[2] for part in parts),
+                max(part[3] for part in parts),
+            )
+            memo[node] = bounds
+
+        return bounds
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """ Get the (top, left, bottom, right) inclusive bounds of the alive cells, None if the universe is empty. """
+
+        if self.root.population == 0:
+            return None
+
+        top, left, bottom, right = self._node_bounds(self.root, {})
+        return self.top + top, self.left + left, self.top + bottom, self.left + right
+
+    def to_board(self, height: int, width: int) -> Board:
+        """
+        Export the window [0, height) x [0, width) of the universe as a board.
+        Cells outside of the window are dropped.
+
+        Args:
+            height: height of the board
+            width: width of the board
+        """
+
+        board = Board.new(width=width, height=height, players=self.player)
+        board.data[self.to_array(0, 0, height, width)] = self.player
+        return board
+
+    def to_pattern(self, name: str) -> Pattern:
+        """
+        Export all alive cells of the universe as a pattern.
+
+        Args:
+            name: name of the pattern
+        """
+
+        box = self.bounding_box()
+        if box is None:
+            raise ValueError("Cannot create a pattern from an empty universe")
+
+        top, left, bottom, right = box
+        return Pattern.new(self.to_array(top, left, bottom - top + 1, right - left + 1).astype(BOARD_DTYPE), name)
+
+    # --- evolution ---
+
+    def _center(self, node: Node) -> Node:
+        """ Get the centered node of one level lower. """
+
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _expand(self) -> None:
+        """ Surround the root by empty space, keeping it centered. """
+
+        root = self.root
+        border = self.empty(root.level - 1)
+        self.root = self.join(
+            self.join(border, border, border, root.nw),
+            self.join(border, border, root.ne, border),
+            self.join(border, root.sw, border, border),
+            self.join(root.se, border, border, border),
+        )
+
+        shift = 1 << (root.level - 1)
+        self.top -= shift
+        self.left -= shift
+
+    def _shrink(self) -> None:
+        """ Remove empty borders around the root while the pattern stays inside the center. """
+
+        while self.root.level > 3:
+            center = self._center(self.root)
+            if center.population != self.root.population:
+                break
+
+            shift = 1 << (self.root.level - 2)
+            self.root = center
+            self.top += shift
+            self.left += shift
+
+    def _base_step(self, node: Node) -> Node:
+        """ Advance the center 2x2 cells of a level 2 node by one generation. """
+
+        cells = [
+            [node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+            [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+            [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+            [node.sw.sw, node.sw.se, node.se.sw, node.se.se],
+        ]
+        bits = [[cell.population for cell in row] for row in cells]
+
+        def next_cell(r: int, c: int) -> Node:
+            neighbors = sum(bits[r + dr][c + dc] for dr in (-1, 0, 1) for dc in (-1, 0, 1)) - bits[r][c]
+            return ALIVE if _life_rule(bits[r][c] == 1, neighbors) else DEAD
+
+        return self.join(next_cell(1, 1), next_cell(1, 2), next_cell(2, 1), next_cell(2, 2))
+
+    def _successor(self, node: Node, exponent: int) -> Node:
+        """
+        Advance the center of the node, one level lower, by 2^exponent generations.
+
+        Args:
+            node: node of level at least 2
+            exponent: log2 of the number of generations, at most node.level - 2
+        """
+
+        if node.population == 0:
+            return self.empty(node.level - 1)
+
+        key = (node, exponent)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if node.level == 2:
+            result = self._base_step(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+            # nine overlapping subnodes of one level lower
+            n00 = nw
+            n01 = self.join(nw.ne, ne.nw, nw.se, ne.sw)
+            n02 = ne
+            n10 = self.join(nw.sw, nw.se, sw.nw, sw.ne)
+            n11 = self._center(node)
+            n12 = self.join(ne.sw, ne.se, se.nw, se.ne)
+            n20 = sw
+            n21 = self.join(sw.ne, se.nw, sw.se, se.sw)
+            n22 = se
+
+            # full speed advances the subnodes in both halves, otherwise only the second half moves in time
+            if exponent == node.level - 2:
+                first = [self._successor(n, exponent - 1) for n in (n00, n01, n02, n10, n11, n12, n20, n21, n22)]
+                second_exponent = exponent - 1
+            else:
+                first = [self._center(n) for n in (n00, n01, n02, n10, n11, n12, n20, n21, n22)]
+                second_exponent = exponent
+
+            c00, c01, c02, c10, c11, c12, c20, c21, c22 = first
+            result = self.join(
+                self._successor(self.join(c00, c01, c10, c11), second_exponent),
+                self._successor(self.join(c01, c02, c11, c12), second_exponent),
+                self._successor(self.join(c10, c11, c20, c21), second_exponent),
+                self._successor(self.join(c11, c12, c21, c22), second_exponent),
+            )
+
+        self._results[key] = result
+        if len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+
+        return result
+
+    def step_pow2(self, exponent: int) -> None:
+        """
+        Advance the universe by 2^exponent generations at once.
+
+        Args:
+            exponent: log2 of the number of generations
+        """
+
+        # the pattern has to stay within the center quarter, light speed is one cell per generation
+        while self.root.level < exponent + 3 or self._center(self._center(self.root)).population != self.root.population:
+            self._expand()
+
+        level = self.root.level
+        self.root = self._successor(self.root, exponent)
+        shift = 1 << (level - 2)
+        self.top += shift
+        self.left += shift
+        self.generation += 1 << exponent
+
+        self._shrink()
+        if len(self._nodes) > self.cache_size:
+            self.collect()
+
+    def step(self, generations: int) -> None:
+        """
+        Advance the universe by an arbitrary number of generations.
+
+        Args:
+            generations: number of generations
+        """
+
+        exponent = 0
+        while generations > 0:
+            if generations & 1:
+                self.step_pow2(exponent)
+            generations >>= 1
+            exponent += 1
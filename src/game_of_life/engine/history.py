@@ -0,0 +1,254 @@
+"""
+This module implements a compact history of Game of Life boards.
+A full keyframe is stored every few generations and only the changed cells in between,
+so the history of a large board costs roughly its activity instead of its area per step.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from game_of_life.config import DEFAULT_HISTORY_KEYFRAME_INTERVAL, DEFAULT_HISTORY_MEMORY_BUDGET
+from game_of_life.engine.board import Board
+
+
+def diff_cells(old: np.ndarray, new: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the cells which differ between two arrays of the same shape.
+
+    Args:
+        old: array the diff is applied to
+        new: array the diff leads to
+
+    Returns:
+        flat indices of the changed cells and their new values
+    """
+
+    indices = np.flatnonzero(old != new)
+    return indices.astype(np.int32 if old.size <= np.iinfo(np.int32).max else np.int64), new.ravel()[indices]
+
+
+class Keyframe:
+    """ History entry holding a full copy of the board. """
+
+    __slots__ = ("board", "step")
+
+    def __init__(self, board: Board, step: int) -> None:
+        """
+        Args:
+            board: copy of the board
+            step: generation of the board
+        """
+
+        self.board = board
+        self.step = step
+
+    @property
+    def nbytes(self) -> int:
+        """ Number of bytes used by the stored cells. """
+
+        return self.board.data.nbytes + (0 if self.board.ages is None else self.board.ages.nbytes)
+
+
+class Delta:
+    """ History entry holding the cells which changed since the previous entry. """
+
+    __slots__ = ("indices", "values", "age_indices", "age_values", "step")
+
+    def __init__(self, previous: Board, board: Board, step: int) -> None:
+        """
+        Args:
+            previous: board of the previous entry
+            board: board of this entry
+            step: generation of the board
+        """
+
+        self.indices, self.values = diff_cells(previous.data, board.data)
+        self.step = step
+
+        # dying cells of Generations rules are stored the same way, None when neither board has any
+        if previous.ages is None and board.ages is None:
+            self.age_indices = self.age_values = None
+        else:
+            self.age_indices, self.age_values = diff_cells(_ages(previous), _ages(board))
+
+    @property
+    def nbytes(self) -> int:
+        """ Number of bytes used by the stored cells. """
+
+        ages = 0 if self.age_indices is None else self.age_indices.nbytes + self.age_values.nbytes
+        return self.indices.nbytes + self.values.nbytes + ages
+
+    def apply(self, data: np.ndarray, ages: np.ndarray | None) -> np.ndarray | None:
+        """
+        Turn the cells of the previous entry into the cells of this entry in place.
+
+        Args:
+            data: cells of the previous entry
+            ages: ages of the dying cells of the previous entry, None if it has none
+
+        Returns:
+            ages of the dying cells of this entry, None if it has none
+        """
+
+        data.ravel()[self.indices] = self.values
+
+        if self.age_indices is None:
+            return ages
+
+        ages = np.zeros(data.shape, dtype=self.age_values.dtype) if ages is None else ages
+        ages.ravel()[self.age_indices] = self.age_values
+        return ages
+
+
+def _ages(board: Board) -> np.ndarray:
+    """ Get the ages of the dying cells of the board, zeros if it has none. """
+
+    return np.zeros(board.data.shape, dtype=np.uint8) if board.ages is None else board.ages
+
+
+class History:
+    """
+    Stack of past boards stored as keyframes and deltas.
+    Every keyframe_interval-th entry is a keyframe, the rest are deltas against the previous entry.
+    When the memory budget is exceeded, the oldest keyframe is dropped together with its deltas.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_HISTORY_KEYFRAME_INTERVAL, memory_budget: int | None = DEFAULT_HISTORY_MEMORY_BUDGET) -> None:
+        """
+        Initialize an empty history.
+
+        Args:
+            keyframe_interval: number of entries between two keyframes, 1 stores every board in full
+            memory_budget: maximal number of bytes used by the history, None for no limit
+        """
+
+        if keyframe_interval < 1:
+            raise ValueError(f"Keyframe interval must be at least 1, got {keyframe_interval}")
+
+        self.keyframe_interval = keyframe_interval
+        self.memory_budget = memory_budget
+
+        self.entries: list[Keyframe | Delta] = []
+        self.nbytes = 0
+
+        # full copy of the newest board, deltas are computed against it, None when it has to be rebuilt
+        self._last: Board | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(entries={len(self.entries)}, nbytes={self.memory_usage()})"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def memory_usage(self) -> int:
+        """ Number of bytes used by the stored entries and the cached newest board. """
+
+        # the newest board is shared with the newest entry if it is a keyframe
+        if self._last is None or (self.entries and isinstance(self.entries[-1], Keyframe) and self.entries[-1].board is self._last):
+            return self.nbytes
+
+        return self.nbytes + Keyframe(self._last, 0).nbytes
+
+    def clear(self) -> None:
+        """ Remove all entries. """
+
+        self.entries = []
+        self.nbytes = 0
+        self._last = None
+
+    def push(self, board: Board, step: int) -> None:
+        """
+        Store a copy of the board as the newest entry.
+
+        Args:
+            board: board to store, it is not modified
+            step: generation of the board
+        """
+
+        last = self.last()
+        board = board.copy()
+
+        since_keyframe = next((i for i, entry in enumerate(reversed(self.entries)) if isinstance(entry, Keyframe)), None)
+        needs_keyframe = (
+            last is None
+            or since_keyframe is None
+            or since_keyframe + 1 >= self.keyframe_interval
+            or last.data.shape != board.data.shape
+            or last.data.dtype != board.data.dtype
+        )
+
+        entry = Keyframe(board, step) if needs_keyframe else Delta(last, board, step)
+        self.entries.append(entry)
+        self.nbytes += entry.nbytes
+        self._last = board
+
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        """ Drop the oldest keyframes with their deltas until the history fits the memory budget. """
+
+        if self.memory_budget is None:
+            return
+
+        while self.memory_usage() > self.memory_budget:
+            # the newest keyframe and its deltas are always kept
+            keyframes = [i for i, entry in enumerate(self.entries) if isinstance(entry, Keyframe)]
+            if len(keyframes) < 2:
+                break
+
+            dropped = self.entries[:keyframes[1]]
+            self.entries = self.entries[keyframes[1]:]
+            self.nbytes -= sum(entry.nbytes for entry in dropped)
+
+    def board_at(self, index: int) -> tuple[Board, int]:
+        """
+        Rebuild the board of the given entry from its keyframe and the deltas after it.
+
+        Args:
+            index: index of the entry, negative indices count from the newest one
+
+        Returns:
+            copy of the stored board and its generation
+        """
+
+        index = range(len(self.entries))[index]
+
+        start = index
+        while not isinstance(self.entries[start], Keyframe):
+            start -= 1
+
+        keyframe = self.entries[start].board
+        data = keyframe.data.copy()
+        ages = None if keyframe.ages is None else keyframe.ages.copy()
+
+        for entry in self.entries[start + 1:index + 1]:
+            ages = entry.apply(data, ages)
+
+        board = Board(data, keyframe.boundary)
+        board.ages = ages
+        return board, self.entries[index].step
+
+    def last(self) -> Board | None:
+        """ Get the newest stored board, None if the history is empty. The board must not be modified. """
+
+        if self._last is None and self.entries:
+            self._last, _ = self.board_at(-1)
+
+        return self._last
+
+    def pop(self) -> tuple[Board, int]:
+        """
+        Remove the newest entry.
+
+        Returns:
+            the stored board and its generation
+        """
+
+        board, step = self.board_at(-1)
+
+        entry = self.entries.pop()
+        self.nbytes -= entry.nbytes
+        self._last = None
+
+        return board, step
@@ -0,0 +1,216 @@
+"""
+This module implements a multi-core evolution of the Game of Life board.
+The board lives in shared memory and every worker process evolves one horizontal stripe,
+reading the one cell halo rows of its neighbors directly from the shared buffer.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Barrier
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from game_of_life.config import BOUNDARY_WRAP, DEFAULT_PARALLEL_TIMEOUT
+from game_of_life.engine.board import Board, evolve_vectorized
+
+
+def evolve_stripe(src: np.ndarray, dst: np.ndarray, r0: int, r1: int, boundary: str) -> None:
+    """
+    Evolve rows [r0, r1) of the source board into the destination board.
+    Only the stripe and one halo row above and below it are read.
+
+    Args:
+        src: board of the current generation
+        dst: board of the next generation
+        r0: first row of the stripe
+        r1: row after the last row of the stripe
+        boundary: boundary of the board
+    """
+
+    height = src.shape[0]
+
+    if boundary == BOUNDARY_WRAP:
+        halo = src[np.arange(r0 - 1, r1 + 1) % height]
+        dst[r0:r1] = evolve_vectorized(halo, boundary)[1:-1]
+    else:
+        h0 = max(0, r0 - 1)
+        halo = src[h0:min(height, r1 + 1)]
+        dst[r0:r1] = evolve_vectorized(halo, boundary)[r0 - h0:r1 - h0]
+
+
+def _worker(names: list[str], shape: tuple[int, int], dtype: np.dtype, boundary: str, r0: int, r1: int, barrier: Barrier, conn: Connection) -> None:
+    """
+    Worker loop evolving a single stripe, it receives the number of generations to run and reports back when done.
+    If the other workers do not reach the barrier in time, the broken barrier error is reported instead and the worker stops.
+
+    Args:
+        names: names of the two shared memory buffers
+        shape: shape of the board
+        dtype: dtype of the board
+        boundary: boundary of the board
+        r0: first row of the stripe
+        r1: row after the last row of the stripe
+        barrier: barrier shared by all workers, synchronizes the generations
+        conn: pipe to the parent process
+    """
+
+    memories = [SharedMemory(name=name) for name in names]
+    buffers = [np.ndarray(shape, dtype=dtype, buffer=memory.buf) for memory in memories]
+    current = 0
+
+    try:
+        while True:
+            generations = conn.recv()
+            if generations is None:
+                break
+
+            try:
+                for _ in range(generations):
+                    evolve_stripe(buffers[current], buffers[1 - current], r0, r1, boundary)
+                    # all stripes of the next generation have to be written before anyone reads its halo
+                    barrier.wait()
+                    current = 1 - current
+            except BrokenBarrierError as error:
+                conn.send(error)
+                break
+
+            conn.send(current)
+    finally:
+        del buffers
+        for memory in memories:
+            memory.close()
+
+
+class ParallelEvolver:
+    """
+    Evolve a board on a pool of worker processes, one horizontal stripe per process.
+    The board is double buffered in shared memory, so no board is pickled between generations.
+    Use as a context manager, or call close, to stop the workers and release the shared memory.
+    A worker which dies or gets stuck raises a RuntimeError in run instead of blocking it forever.
+    """
+
+    def __init__(self, board: Board, processes: int | None = None, timeout: float | None = DEFAULT_PARALLEL_TIMEOUT) -> None:
+        """
+        Copy the board to shared memory and start the workers.
+
+        Args:
+            board: board to evolve
+            processes: number of worker processes, defaults to the number of CPUs
+            timeout: seconds a worker waits for the others to finish a generation, None to wait forever
+        """
+
+        self.shape = board.data.shape
+        self.dtype = board.data.dtype
+        self.boundary = board.boundary
+
+        processes = min(processes or os.cpu_count() or 1, board.height)
+        bounds = np.linspace(0, board.height, processes + 1).astype(int)
+
+        self.memories = [SharedMemory(create=True, size=max(1, board.data.nbytes)) for _ in range(2)]
+        self.buffers = [np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf) for memory in self.memories]
+        self.buffers[0][:] = board.data
+        self.current = 0
+
+        self.barrier = mp.Barrier(processes, timeout=timeout)
+        names = [memory.name for memory in self.memories]
+
+        self.connections = []
+        self.workers = []
+        for r0, r1 in zip(bounds[:-1], bounds[1:]):
+            parent_conn, child_conn = mp.Pipe()
+            worker = mp.Process(
+                target=_worker,
+                args=(names, self.shape, self.dtype, self.boundary, int(r0), int(r1), self.barrier, child_conn),
+                daemon=True,
+            )
+            worker.start()
+            self.connections.append(parent_conn)
+            self.workers.append(worker)
+
+    def __enter__(self) -> ParallelEvolver:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def run(self, generations: int) -> None:
+        """
+        Evolve the board by the given number of generations.
+
+        Args:
+            generations: number of generations to run
+        """
+
+        try:
+            for conn in self.connections:
+                conn.send(generations)
+        except BrokenPipeError:
+            self._check_workers()
+            raise
+
+        # every worker reports the buffer holding the latest generation, they all agree
+        pending = list(self.connections)
+        while pending:
+            # a dead worker wakes the wait up through its sentinel, the others would wait for it at the barrier
+            for conn in wait(pending + [worker.sentinel for worker in self.workers]):
+                if conn in pending:
+                    pending.remove(conn)
+                    self._receive(conn)
+            self._check_workers()
+
+    def _receive(self, conn: Connection) -> None:
+        """ Receive the buffer of the latest generation from a worker, raise an error if it could not synchronize. """
+
+        worker = self.workers[self.connections.index(conn)]
+        try:
+            message = conn.recv()
+        except EOFError:
+            # the pipe is closed only by the exit of the worker
+            worker.join()
+            self._check_workers()
+            raise
+
+        if isinstance(message, BrokenBarrierError):
+            self.barrier.abort()
+            raise RuntimeError(f"Parallel worker {worker.name} timed out waiting for the other workers") from message
+
+        self.current = message
+
+    def _check_workers(self) -> None:
+        """ Raise an error if a worker exited, the workers still waiting for it at the barrier are released. """
+
+        for worker in self.workers:
+            if not worker.is_alive():
+                self.barrier.abort()
+                raise RuntimeError(f"Parallel worker {worker.name} exited with code {worker.exitcode}")
+
+    def board(self) -> Board:
+        """ Get a copy of the current board. """
+
+        return Board(self.buffers[self.current].copy(), self.boundary)
+
+    def close(self) -> None:
+        """ Stop the workers and release the shared memory. """
+
+        for conn in self.connections:
+            try:
+                conn.send(None)
+            except BrokenPipeError:
+                # the worker has already exited
+                pass
+        for worker in self.workers:
+            worker.join()
+
+        self.connections = []
+        self.workers = []
+
+        self.buffers = []
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+        self.memories = []
@@ -7,7 +7,7 @@ import numpy as np
 
 from game_of_life.utils.path_manager import PathManager
 from game_of_life.visualization.visualization import stringify_board
-from game_of_life.utils.utils import crop_box, fill_nonzero
+from game_of_life.utils.utils import compact, crop_box, fill_nonzero
 
 
 class Pattern:
@@ -29,7 +29,7 @@ class Pattern:
             new pattern
         """
 
-        return Pattern(fill_nonzero(crop_box(box), fill_value=1), name)
+        return Pattern(compact(fill_nonzero(crop_box(box), fill_value=1)), name)
 
     @staticmethod
     def load(path: str) -> Pattern:
@@ -44,7 +44,11 @@ class Pattern:
         """
 
         with open(path, "rb") as f:
-            return pickle.load(f)
+            pattern = pickle.load(f)
+
+        # patterns saved by older versions hold wide integer arrays
+        pattern.data = compact(pattern.data)
+        return pattern
 
     def __init__(self, data: np.ndarray, name: str) -> None:
         """
@@ -0,0 +1,253 @@
+"""
+This module implements cellular automaton rules given by rulestrings.
+Life-like B/S rules, Generations rules and Larger-than-Life range rules are compiled into lookup tables
+indexed by the neighbor count, so any rule is evolved by the same vectorized kernel.
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+from game_of_life.config import BOUNDARY_FILL
+from game_of_life.engine.board import Board, resolve_majority, window_sum
+from game_of_life.utils.utils import select_dtype
+
+# B3/S23, B36/S23/C3 or B2/S/3
+BS_RULE = re.compile(r"^B([0-8]*)/S([0-8]*)(?:/C?(\d+))?$", re.IGNORECASE)
+# S23/B3, the same in the reversed order
+SB_RULE = re.compile(r"^S([0-8]*)/B([0-8]*)(?:/C?(\d+))?$", re.IGNORECASE)
+# 23/3 or 345/2/4, survival digits first
+DIGITS_RULE = re.compile(r"^([0-8]*)/([0-8]*)(?:/(\d+))?$")
+# R5,C0,M1,S34..58,B34..45,NM
+LTL_TOKEN = re.compile(r"^([RCMSBN])(.+)$", re.IGNORECASE)
+LTL_RANGE = re.compile(r"^(\d+)\.\.(\d+)$")
+
+
+def _digits(digits: str) -> list[int]:
+    """ Convert a string of count digits to a list of counts. """
+
+    return [int(digit) for digit in digits]
+
+
+def _format_ranges(counts: tuple[int, ...], prefix: str) -> list[str]:
+    """ Format counts as Larger-than-Life range tokens, one token per run of consecutive counts. """
+
+    tokens = []
+    start = None
+    for i, count in enumerate(counts):
+        if start is None:
+            start = count
+        if i + 1 == len(counts) or counts[i + 1] != count + 1:
+            tokens.append(f"{prefix}{start}..{count}")
+            start = None
+
+    return tokens
+
+
+def _parse_ltl(rulestring: str) -> Rule:
+    """
+    Parse a Larger-than-Life rulestring in the Golly format, e.g. R5,C0,M1,S34..58,B34..45,NM.
+    Every S and B token adds a range of counts, so non-contiguous sets can be written as several tokens.
+    """
+
+    radius, states, include_center = 1, 2, False
+    birth, survive = [], []
+
+    for token in rulestring.split(","):
+        match = LTL_TOKEN.match(token.strip())
+        if match is None:
+            raise ValueError(f"Invalid token {token} in rule {rulestring}")
+
+        key, value = match.group(1).upper(), match.group(2)
+
+        if key in "SB":
+            bounds = LTL_RANGE.match(value)
+            if bounds is None:
+                raise ValueError(f"Invalid range {value} in rule {rulestring}")
+            counts = list(range(int(bounds.group(1)), int(bounds.group(2)) + 1))
+            (survive if key == "S" else birth).extend(counts)
+        elif key == "N":
+            if value.upper() != "M":
+                raise ValueError(f"Only the Moore neighborhood (NM) is supported, got N{value}")
+        elif not value.isdigit():
+            raise ValueError(f"Invalid value {value} in rule {rulestring}")
+        elif key == "R":
+            radius = int(value)
+        elif key == "C":
+            # C0 and C2 both mean two states
+            states = max(2, int(value))
+        elif key == "M":
+            include_center = value == "1"
+
+    return Rule(birth, survive, states=states, radius=radius, include_center=include_center)
+
+
+class Rule:
+    """
+    Outer totalistic rule of a cellular automaton on the multi-player board.
+    Alive cells are counted regardless of their player, which player a cell belongs to is decided
+    by the majority in its neighborhood, the same as in Board.evolve.
+    """
+
+    @staticmethod
+    def parse(rulestring: str) -> Rule:
+        """
+        Parse a rulestring of a Life-like, Generations or Larger-than-Life rule.
+
+        Supported formats:
+            B3/S23, S23/B3 or 23/3 for Life-like rules
+            B2/S/C3 or 345/2/4 for Generations rules with the number of states at the end
+            R5,C0,M1,S34..58,B34..45,NM for Larger-than-Life rules with the Moore neighborhood
+
+        Args:
+            rulestring: rule to parse
+
+        Returns:
+            parsed rule
+        """
+
+        rulestring = rulestring.strip()
+
+        if (match := BS_RULE.match(rulestring)) is not None:
+            birth, survive, states = match.groups()
+        elif (match := SB_RULE.match(rulestring)) is not None:
+            survive, birth, states = match.groups()
+        elif (match := DIGITS_RULE.match(rulestring)) is not None:
+            survive, birth, states = match.groups()
+        elif rulestring[:1].upper() == "R" and "," in rulestring:
+            return _parse_ltl(rulestring)
+        else:
+            raise ValueError(f"Unknown rule format {rulestring}")
+
+        return Rule(_digits(birth), _digits(survive), states=int(states or 2))
+
+    def __init__(self, birth: list[int], survive: list[int], states: int = 2, radius: int = 1, include_center: bool = False) -> None:
+        """
+        Initialize the rule and compile it into lookup tables.
+
+        Args:
+            birth: neighbor counts at which a dead cell becomes alive
+            survive: neighbor counts at which an alive cell stays alive
+            states: number of cell states, more than 2 makes the dying cells decay for states - 2 generations
+            radius: radius of the square (Moore) neighborhood
+            include_center: whether the cell itself is counted as its own neighbor
+        """
+
+        if radius < 1:
+            raise ValueError(f"Radius must be at least 1, got {radius}")
+        if states < 2:
+            raise ValueError(f"Rule must have at least 2 states, got {states}")
+
+        self.birth = tuple(sorted(set(birth)))
+        self.survive = tuple(sorted(set(survive)))
+        self.states = states
+        self.radius = radius
+        self.include_center = include_center
+
+        max_count = (2 * radius + 1) ** 2 - (0 if include_center else 1)
+        if any(count < 0 or count > max_count for count in self.birth + self.survive):
+            raise ValueError(f"Neighbor counts must be between 0 and {max_count}")
+
+        # lookup tables indexed by the neighbor count
+        self.birth_table = np.zeros(max_count + 1, dtype=bool)
+        self.birth_table[list(self.birth)] = True
+        self.survive_table = np.zeros(max_count + 1, dtype=bool)
+        self.survive_table[list(self.survive)] = True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self})"
+
+    def __str__(self) -> str:
+        if self.radius == 1 and not self.include_center:
+            birth = "".join(map(str, self.birth))
+            survive = "".join(map(str, self.survive))
+            return f"B{birth}/S{survive}" + (f"/C{self.states}" if self.states > 2 else "")
+
+        tokens = [f"R{self.radius}", f"C{self.states if self.states > 2 else 0}", f"M{int(self.include_center)}"]
+        tokens += _format_ranges(self.survive, "S") + _format_ranges(self.birth, "B") + ["NM"]
+        return ",".join(tokens)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rule):
+            return NotImplemented
+
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def is_conway(self) -> bool:
+        """ Check if the rule is the standard B3/S23 rule, which has its own faster kernels. """
+
+        return self.birth == (3,) and self.survive == (2, 3) and self.states == 2 and self.radius == 1 and not self.include_center
+
+    def next_alive(self, arr: np.ndarray, boundary: str = BOUNDARY_FILL, ages: np.ndarray | None = None) -> np.ndarray:
+        """
+        Decide which cells are alive in the next generation, regardless of their player.
+
+        Args:
+            arr: numpy array with the boards in the last two axes
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+            ages: decay of the dying cells, dying cells cannot be born, None if there are none
+
+        Returns:
+            boolean array of the cells alive in the next generation
+        """
+
+        alive = arr != 0
+        counts = window_sum(alive, self.radius, boundary)
+        if not self.include_center:
+            np.subtract(counts, alive, out=counts, casting="unsafe")
+
+        born = self.birth_table[counts] & ~alive
+        if ages is not None:
+            born &= ages == 0
+
+        return born | (alive & self.survive_table[counts])
+
+    def step(self, arr: np.ndarray, boundary: str = BOUNDARY_FILL, ages: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Evolve the board data by one generation of the rule.
+
+        Args:
+            arr: numpy array with the boards in the last two axes
+            boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+            ages: decay of the dying cells, None if there are none
+
+        Returns:
+            next generation of the board data and the decay of its dying cells, None for two state rules
+        """
+
+        new_data = resolve_majority(arr, self.next_alive(arr, boundary, ages), boundary, radius=self.radius)
+
+        if self.states == 2:
+            return new_data, None
+
+        # dying cells are dead, they age by one and vanish after states - 2 generations
+        new_ages = np.zeros(arr.shape, dtype=select_dtype(self.states))
+        if ages is not None:
+            np.add(ages, 1, out=new_ages, where=ages != 0, casting="unsafe")
+            new_ages[new_ages > self.states - 2] = 0
+        new_ages[(arr != 0) & (new_data == 0)] = 1
+
+        return new_data, new_ages
+
+    def evolve(self, board: Board) -> Board:
+        """
+        Evolve the board by one generation of the rule.
+
+        Args:
+            board: board to evolve
+
+        Returns:
+            board of the next generation
+        """
+
+        new_data, ages = self.step(board.data, board.boundary, board.ages)
+
+        new_board = board.successor(new_data)
+        new_board.ages = ages
+        return new_board
+
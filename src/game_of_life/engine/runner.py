@@ -0,0 +1,145 @@
+"""
+This module implements a background runner of the game, which decouples the evolution from the display.
+A producer thread evolves the game ahead of the display into a bounded queue of frames,
+so a slow generation never blocks the caller, which only picks up the frames that are ready.
+Frames are released at the frequency of the game, so a display polling at that frequency shows every generation.
+NumPy releases the GIL in its kernels, so the producer thread evolves the board while the caller keeps running.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+
+from game_of_life.config import DEFAULT_RUNNER_BUFFER_SIZE
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+
+# seconds the producer waits for a free slot in the queue before checking whether it was stopped
+PUT_TIMEOUT = 0.05
+
+
+class Frame:
+    """ Generation computed by the runner. """
+
+    __slots__ = ("board", "generation", "finished")
+
+    def __init__(self, board: Board, generation: int, finished: bool) -> None:
+        """
+        Args:
+            board: board of the generation, it must not be modified
+            generation: index of the generation
+            finished: whether the game cannot run any further, this is the last frame
+        """
+
+        self.board = board
+        self.generation = generation
+        self.finished = finished
+
+
+class GameRunner:
+    """
+    Runner evolving the game by Game.run_step on a producer thread.
+    The producer computes the next generation right away, but releases its frame only game.time_delay
+    after the previous one, unless the generation took longer than that.
+    The queue holds at most buffer_size frames, the producer waits while it is full.
+    While the runner is running, the game belongs to the producer thread and must not be used by anyone else.
+    After stop the game holds the newest computed generation, which can be ahead of the last polled frame.
+    """
+
+    def __init__(self, game: Game, buffer_size: int = DEFAULT_RUNNER_BUFFER_SIZE) -> None:
+        """
+        Initialize the runner, the producer thread is started by start.
+
+        Args:
+            game: game to evolve
+            buffer_size: maximal number of frames computed ahead of the consumer
+        """
+
+        if buffer_size < 1:
+            raise ValueError(f"Buffer size must be at least 1, got {buffer_size}")
+
+        self.game = game
+        self.frames: queue.Queue[Frame] = queue.Queue(maxsize=buffer_size)
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(generation={self.game.i}, ready={self.frames.qsize()}, running={self.is_running()})"
+
+    def start(self) -> None:
+        """ Start evolving the game on the producer thread. """
+
+        if self._thread is not None:
+            raise RuntimeError("The runner was already started")
+
+        self._thread = threading.Thread(target=self._produce, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        """ Evolve the game and queue a frame of every generation until it finishes or the runner is stopped. """
+
+        try:
+            finished = False
+            release = time.monotonic()
+            while not finished and not self._stop.is_set():
+                finished = not self.game.run_step()
+
+                # a slow generation is released as soon as it is ready, without catching up by a burst of frames
+                release = max(release + self.game.time_delay, time.monotonic())
+                if self._stop.wait(release - time.monotonic()):
+                    break
+
+                self._put(Frame(self.game.board, self.game.i, finished))
+        except Exception as error:
+            # reported to the consumer by poll
+            self._error = error
+
+    def _put(self, frame: Frame) -> None:
+        """ Queue the frame, waiting while the queue is full, unless the runner is stopped. """
+
+        while not self._stop.is_set():
+            try:
+                self.frames.put(frame, timeout=PUT_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def is_running(self) -> bool:
+        """ Check if the producer thread is still evolving the game. """
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self) -> Frame | None:
+        """
+        Take the newest ready frame without waiting, the older ready frames are dropped.
+        The finished frame is the last one the producer computes, so it is always returned.
+
+        Returns:
+            the newest frame not taken yet, None if the producer did not compute a new one yet
+        """
+
+        frame = None
+        # only the frames ready now are taken, the producer may keep adding new ones meanwhile
+        for _ in range(self.frames.qsize()):
+            frame = self.frames.get_nowait()
+
+        if frame is None and self._error is not None:
+            raise self._error
+        return frame
+
+    def stop(self) -> None:
+        """ Stop the producer thread and drop the frames which were not taken, the game can be used again afterwards. """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
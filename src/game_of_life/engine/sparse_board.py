@@ -0,0 +1,271 @@
+"""
+This module implements an unbounded multi-player Game of Life board.
+Only the alive cells are stored, so memory and evolution time scale with the population.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from game_of_life.config import BOARD_DTYPE
+from game_of_life.engine.board import Board
+from game_of_life.engine.pattern import Pattern
+from game_of_life.utils.utils import select_dtype
+
+# coordinates are packed into a single int64 key, each shifted to be non-negative in 32 bits
+COORD_OFFSET = 1 << 30
+COORD_SHIFT = 32
+COORD_MASK = (1 << COORD_SHIFT) - 1
+
+NEIGHBOR_OFFSETS = np.array([(dr << COORD_SHIFT) + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc], dtype=np.int64)
+BOX_OFFSETS = np.array([(dr << COORD_SHIFT) + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)], dtype=np.int64)
+
+
+def encode(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Pack row and column coordinates into int64 keys.
+    Keys are ordered by row first and column second.
+
+    Args:
+        rows: row coordinates
+        cols: column coordinates
+    """
+
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    return ((rows + COORD_OFFSET) << COORD_SHIFT) + (cols + COORD_OFFSET)
+
+
+def decode(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Unpack int64 keys into row and column coordinates, inverse of encode.
+
+    Args:
+        keys: packed coordinates
+    """
+
+    return (keys >> COORD_SHIFT) - COORD_OFFSET, (keys & COORD_MASK) - COORD_OFFSET
+
+
+def count_keys(keys: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count how many of the given cells have each cell in their neighborhood defined by the offsets.
+
+    Args:
+        keys: packed coordinates of the cells
+        offsets: packed offsets of the neighborhood
+
+    Returns:
+        sorted unique keys of the touched cells and their counts
+    """
+
+    return np.unique((keys[None, :] + offsets[:, None]).ravel(), return_counts=True)
+
+
+def lookup(keys: np.ndarray, sorted_keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Look up the values of the keys in the sorted keys, missing keys get 0.
+
+    Args:
+        keys: keys to look up
+        sorted_keys: sorted keys with values
+        values: values of the sorted keys
+    """
+
+    if len(sorted_keys) == 0:
+        return np.zeros(len(keys), dtype=values.dtype)
+
+    index = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return np.where(sorted_keys[index] == keys, values[index], 0)
+
+
+class SparseBoard:
+    """
+    This class represents the multi-player Game of Life board on an infinite plane.
+    The board follows the same rules as Board, but there are no edges cells could die at.
+    """
+
+    @staticmethod
+    def new() -> SparseBoard:
+        """ Create an empty sparse board. """
+
+        return SparseBoard(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=BOARD_DTYPE))
+
+    @staticmethod
+    def from_board(board: Board, x0: int = 0, y0: int = 0) -> SparseBoard:
+        """
+        Create a sparse board from the alive cells of the given board.
+
+        Args:
+            board: board to convert
+            x0: x-coordinate where the left column of the board is placed
+            y0: y-coordinate where the top row of the board is placed
+        """
+
+        rows, cols = np.nonzero(board.data)
+        return SparseBoard(encode(rows + y0, cols + x0), board.data[rows, cols])
+
+    def __init__(self, keys: np.ndarray, players: np.ndarray) -> None:
+        """
+        Initialize the sparse board with the given cells.
+        Should not be used directly, used mainly for inner methods.
+
+        Args:
+            keys: sorted packed coordinates of the alive cells
+            players: player index of every alive cell
+        """
+
+        self.keys = keys
+        self.players = players
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(alive={self.count_alive_cells()}, bounding_box={self.bounding_box()})"
+
+    def copy(self) -> SparseBoard:
+        """ Returns a copy of the board. """
+
+        return SparseBoard(self.keys.copy(), self.players.copy())
+
+    def clear(self) -> None:
+        """ Clears the board by removing all alive cells. """
+
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.players = np.zeros(0, dtype=BOARD_DTYPE)
+
+    def cells(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Get the rows, columns and players of all alive cells. """
+
+        rows, cols = decode(self.keys)
+        return rows, cols, self.players
+
+    def get_cell(self, r: int, c: int) -> int:
+        """
+        Get the player index of the cell at the given position, 0 if it is dead.
+
+        Args:
+            r: row index of the cell
+            c: column index of the cell
+        """
+
+        return int(lookup(encode([r], [c]), self.keys, self.players)[0])
+
+    def toggle_cell(self, r: int, c: int, value: int = 1) -> None:
+        """
+        Toggle the cell at the given position.
+        If the cell is dead, it becomes alive and vice versa.
+
+        Args:
+            r: row index of the cell
+            c: column index of the cell
+            value: value to set the cell to (i.e. player index)
+        """
+
+        key = encode([r], [c])[0]
+        index = np.searchsorted(self.keys, key)
+
+        if index < len(self.keys) and self.keys[index] == key:
+            self.keys = np.delete(self.keys, index)
+            self.players = np.delete(self.players, index)
+        else:
+            self.keys = np.insert(self.keys, index, key)
+            self.players = np.insert(self.players, index, value)
+
+    def count_alive_cells(self) -> int:
+        """ Counts the number of alive cells on the board. """
+
+        return len(self.keys)
+
+    def is_equal(self, other: SparseBoard) -> bool:
+        """ Compare two boards for equality. """
+
+        return np.array_equal(self.keys, other.keys) and np.array_equal(self.players, other.players)
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """ Get the (top, left, bottom, right) inclusive bounds of the alive cells, None if the board is empty. """
+
+        if len(self.keys) == 0:
+            return None
+
+        rows, cols = decode(self.keys)
+        # keys are sorted by rows, so only the columns have to be searched
+        return int(rows[0]), int(cols.min()), int(rows[-1]), int(cols.max())
+
+    def place_pattern(self, pattern: Pattern, x0: int, y0: int, player: int = 1) -> None:
+        """
+        Place the pattern on the board at the given position, alive cells of the pattern overwrite existing ones.
+
+        Args:
+            pattern: pattern to place
+            x0: x-coordinate of the top-left corner of the pattern
+            y0: y-coordinate of the top-left corner of the pattern
+            player: player index to place the pattern for
+        """
+
+        rows, cols = np.nonzero(pattern.data)
+        keys = np.concatenate([self.keys, encode(rows + y0, cols + x0)])
+        dtype = np.promote_types(self.players.dtype, select_dtype(player))
+        players = np.concatenate([self.players, np.full(len(rows), player, dtype=dtype)])
+
+        # keep the last occurrence of every key, i.e. the pattern wins
+        reversed_keys = keys[::-1]
+        self.keys, index = np.unique(reversed_keys, return_index=True)
+        self.players = players[::-1][index]
+
+    def to_board(self, x0: int | None = None, y0: int | None = None, width: int | None = None, height: int | None = None) -> Board:
+        """
+        Export a window of the plane as a Board, by default the bounding box of the alive cells.
+
+        Args:
+            x0: x-coordinate of the left column of the window
+            y0: y-coordinate of the top row of the window
+            width: width of the window
+            height: height of the window
+        """
+
+        box = self.bounding_box() or (0, 0, 0, 0)
+        y0 = box[0] if y0 is None else y0
+        x0 = box[1] if x0 is None else x0
+        height = box[2] - y0 + 1 if height is None else height
+        width = box[3] - x0 + 1 if width is None else width
+
+        board = Board(np.zeros((height, width), dtype=self.players.dtype))
+        rows, cols = decode(self.keys)
+        rows, cols = rows - y0, cols - x0
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        board.data[rows[inside], cols[inside]] = self.players[inside]
+        return board
+
+    def evolve(self) -> SparseBoard:
+        """
+        Evolve the board to the next generation according to the extended rules of the Game of Life.
+        The rules are the same as in Board.evolve, only the cells touching the alive ones are considered.
+        """
+
+        if len(self.keys) == 0:
+            return self.copy()
+
+        candidates, neighbor_counts = count_keys(self.keys, NEIGHBOR_OFFSETS)
+        alive = lookup(candidates, self.keys, self.players) != 0
+        keys = candidates[(neighbor_counts == 3) | (alive & (neighbor_counts == 2))]
+
+        players = np.unique(self.players)
+        if len(players) == 1:
+            return SparseBoard(keys, np.full(len(keys), players[0], dtype=self.players.dtype))
+
+        # the majority player of the 3x3 neighborhood, a tie means mutual annihilation
+        best_player = np.zeros(len(keys), dtype=self.players.dtype)
+        best_count = np.zeros(len(keys), dtype=np.int64)
+        tie = np.zeros(len(keys), dtype=bool)
+
+        for player in players:
+            touched, counts = count_keys(self.keys[self.players == player], BOX_OFFSETS)
+            counts = lookup(keys, touched, counts)
+
+            greater = counts > best_count
+            equal = (counts == best_count) & (counts > 0)
+
+            best_player[greater] = player
+            tie = (tie | equal) & ~greater
+            np.maximum(best_count, counts, out=best_count)
+
+        return SparseBoard(keys[~tie], best_player[~tie])
@@ -0,0 +1,179 @@
+"""
+This module implements a streaming collector of per-player statistics of a running game.
+The statistics of every generation are written to preallocated ring buffers,
+which are flushed in chunks to an .npz or .csv file, so long runs need no boards and little memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import zipfile
+
+import numpy as np
+
+from game_of_life.config import DEFAULT_STATISTICS_CAPACITY
+from game_of_life.engine.board import Board
+
+STATISTICS_FIELDS = ("population", "births", "deaths", "captures")
+BOUNDING_BOX_FIELDS = ("top", "left", "bottom", "right")
+
+
+def bounding_box(arr: np.ndarray) -> tuple[int, int, int, int]:
+    """
+    Get the (top, left, bottom, right) inclusive bounds of the alive cells, all -1 if there are none.
+    Only the rows between the top and bottom alive rows are scanned for the columns.
+
+    Args:
+        arr: 2D numpy array representing the board
+    """
+
+    rows = np.flatnonzero(arr.any(axis=1))
+    if len(rows) == 0:
+        return -1, -1, -1, -1
+
+    cols = np.flatnonzero(arr[rows[0]:rows[-1] + 1].any(axis=0))
+    return int(rows[0]), int(cols[0]), int(rows[-1]), int(cols[-1])
+
+
+def load_statistics(path: str) -> dict[str, np.ndarray]:
+    """
+    Load the statistics flushed to an .npz file, the chunks are concatenated.
+
+    Args:
+        path: path to the .npz file
+
+    Returns:
+        dictionary with the generation, per-player statistics and bounding box arrays
+    """
+
+    with np.load(path) as chunks:
+        names = sorted(chunks.files)
+        fields = sorted({name.rsplit("_", 1)[0] for name in names})
+        return {field: np.concatenate([chunks[name] for name in names if name.rsplit("_", 1)[0] == field]) for field in fields}
+
+
+class StatisticsCollector:
+    """
+    Collector of per-generation statistics of the players, fed by Game.next_step and Game.run_step.
+    Population, births and deaths are read from the transitions of the board, which are counted over the cells
+    changed since the parent board, captures are cells taken over from another player,
+    and the bounding box covers all alive cells.
+    Without a path the buffers keep the last capacity generations, with a path every full buffer is flushed.
+    """
+
+    def __init__(self, players: int, capacity: int = DEFAULT_STATISTICS_CAPACITY, path: str | None = None) -> None:
+        """
+        Allocate the ring buffers.
+
+        Args:
+            players: number of players to collect the statistics for, players 1 to players are tracked
+            capacity: number of generations held in memory before a flush
+            path: .npz or .csv file the statistics are flushed to, None to only keep them in memory
+        """
+
+        if path is not None and os.path.splitext(path)[1] not in (".npz", ".csv"):
+            raise ValueError(f"Statistics can be flushed only to .npz or .csv files, got {path}")
+
+        self.players = players
+        self.capacity = capacity
+        self.path = path
+
+        self.generations = np.zeros(capacity, dtype=np.int64)
+        self.buffers = {field: np.zeros((capacity, players), dtype=np.int64) for field in STATISTICS_FIELDS}
+        self.bounding_boxes = np.zeros((capacity, len(BOUNDING_BOX_FIELDS)), dtype=np.int32)
+
+        # number of recorded generations, the next one is written at size % capacity
+        self.size = 0
+        self.flushed = 0
+        self.chunks = 0
+
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(players={self.players}, recorded={self.size}, flushed={self.flushed})"
+
+    def __len__(self) -> int:
+        return min(self.size - self.flushed, self.capacity)
+
+    def _player_values(self, values: np.ndarray) -> np.ndarray:
+        """ Cut or pad per-player values indexed from player 0 to the tracked players. """
+
+        values = values[1:self.players + 1]
+        return np.pad(values, (0, self.players - len(values)))
+
+    def record(self, board: Board, generation: int) -> None:
+        """
+        Record the statistics of the board.
+
+        Args:
+            board: board of the generation
+            generation: index of the generation
+        """
+
+        index = self.size % self.capacity
+        self.generations[index] = generation
+
+        self.buffers["population"][index] = self._player_values(board.player_counts())
+
+        transitions = board.transitions
+        if transitions is None:
+            for field in ("births", "deaths", "captures"):
+                self.buffers[field][index] = 0
+        else:
+            self.buffers["births"][index] = self._player_values(transitions[0])
+            self.buffers["deaths"][index] = self._player_values(transitions[:, 0])
+            # cells coming from any alive player except the new owner itself
+            captures = transitions[1:].sum(axis=0) - np.diag(transitions)
+            captures[0] = 0
+            self.buffers["captures"][index] = self._player_values(captures)
+
+        self.bounding_boxes[index] = bounding_box(board.data)
+
+        self.size += 1
+        if self.path is not None and self.size - self.flushed == self.capacity:
+            self.flush()
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """ Get the generations held in memory, ordered from the oldest one. """
+
+        start = max(self.flushed, self.size - self.capacity)
+        order = np.arange(start, self.size) % self.capacity
+
+        arrays = {"generation": self.generations[order], "bounding_box": self.bounding_boxes[order]}
+        arrays.update({field: buffer[order] for field, buffer in self.buffers.items()})
+        return arrays
+
+    def flush(self) -> None:
+        """ Write the generations held in memory to the file and empty the buffers. """
+
+        if self.path is None or len(self) == 0:
+            return
+
+        arrays = self.to_arrays()
+
+        if self.path.endswith(".npz"):
+            # every chunk is a separate member of the zip archive, so nothing has to be rewritten
+            with zipfile.ZipFile(self.path, mode="a") as archive:
+                for name, array in arrays.items():
+                    with archive.open(f"{name}_{self.chunks:06d}.npy", mode="w") as file:
+                        np.lib.format.write_array(file, np.ascontiguousarray(array))
+        else:
+            with open(self.path, "a", newline="") as file:
+                writer = csv.writer(file)
+                if self.chunks == 0:
+                    header = ["generation"]
+                    header += [f"{field}_{player}" for field in STATISTICS_FIELDS for player in range(1, self.players + 1)]
+                    writer.writerow(header + list(BOUNDING_BOX_FIELDS))
+
+                columns = [arrays["generation"][:, None]] + [arrays[field] for field in STATISTICS_FIELDS] + [arrays["bounding_box"]]
+                writer.writerows(np.hstack(columns).tolist())
+
+        self.chunks += 1
+        self.flushed = self.size
+
+    def close(self) -> None:
+        """ Flush the remaining generations. """
+
+        self.flush()
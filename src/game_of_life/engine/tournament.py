@@ -0,0 +1,302 @@
+"""
+This module implements tournaments between the patterns of the library on the multi-player board.
+Every match places one pattern per player on an empty board and lets them fight by the majority rule.
+Matches are spread over a pool of worker processes and every result is appended to a JSON lines file
+as soon as it is known, so an interrupted tournament resumes with the matches it has not played yet.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from game_of_life.config import (
+    DEFAULT_BATCH_BOARD_HEIGHT,
+    DEFAULT_BATCH_BOARD_WIDTH,
+    DEFAULT_BOUNDARY,
+    DEFAULT_RULE,
+    DEFAULT_SCORING,
+    DEFAULT_STEPS,
+    DEFAULT_TOURNAMENT_PLAYERS,
+    SCORINGS,
+)
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.pattern import Pattern
+from game_of_life.engine.rule import Rule
+
+
+def place_players(patterns: list[Pattern], width: int, height: int, boundary: str = DEFAULT_BOUNDARY) -> Board:
+    """
+    Create an empty board split into vertical strips of equal width, one per pattern,
+    and place the i-th pattern in the center of the i-th strip for player i + 1.
+
+    Args:
+        patterns: patterns of the players in the order of the players
+        width: width of the board
+        height: height of the board
+        boundary: "fill" treats cells outside of the board as dead, "wrap" wraps the board around as a torus
+    """
+
+    board = Board.new(width, height, boundary=boundary, players=len(patterns))
+    strip = width // len(patterns)
+
+    for i, pattern in enumerate(patterns):
+        x0, y0 = i * strip + (strip - pattern.width) // 2, (height - pattern.height) // 2
+        if pattern.width > strip or not board.can_place_pattern(pattern, x0, y0, player=i + 1):
+            raise ValueError(f"Pattern {pattern.name} of size {pattern.width}x{pattern.height} does not fit a {strip}x{height} strip")
+
+        board.place_pattern(pattern, x0, y0, player=i + 1)
+
+    return board
+
+
+def play_match(
+    patterns: list[Pattern],
+    steps: int = DEFAULT_STEPS,
+    rule: str | Rule = DEFAULT_RULE,
+    width: int = DEFAULT_BATCH_BOARD_WIDTH,
+    height: int = DEFAULT_BATCH_BOARD_HEIGHT,
+    boundary: str = DEFAULT_BOUNDARY,
+) -> dict[str, list]:
+    """
+    Play one match of the given patterns for the number of steps.
+    Once the board repeats an earlier generation, the populations of the remaining generations
+    are taken from the cycle instead of being evolved, and an empty board stays empty.
+
+    Args:
+        patterns: patterns of the players in the order of the players
+        steps: number of generations of the match
+        rule: rule or rulestring the board evolves by
+        width: width of the board
+        height: height of the board
+        boundary: boundary of the board
+
+    Returns:
+        the pattern names, the final and the integrated population of every player
+    """
+
+    board = place_players(patterns, width, height, boundary)
+    players = len(patterns)
+
+    # population of every player (index 0 are the dead cells) in every generation
+    counts = np.zeros((steps + 1, players + 1), dtype=np.int64)
+    game = Game(board, steps=steps, rule=rule, stop_on_cycle=True)
+
+    while True:
+        population = game.board.player_counts()[:players + 1]
+        counts[game.i, :len(population)] = population
+        if not game.run_step():
+            break
+
+    # generation i + k of a cycle starting at the transient equals generation transient + k % period
+    if game.found_cycle() and game.i < steps:
+        remaining = np.arange(1, steps - game.i + 1)
+        counts[game.i + 1:] = counts[game.transient + remaining % game.period]
+
+    return {
+        "patterns": [pattern.name for pattern in patterns],
+        "final": counts[-1, 1:].tolist(),
+        "integrated": counts[:, 1:].sum(axis=0).tolist(),
+    }
+
+
+def decide_winner(scores: list[int]) -> int:
+    """
+    Decide the winner of a match by the scores of the players.
+
+    Args:
+        scores: score of every player, starting with player 1
+
+    Returns:
+        the player with the single highest score, 0 for a draw
+    """
+
+    best = max(scores)
+    leaders = [player for player, score in enumerate(scores, start=1) if score == best]
+    return leaders[0] if len(leaders) == 1 else 0
+
+
+def _play_matchup(names: tuple[str, ...], library: dict[str, Pattern], options: dict) -> dict[str, list]:
+    """ Play the matchup of the named patterns in a worker process. """
+
+    return play_match([library[name] for name in names], **options)
+
+
+class Tournament:
+    """
+    Tournament in which every ordered selection of distinct patterns plays one match, so every pattern
+    plays every other pattern from every starting position.
+    Results are stored in a JSON lines file, the first line holds the settings and every other line one match.
+    """
+
+    def __init__(
+        self,
+        patterns: list[Pattern],
+        path: str,
+        players: int = DEFAULT_TOURNAMENT_PLAYERS,
+        steps: int = DEFAULT_STEPS,
+        rule: str | Rule = DEFAULT_RULE,
+        scoring: str = DEFAULT_SCORING,
+        width: int = DEFAULT_BATCH_BOARD_WIDTH,
+        height: int = DEFAULT_BATCH_BOARD_HEIGHT,
+        boundary: str = DEFAULT_BOUNDARY,
+    ) -> None:
+        """
+        Initialize the tournament, no matches are played until run.
+
+        Args:
+            patterns: pattern library, the names of the patterns must be unique
+            path: JSON lines file the results are stored in and resumed from
+            players: number of players in every match
+            steps: number of generations of every match
+            rule: rule or rulestring the boards evolve by
+            scoring: "final" wins by the population at the last generation, "integrated" by the population summed over all generations
+            width: width of the boards
+            height: height of the boards
+            boundary: boundary of the boards
+        """
+
+        if scoring not in SCORINGS:
+            raise ValueError(f"Unknown scoring {scoring}, expected one of {SCORINGS}")
+        if players < 2:
+            raise ValueError(f"Tournament needs at least 2 players, got {players}")
+
+        self.library = {pattern.name: pattern for pattern in patterns}
+        if len(self.library) != len(patterns):
+            raise ValueError("Pattern names in a tournament must be unique")
+
+        self.path = path
+        self.players = players
+        self.scoring = scoring
+        self.options = {
+            "steps": steps,
+            "rule": str(Rule.parse(rule) if isinstance(rule, str) else rule),
+            "width": width,
+            "height": height,
+            "boundary": boundary,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(patterns={len(self.library)}, players={self.players}, scoring={self.scoring})"
+
+    @property
+    def settings(self) -> dict[str, str | int]:
+        """ Settings which decide the outcome of a match, a results file can only be resumed with the same ones. """
+
+        return {"players": self.players, "scoring": self.scoring, **self.options}
+
+    def matchups(self) -> list[tuple[str, ...]]:
+        """ Get the pattern names of every match, in the order of the players. """
+
+        return list(itertools.permutations(self.library, self.players))
+
+    def load_results(self) -> list[dict]:
+        """
+        Load the results stored by earlier runs.
+        A line cut off by an interrupted run is removed from the file.
+
+        Returns:
+            stored results of the matches
+        """
+
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, "rb") as file:
+            lines = file.read().split(b"\n")
+
+        # everything after the last newline was not written completely
+        if lines[-1]:
+            os.truncate(self.path, os.path.getsize(self.path) - len(lines[-1]))
+
+        records = [json.loads(line) for line in lines[:-1] if line.strip()]
+        if not records:
+            return []
+
+        if records[0].get("settings") != self.settings:
+            raise ValueError(f"Results in {self.path} were played with {records[0].get('settings')}, not {self.settings}")
+
+        return records[1:]
+
+    def pending(self, results: list[dict]) -> list[tuple[str, ...]]:
+        """
+        Get the matchups which have no result yet.
+
+        Args:
+            results: results of the played matches
+        """
+
+        played = {tuple(result["patterns"]) for result in results}
+        return [matchup for matchup in self.matchups() if matchup not in played]
+
+    def run(self, processes: int | None = 1) -> list[dict]:
+        """
+        Play all matches without a stored result and append their results to the file.
+
+        Args:
+            processes: number of worker processes, None for the number of CPUs
+
+        Returns:
+            results of all matches, including the ones stored by earlier runs
+        """
+
+        results = self.load_results()
+        pending = self.pending(results)
+
+        with open(self.path, "a") as file:
+            if os.path.getsize(self.path) == 0:
+                file.write(json.dumps({"settings": self.settings}) + "\n")
+                file.flush()
+
+            play = partial(_play_matchup, library=self.library, options=self.options)
+            processes = processes or os.cpu_count()
+
+            if processes == 1 or len(pending) <= 1:
+                played = map(play, pending)
+                executor = None
+            else:
+                executor = ProcessPoolExecutor(max_workers=processes)
+                played = executor.map(play, pending, chunksize=max(1, len(pending) // (4 * processes)))
+
+            try:
+                for result in played:
+                    result["winner"] = decide_winner(result[self.scoring])
+                    file.write(json.dumps(result) + "\n")
+                    file.flush()
+                    results.append(result)
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+        return results
+
+    def standings(self, results: list[dict]) -> list[dict]:
+        """
+        Count the wins, draws and losses of every pattern.
+
+        Args:
+            results: results of the played matches
+
+        Returns:
+            one row per pattern, ordered by the wins and then the draws
+        """
+
+        rows = {name: {"pattern": name, "wins": 0, "draws": 0, "losses": 0} for name in self.library}
+
+        for result in results:
+            for player, name in enumerate(result["patterns"], start=1):
+                row = rows.setdefault(name, {"pattern": name, "wins": 0, "draws": 0, "losses": 0})
+                if result["winner"] == 0:
+                    row["draws"] += 1
+                elif result["winner"] == player:
+                    row["wins"] += 1
+                else:
+                    row["losses"] += 1
+
+        return sorted(rows.values(), key=lambda row: (-row["wins"], -row["draws"], row["pattern"]))
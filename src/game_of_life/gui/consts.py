@@ -20,3 +20,6 @@ COLORS = [
     (1, 0.6, 0.2, 1),  # player 2 (index 2)
     (0.2, 1, 0.6, 1),  # player 3 (index 3)
 ]
+
+# boards with at least this many cells are drawn as a single texture instead of one widget per cell
+TEXTURE_VIEW_MIN_CELLS = 50 * 50
@@ -7,10 +7,19 @@ from kivy.uix.screenmanager import Screen
 from game_of_life.config import DEFAULT_FREQUENCY, DEFAULT_STEPS
 from game_of_life.engine.board import Board
 from game_of_life.engine.game import Game
-from game_of_life.gui.consts import LABEL_FONT_SIZE, SIMULATION_FINISHED, SIMULATION_INITIALIZED, SIMULATION_PAUSED, SIMULATION_RUNNING
+from game_of_life.engine.runner import GameRunner
+from game_of_life.gui.consts import (
+    LABEL_FONT_SIZE,
+    SIMULATION_FINISHED,
+    SIMULATION_INITIALIZED,
+    SIMULATION_PAUSED,
+    SIMULATION_RUNNING,
+    TEXTURE_VIEW_MIN_CELLS,
+)
 from game_of_life.gui.layouts.button_row_layout import ButtonRowLayout
 from game_of_life.gui.layouts.split_layout import SplitLayout
 from game_of_life.gui.widgets.board_game_view import BoardGameView
+from game_of_life.gui.widgets.board_texture_view import BoardTextureView
 from game_of_life.gui.widgets.centered_button import CenteredButton
 from game_of_life.gui.widgets.slider_input import SliderInput
 
@@ -28,6 +37,7 @@ class SimulationScreen(Screen):
         self.board = None
         self.game_model = None
         self.board_view = None
+        self.runner = None
 
         self.layout = SplitLayout()
 
@@ -74,6 +84,16 @@ class SimulationScreen(Screen):
         )
         self.layout.actions_container.add_widget(self.steps_setter)
 
+        self.generation_setter = SliderInput(
+            label='Generation',
+            low=0,
+            high=DEFAULT_STEPS,
+            step=1,
+            initial_value=0,
+            update_function=self.seek_generation,
+        )
+        self.layout.actions_container.add_widget(self.generation_setter)
+
         self.run_button = CenteredButton(
             text='Run',
             size_hint_y=1,
@@ -107,14 +127,20 @@ class SimulationScreen(Screen):
 
         self.back_label = back_label
         self.board = board
+        # the checkpoints of the game keep seeking with the generation slider fast
         self.game_model = Game(board=self.board)
-        self.board_view = BoardGameView(model=self.board)
+        # large boards would need too many cell widgets, they are drawn as a texture
+        if self.board.height * self.board.width >= TEXTURE_VIEW_MIN_CELLS:
+            self.board_view = BoardTextureView(model=self.board)
+        else:
+            self.board_view = BoardGameView(model=self.board)
         self.layout.grid_container.add_widget(self.board_view)
         self.status_label.text = SIMULATION_INITIALIZED
 
     def reset(self, _):
         """ Reset the simulation screen to not contain information from the last run. """
 
+        self._stop_runner()
         self.previous_step_button.disabled = True
         self.layout.grid_container.clear_widgets()
         self.frequency_setter.slider.value = DEFAULT_FREQUENCY
@@ -122,12 +148,16 @@ class SimulationScreen(Screen):
         self.status_label.text = SIMULATION_INITIALIZED
         self.board = None
         self.game_model = None
+        self.generation_setter.slider.max = DEFAULT_STEPS
+        self.generation_setter.slider.value = 0
 
     def restart(self, _):
         """ Restart the simulation to be in the initial state. """
 
+        self._stop_runner()
         self.game_model.restart()
         self.board_view.reflect_model(self.game_model.board)
+        self.sync_generation()
         self.toggle_buttons(disabled=False)
         self.check_step_buttons()
         self.status_label.text = SIMULATION_INITIALIZED
@@ -142,31 +172,70 @@ class SimulationScreen(Screen):
         self.restart_button.disabled = disabled
         self.frequency_setter.slider.disabled = disabled
         self.steps_setter.slider.disabled = disabled
+        self.generation_setter.slider.disabled = disabled
 
-    def format_status(self, status: str):
+    def format_status(self, status: str, generation: int | None = None):
         """ Format the status label to display the current step and total steps. """
 
-        return f'{status} ({self.game_model.i}/{self.game_model.steps})'
+        generation = self.game_model.i if generation is None else generation
+        return f'{status} ({generation}/{self.game_model.steps})'
 
     def run(self, _):
-        """ Run the simulation using the Kivy Clock. """
+        """
+        Run the simulation, or pause it if it is running.
+        The generations are computed ahead by a GameRunner thread, the Kivy Clock only displays them.
+        """
+
+        if self.runner is not None:
+            self.pause()
+            return
 
         self.status_label.text = self.format_status(SIMULATION_RUNNING)
         self.toggle_buttons(disabled=True)
+        self.run_button.disabled = False
+        self.run_button.text = 'Pause'
 
+        self.runner = GameRunner(self.game_model)
+        self.runner.start()
         Clock.schedule_interval(self._run_step, self.game_model.time_delay)
 
     def _run_step(self, _):
-        """ Run a single step inside the Clock schedule function. """
-        output = self.game_model.run_step()
-        self.board_view.reflect_model(self.game_model.board)
-        self.status_label.text = self.format_status(SIMULATION_RUNNING)
+        """ Display the newest generation computed by the runner inside the Clock schedule function, skipping the older ones. """
+
+        frame = self.runner.poll()
+        if frame is None:
+            # the generation is not computed yet, keep the current one
+            return True
 
-        if not output:
+        self.board_view.reflect_model(frame.board)
+        self.sync_generation(frame.generation)
+        self.status_label.text = self.format_status(SIMULATION_RUNNING, frame.generation)
+
+        if frame.finished:
+            self._stop_runner()
+            self.run_button.disabled = True
             self.restart_button.disabled = False
             self.status_label.text = self.format_status(SIMULATION_FINISHED)
 
-        return output
+        return not frame.finished
+
+    def _stop_runner(self):
+        """ Stop the runner and the Clock schedule, the game holds the newest computed generation afterwards. """
+
+        Clock.unschedule(self._run_step)
+        if self.runner is not None:
+            self.runner.stop()
+            self.runner = None
+        self.run_button.text = 'Run'
+
+    def pause(self):
+        """ Pause the running simulation at the newest computed generation. """
+
+        self._stop_runner()
+        self.board_view.reflect_model(self.game_model.board)
+        self.sync_generation()
+        self.toggle_buttons(disabled=False)
+        self.check_step_buttons()
 
     def _update_left_column_width(self, instance, value):
         """ Update the width of the left column to be the same as its height. """
@@ -197,6 +266,7 @@ class SimulationScreen(Screen):
             return
         self.game_model.previous_step()
         self.board_view.reflect_model(self.game_model.board)
+        self.sync_generation()
 
         self.status_label.text = self.format_status(SIMULATION_PAUSED)
         self.check_step_buttons()
@@ -208,6 +278,7 @@ class SimulationScreen(Screen):
             return
         self.game_model.next_step()
         self.board_view.reflect_model(self.game_model.board)
+        self.sync_generation()
         self.status_label.text = self.format_status(SIMULATION_PAUSED)
 
         self.check_step_buttons()
@@ -221,3 +292,21 @@ class SimulationScreen(Screen):
         """ Update the number of steps to run the simulation for. """
 
         self.game_model.set_steps(value)
+        self.generation_setter.slider.max = max(value, self.game_model.i)
+
+    def sync_generation(self, generation: int | None = None):
+        """ Move the generation slider to the current generation of the game, or the given one, without seeking. """
+
+        generation = self.game_model.i if generation is None else generation
+        self.generation_setter.slider.max = max(self.game_model.steps, generation)
+        self.generation_setter.slider.value = generation
+
+    def seek_generation(self, _, value):
+        """ Move the simulation to the generation selected by the slider, see Game.seek. """
+
+        if self.game_model is None or self.runner is not None or int(value) == self.game_model.i:
+            return
+
+        self.game_model.seek(int(value))
+        self.board_view.reflect_model(self.game_model.board)
+        self.check_step_buttons()
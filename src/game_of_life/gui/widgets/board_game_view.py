@@ -1,14 +1,18 @@
 """ Module for the board game view widget. """
 
+import numpy as np
 from kivy.uix.gridlayout import GridLayout
 
 from game_of_life.engine.board import Board
+from game_of_life.engine.history import diff_cells
 from game_of_life.gui.widgets.cell_view import CellView
 
 
 class BoardGameView(GridLayout):
     """ Display a square board as a grid of non-interactive cells. """
 
+    cell_class = CellView
+
     def __init__(self, model: Board, **kwargs):
         super().__init__(**kwargs)
 
@@ -19,19 +23,26 @@ class BoardGameView(GridLayout):
         self.spacing = 1
         self.cells = []
 
+        # values shown by the cells, in the same row-major order as the cells
+        self.values = np.array(model.data, dtype=np.uint32)
+
         for r in range(model.height):
             for c in range(model.width):
-                cell = CellView(row=r, col=c, value=model.data[r, c])
+                cell = self.cell_class(row=r, col=c, value=int(model.data[r, c]))
                 self.cells.append(cell)
                 self.add_widget(cell)
 
     def reflect_model(self, model: Board):
         """
         Update the display of the board based on the underlying model.
+        Only the cells which differ from the displayed values are updated.
 
         Args:
             model: the model to reflect
         """
 
-        for cell in self.cells:
-            cell.update(model.data[cell.row, cell.col])
+        indices, values = diff_cells(self.values, model.data)
+        self.values.ravel()[indices] = values
+
+        for index, value in zip(indices.tolist(), values.tolist()):
+            self.cells[index].update(value)
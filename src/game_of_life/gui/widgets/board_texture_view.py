@@ -0,0 +1,73 @@
+""" Module for the board texture view widget. """
+
+import numpy as np
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
+from kivy.uix.widget import Widget
+
+from game_of_life.engine.board import Board
+from game_of_life.gui.consts import COLORS
+from game_of_life.visualization.texture import board_to_rgba, build_palette
+
+
+class BoardTextureView(Widget):
+    """
+    Display a board as a single texture with one pixel per cell, instead of one widget per cell as in BoardGameView.
+    The texture is scaled up with nearest-neighbor filtering, so the cells stay sharp squares.
+    """
+
+    def __init__(self, model: Board, **kwargs):
+        super().__init__(**kwargs)
+
+        self.size_hint = (1, 1)
+        self.palette = build_palette(COLORS)
+
+        self.texture = None
+        self.pixels = None
+
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self.rect = Rectangle(pos=self.pos, size=self.size)
+
+        self.bind(pos=self._update_rect, size=self._update_rect)
+
+        self.reflect_model(model)
+
+    def _create_texture(self, height: int, width: int) -> None:
+        """ Create the texture and the pixel buffer for a board of the given size. """
+
+        self.texture = Texture.create(size=(width, height), colorfmt='rgba', bufferfmt='ubyte')
+        self.texture.mag_filter = 'nearest'
+        self.texture.min_filter = 'nearest'
+        self.pixels = np.empty((height, width, 4), dtype=np.uint8)
+
+        self.rect.texture = self.texture
+        self._update_rect(None, None)
+
+    def reflect_model(self, model: Board):
+        """
+        Update the display of the board based on the underlying model.
+
+        Args:
+            model: the model to reflect
+        """
+
+        if self.pixels is None or self.pixels.shape[:2] != model.data.shape:
+            self._create_texture(model.height, model.width)
+
+        board_to_rgba(model.data, self.palette, out=self.pixels)
+        self.texture.blit_buffer(self.pixels.reshape(-1), colorfmt='rgba', bufferfmt='ubyte')
+        self.canvas.ask_update()
+
+    def _update_rect(self, _, __):
+        """ Fit the texture into the widget so that the cells are square, centered in the free space. """
+
+        if self.pixels is None:
+            return
+
+        rows, cols = self.pixels.shape[:2]
+        side = min(self.width / cols, self.height / rows)
+        width, height = side * cols, side * rows
+
+        self.rect.size = (width, height)
+        self.rect.pos = (self.x + (self.width - width) / 2, self.y + (self.height - height) / 2)
@@ -1,8 +1,10 @@
 """ Module for the board view widget. """
 
+import numpy as np
 from kivy.uix.gridlayout import GridLayout
 
 from game_of_life.engine.board import Board
+from game_of_life.engine.history import diff_cells
 from game_of_life.gui.widgets.toggle_cell_view import ToggleCellView
 
 
@@ -22,6 +24,9 @@ class BoardView(GridLayout):
 
         self.buttons = []
 
+        # values shown by the buttons, in the same row-major order as the buttons
+        self.values = np.zeros((self.rows, self.cols), dtype=np.uint32)
+
         self.bind(size=self._update_size)
 
         for r in range(self.rows):
@@ -35,7 +40,10 @@ class BoardView(GridLayout):
         """ Update the underlying model when a cell is toggled. """
 
         self.model.toggle_cell(instance.row, instance.col, value=self.player)
-        instance.update(self.model.data[instance.row, instance.col])
+
+        value = int(self.model.data[instance.row, instance.col])
+        self.values[instance.row, instance.col] = value
+        instance.update(value)
 
     def update_player(self, player):
         """ Update the player for the board as which the cells are toggled. """
@@ -43,10 +51,16 @@ class BoardView(GridLayout):
         self.player = player
 
     def reflect_model(self, *_):
-        """ Update the display of the board based on the underlying model. """
+        """
+        Update the display of the board based on the underlying model.
+        Only the buttons which differ from the displayed values are updated.
+        """
+
+        indices, values = diff_cells(self.values, self.model.data)
+        self.values.ravel()[indices] = values
 
-        for button in self.buttons:
-            button.update(self.model.data[button.row, button.col])
+        for index, value in zip(indices.tolist(), values.tolist()):
+            self.buttons[index].update(value)
 
     def _update_size(self, _, __):
         """ Update the size so that the cells are square. """
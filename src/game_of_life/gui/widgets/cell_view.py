@@ -11,6 +11,7 @@ class CellView(Widget):
     CellView widget is non-interactive cell on a board.
     It is used to display the state of a cell either in a pattern or during a simulation.
     The user cannot toggle the state as in ToggleCellView.
+    The canvas holds one Color and one Rectangle for the whole life of the cell, updates only change the color in place.
     """
 
     def __init__(self, row: int, col: int, value: int, **kwargs):
@@ -19,17 +20,12 @@ class CellView(Widget):
         self.col = col
         self.size_hint = (1, 1)
 
-        self._change_color(value)
-        self.rect = Rectangle(pos=self.pos, size=self.size)
-        self.canvas.before.add(self.rect)
+        with self.canvas.before:
+            self.color = Color(*COLORS[value])
+            self.rect = Rectangle(pos=self.pos, size=self.size)
 
         self.bind(pos=self._update_rect, size=self._update_rect)
 
-    def _change_color(self, value: int) -> None:
-        """ Change the color of the cell based on the value. """
-
-        self.canvas.before.add(Color(*COLORS[value]))
-
     def _update_rect(self, _, __):
         """ Update the underyling rectangle on the canvas. """
         self.rect.pos = self.pos
@@ -38,6 +34,4 @@ class CellView(Widget):
     def update(self, value: int) -> None:
         """ Update the color of the cell based on the value. """
 
-        self.canvas.before.clear()
-        self._change_color(value)
-        self.canvas.before.add(self.rect)
+        self.color.rgba = COLORS[value]
@@ -187,7 +187,7 @@ class PatternSelector(BoxLayout):
 
         for row in range(pattern.height):
             for col in range(pattern.width):
-                self.grid.add_widget(CellView(row, col, self.current_pattern.data[row, col] * player))
+                self.grid.add_widget(CellView(row, col, int(self.current_pattern.data[row, col]) * player))
 
         self.label.text = pattern.name
 
@@ -32,7 +32,7 @@ class PatternView(BoxLayout):
 
         for row in range(pattern.height):
             for col in range(pattern.width):
-                self.grid.add_widget(CellView(row, col, self.pattern.data[row, col]))
+                self.grid.add_widget(CellView(row, col, int(self.pattern.data[row, col])))
 
         self.add_widget(self.grid)
 
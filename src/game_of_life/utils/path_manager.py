@@ -7,7 +7,7 @@ from game_of_life.config import DB_ROOT, DB_BOARD_DIR, DB_PATTERN_DIR
 
 class PathManager:
     """
-    Class abstraction to wrap the creation and reading of paths to pattern database.
+    Class abstraction to wrap the creation and reading of paths to pattern and board database.
     """
 
     def __init__(self, root: str = '.') -> None:
@@ -67,3 +67,21 @@ class PathManager:
         """
 
         return self.db_pattern_dir.glob("*.pkl")
+
+    def get_board_path(self, board_name: str) -> str:
+        """
+        Get the path to the board with the given name in the board database.
+        Boards are stored as plain .npy arrays of player indices.
+
+        Args:
+            board_name: the name of the board
+        """
+
+        return self._extend(self.db_board_dir / board_name.lower().replace(" ", "_"), extension=".npy")
+
+    def get_all_boards(self) -> list[str]:
+        """
+        Get all the boards in the board database.
+        """
+
+        return self.db_board_dir.glob("*.npy")
@@ -2,6 +2,8 @@
 
 import numpy as np
 
+from game_of_life.config import PLAYER_DTYPES
+
 
 def crop_box(arr: np.ndarray) -> np.ndarray:
     """
@@ -18,12 +20,40 @@ def crop_box(arr: np.ndarray) -> np.ndarray:
 def fill_nonzero(arr: np.ndarray, fill_value: int = 1) -> np.ndarray:
     """
     Fill all non-zero elements with the given fill value.
+    The dtype of the array is kept if the fill value fits into it.
 
     Args:
         arr: the array to fill
     """
 
-    return np.where(arr != 0, fill_value, 0)
+    dtype = np.result_type(arr.dtype, np.min_scalar_type(fill_value))
+    return np.where(arr != 0, fill_value, 0).astype(dtype, copy=False)
+
+
+def select_dtype(max_player: int) -> np.dtype:
+    """
+    Select the narrowest dtype which can hold the player indices up to the given one.
+
+    Args:
+        max_player: the highest player index to store
+    """
+
+    for dtype in PLAYER_DTYPES:
+        if max_player <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    raise ValueError(f"Player index {max_player} does not fit into any of {PLAYER_DTYPES}")
+
+
+def compact(arr: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of player indices to the narrowest dtype which can hold them.
+
+    Args:
+        arr: the array to convert
+    """
+
+    return arr.astype(select_dtype(int(arr.max()) if arr.size else 0), copy=False)
 
 
 def keep_only_number(arr: np.ndarray, number: int) -> np.ndarray:
@@ -50,6 +80,19 @@ def get_players(arr: np.ndarray) -> list[int]:
     return unique[unique != 0]
 
 
+def count_players(arr: np.ndarray) -> np.ndarray:
+    """
+    Get the players on a board of non-negative player indices, same as get_players.
+    The cells are counted instead of sorted, so it is linear in the size of the board.
+
+    Args:
+        arr: the array where players are counted
+    """
+
+    players = np.flatnonzero(np.bincount(arr.ravel()))
+    return players[players != 0]
+
+
 def safe_8_neighborhood(arr: np.ndarray, r: int, c: int) -> np.ndarray:
     """
     Get the 8-neighborhood of (r, c) in arr but check the bounds of the array
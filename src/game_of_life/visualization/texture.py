@@ -0,0 +1,42 @@
+""" Module for converting the Game of Life board into RGBA pixels, one pixel per cell. """
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+def build_palette(colors: Sequence[tuple[float, float, float, float]]) -> np.ndarray:
+    """
+    Convert RGBA colors with channels in [0, 1] to a palette of bytes.
+
+    Args:
+        colors: color of the dead cells followed by the colors of the players
+
+    Returns:
+        array of shape (len(colors), 4) and dtype uint8
+    """
+
+    return np.round(np.clip(np.asarray(colors, dtype=np.float64), 0, 1) * 255).astype(np.uint8)
+
+
+def board_to_rgba(arr: np.ndarray, palette: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Map every cell of the board to the palette color of its player with a single lookup.
+    The rows are flipped, because textures start at the bottom row while boards start at the top row.
+    Players without their own color reuse the player colors in a cycle.
+
+    Args:
+        arr: 2D numpy array representing the board
+        palette: palette from build_palette
+        out: array of shape (height, width, 4) and dtype uint8 to write the pixels to
+
+    Returns:
+        array of shape (height, width, 4) and dtype uint8 with the pixels
+    """
+
+    if arr.size and arr.max() >= len(palette):
+        arr = np.where(arr == 0, 0, (arr - 1) % (len(palette) - 1) + 1)
+
+    return np.take(palette, arr[::-1], axis=0, out=out)
@@ -0,0 +1,64 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.bitboard import BitBoard
+from game_of_life.engine.board import Board
+from game_of_life.engine.pattern import Pattern
+
+
+@pytest.fixture
+def pattern():
+    return Pattern(np.array([[0, 0, 1], [1, 0, 1], [0, 1, 1]]), name="Glider")
+
+
+def test_bitboard_roundtrip():
+    board = Board(np.array([
+        [0, 2, 0, 0],
+        [2, 2, 0, 2],
+        [0, 0, 0, 0],
+    ]))
+
+    bitboard = BitBoard.from_board(board)
+
+    assert bitboard.height == 3
+    assert bitboard.width == 4
+    assert bitboard.count_alive_cells() == 4
+    assert np.array_equal(bitboard.to_board().data, board.data)
+
+
+def test_bitboard_rejects_multiple_players():
+    board = Board(np.array([[1, 2], [0, 0]]))
+
+    with pytest.raises(ValueError):
+        BitBoard.from_board(board)
+
+
+def test_bitboard_evolve_glider(pattern: Pattern):
+    board = Board.new(width=8, height=8)
+    board.place_pattern(pattern, 0, 0)
+    bitboard = BitBoard.from_board(board)
+
+    for _ in range(8):
+        board = board.evolve()
+        bitboard = bitboard.evolve()
+        assert np.array_equal(bitboard.to_board().data, board.data)
+
+
+@pytest.mark.parametrize("width", [1, 63, 64, 65, 130])
+def test_bitboard_evolve_matches_board(width: int):
+    rng = np.random.default_rng(width)
+    board = Board(np.where(rng.random((9, width)) < 0.4, 1, 0))
+    bitboard = BitBoard.from_board(board)
+
+    for _ in range(5):
+        board = board.evolve()
+        bitboard = bitboard.evolve()
+        assert np.array_equal(bitboard.to_board().data, board.data)
+
+
+def test_bitboard_memory():
+    board = Board.new(width=256, height=256)
+
+    # one bit per cell
+    assert BitBoard.from_board(board).nbytes * 8 == board.width * board.height
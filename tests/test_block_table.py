@@ -0,0 +1,38 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.block_table import build_block_table
+from game_of_life.engine.board import Board
+
+
+def test_block_table_blinker():
+    table = build_block_table()
+
+    # vertical blinker in the second column of the block, rows 0-2
+    block = (1 << 1) | (1 << 5) | (1 << 9)
+
+    assert len(table) == 65536
+    # cells (1, 1) and (1, 2) of the block are alive in the next generation
+    assert table[block] == 0b0011
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+@pytest.mark.parametrize("shape", [(1, 1), (2, 3), (7, 5), (16, 16), (31, 18)])
+def test_board_evolve_blocks_matches_evolve(boundary: str, shape: tuple[int, int]):
+    rng = np.random.default_rng(shape[0] * shape[1])
+    board = Board((rng.random(shape) < 0.4).astype(np.uint8) * 2, boundary=boundary)
+
+    for _ in range(5):
+        evolved = board.evolve_blocks()
+        board = board.evolve()
+
+        assert evolved.data.dtype == board.data.dtype
+        assert np.array_equal(evolved.data, board.data)
+
+
+def test_board_evolve_blocks_rejects_multiple_players():
+    board = Board(np.array([[1, 2], [0, 0]]))
+
+    with pytest.raises(ValueError):
+        board.evolve_blocks()
@@ -1,8 +1,20 @@
+import weakref
+
 import pytest
 
 import numpy as np
 
-from game_of_life.engine.board import Board, count_neighbors, get_majority_player
+from game_of_life.engine.board import (
+    Board,
+    count_neighbors,
+    evolve_per_cell,
+    evolve_vectorized,
+    get_majority_player,
+    resolve_majority,
+    transition_counts,
+    wrap_box_sum,
+    zobrist_hash,
+)
 from game_of_life.engine.pattern import Pattern
 
 
@@ -22,6 +34,51 @@ def test_count_neighbors():
     ]))
 
 
+def test_count_neighbors_wrap():
+    board = np.array([
+        [1, 0, 0],
+        [1, 1, 1],
+        [0, 0, 0],
+    ])
+
+    neighbors = count_neighbors(board, boundary="wrap")
+
+    assert np.array_equal(neighbors, np.array([
+        [3, 4, 4],
+        [3, 3, 3],
+        [4, 4, 4],
+    ]))
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (2, 5), (4, 3), (7, 9)])
+def test_wrap_box_sum_matches_padding(shape: tuple[int, int]):
+    rng = np.random.default_rng(shape[0])
+    board = rng.integers(0, 2, shape)
+
+    padded = np.pad(board, 1, mode="wrap") if min(shape) > 1 else np.tile(board, (3, 3))
+    reference = sum(padded[1 + dr:1 + dr + shape[0], 1 + dc:1 + dc + shape[1]] for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+
+    assert np.array_equal(wrap_box_sum(board), reference)
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+@pytest.mark.parametrize("dtype", [bool, np.uint8, np.int32])
+def test_count_neighbors_methods_agree(boundary: str, dtype: type):
+    rng = np.random.default_rng(0)
+    board = rng.integers(0, 2, (13, 17)).astype(dtype)
+
+    reference = count_neighbors(board, boundary=boundary, method="convolve")
+    out = np.empty(board.shape, dtype=np.int32)
+
+    assert count_neighbors(board, boundary=boundary, method="slices", out=out) is out
+    assert np.array_equal(out, reference)
+
+
+def test_count_neighbors_unknown_method():
+    with pytest.raises(ValueError):
+        count_neighbors(np.zeros((3, 3)), method="fft")
+
+
 def test_get_majority_player_odd():
     board = np.array([
         [1, 2, 0],
@@ -42,6 +99,36 @@ def test_get_majority_player_even():
     assert get_majority_player(board) == 0
 
 
+def test_resolve_majority():
+    board = np.array([
+        [1, 2, 0],
+        [1, 0, 2],
+        [0, 0, 0],
+    ])
+
+    mask = np.array([
+        [False, False, False],
+        [False, True, False],
+        [True, False, False],
+    ])
+
+    # the center is a tie of 2 vs 2, the bottom left corner sees only player 1
+    assert np.array_equal(resolve_majority(board, mask), np.array([
+        [0, 0, 0],
+        [0, 0, 0],
+        [1, 0, 0],
+    ]))
+
+
+@pytest.mark.parametrize("players", [1, 2, 3])
+def test_evolve_vectorized_matches_per_cell(players: int):
+    rng = np.random.default_rng(players)
+
+    for _ in range(20):
+        data = np.where(rng.random((15, 12)) < 0.4, rng.integers(1, players + 1, (15, 12)), 0)
+        assert np.array_equal(evolve_vectorized(data), evolve_per_cell(data))
+
+
 @pytest.fixture
 def board():
     return Board(data=np.array([
@@ -166,3 +253,263 @@ def test_board_evolve(board: Board, pattern: Pattern):
     assert np.array_equal(board.data, step3)
     board = board.evolve()
     assert np.array_equal(board.data, step4)
+
+
+@pytest.mark.parametrize("tile_size", [2, 3, 5])
+def test_board_evolve_tiled_matches_evolve(tile_size: int):
+    rng = np.random.default_rng(tile_size)
+    board = Board(np.where(rng.random((13, 17)) < 0.4, rng.integers(1, 3, (13, 17)), 0))
+    tiled = board.copy()
+
+    for _ in range(10):
+        board = board.evolve()
+        tiled = tiled.evolve_tiled(tile_size)
+        assert np.array_equal(tiled.data, board.data)
+
+
+def test_board_evolve_tiled_tracks_changes():
+    board = Board.new(width=12, height=12)
+    # a still life block and a blinker in different tiles
+    board.data[1:3, 1:3] = 1
+    board.data[9, 7:10] = 2
+
+    board = board.evolve_tiled(tile_size=4)
+
+    assert np.array_equal(board.changed_tiles, np.array([
+        [False, False, False],
+        [False, False, False],
+        [False, True, True],
+    ]))
+
+    board.toggle_cell(0, 0)
+
+    assert board.changed_tiles is None
+
+
+def test_board_evolve_tiled_reuses_buffers():
+    data = np.zeros((32, 32), dtype=np.uint8)
+    data[1, 2] = data[2, 3] = data[3, 1:4] = 1
+    data[20, 20:23] = 2
+    kept = Board(data.copy())
+    board = kept.evolve_tiled(tile_size=8)
+    board = board.evolve_tiled(tile_size=8)
+
+    # the first board is still referenced, so its cells are copied instead of overwritten
+    assert np.array_equal(kept.data, data)
+
+    buffers = []
+    for _ in range(5):
+        board = board.evolve_tiled(tile_size=8)
+        buffers.append(weakref.ref(board.data))
+
+    # the chain alternates between two buffers, the cells of dropped generations are overwritten
+    assert buffers[0]() is buffers[2]() is buffers[4]() is not None
+    assert buffers[1]() is buffers[3]() is not None
+
+    expected = data
+    for _ in range(7):
+        expected = evolve_vectorized(expected)
+    assert np.array_equal(board.data, expected)
+
+
+def test_board_evolve_tiled_overwritten_parent():
+    rng = np.random.default_rng(1)
+    first = Board(np.where(rng.random((16, 16)) < 0.4, rng.integers(1, 4, (16, 16)), 0).astype(np.uint8))
+    board = first.evolve_tiled(tile_size=4)
+    old = board.data.copy()
+    del first
+
+    middle = board.evolve_tiled(tile_size=4)
+    del board
+    middle.evolve_tiled(tile_size=4)
+
+    # the cells of the parent were reused, the hash and the transitions come from the changed cells only
+    expected = transition_counts(old, middle.data)
+    assert middle._parent is None
+    assert middle.zobrist == zobrist_hash(middle.data)
+    assert np.array_equal(middle.transitions[:len(expected), :len(expected)], expected)
+    assert np.array_equal(middle.player_counts()[:len(expected)], expected.sum(axis=0))
+
+def test_board_unknown_boundary():
+    with pytest.raises(ValueError):
+        Board.new(boundary="mirror")
+
+
+def test_board_evolve_wrap_glider(pattern: Pattern):
+    board = Board.new(width=6, height=6, boundary="wrap")
+    board.place_pattern(pattern, 3, 3)
+    start = board.copy()
+
+    # the glider crosses the seams and comes back after moving by the board size
+    for _ in range(24):
+        board = board.evolve()
+        assert board.count_alive_cells() == 5
+
+    assert board.boundary == "wrap"
+    assert board.is_equal(start)
+
+
+def test_board_evolve_wrap_majority_across_seam():
+    board = Board(np.array([
+        [0, 0, 0, 0, 0],
+        [2, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1],
+        [0, 0, 0, 0, 1],
+        [0, 0, 0, 0, 0],
+    ]), boundary="wrap")
+
+    # the cell in the first column is born from neighbors on both sides of the seam, the majority is player 1
+    assert board.evolve().data[2, 0] == 1
+    assert np.array_equal(board.evolve().data, evolve_per_cell(np.pad(board.data, 1, mode="wrap"))[1:-1, 1:-1])
+
+
+def test_board_evolve_tiled_wrap():
+    rng = np.random.default_rng(0)
+    board = Board(np.where(rng.random((11, 9)) < 0.4, rng.integers(1, 3, (11, 9)), 0), boundary="wrap")
+    tiled = board.copy()
+
+    for _ in range(10):
+        board = board.evolve()
+        tiled = tiled.evolve_tiled(tile_size=4)
+        assert np.array_equal(tiled.data, board.data)
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+@pytest.mark.parametrize("players", [1, 3])
+def test_board_evolve_n_matches_evolve(boundary: str, players: int):
+    rng = np.random.default_rng(players)
+    board = Board(np.where(rng.random((12, 10)) < 0.4, rng.integers(1, players + 1, (12, 10)), 0), boundary=boundary)
+
+    evolved = board.evolve_n(7)
+    for _ in range(7):
+        board = board.evolve()
+
+    assert evolved.boundary == boundary
+    assert np.array_equal(evolved.data, board.data)
+
+
+def test_board_compact_dtype(pattern: Pattern):
+    board = Board.new(width=6, height=6)
+
+    assert board.data.dtype == np.uint8
+    assert Board.new(players=1000).data.dtype == np.uint16
+    assert Board.from_array(np.array([[0, 2], [1, 0]])).data.dtype == np.uint8
+
+    board.place_pattern(pattern, 0, 0, player=2)
+
+    assert board.evolve().data.dtype == np.uint8
+    assert board.evolve_n(3).data.dtype == np.uint8
+
+    # a player index which does not fit widens the board
+    board.place_pattern(pattern, 3, 3, player=300)
+
+    assert board.data.dtype == np.uint16
+    assert board.data[5, 5] == 300
+
+
+def test_board_zobrist_incremental(pattern: Pattern):
+    board = Board.new(width=12, height=12, boundary="wrap")
+    board.place_pattern(pattern, 1, 1, player=1)
+    board.place_pattern(pattern, 6, 6, player=2)
+
+    assert board.zobrist == zobrist_hash(board.data)
+
+    board.toggle_cell(0, 0, 3)
+    board.toggle_cell(2, 3)
+    board.place_pattern(pattern, 8, 1, player=1)
+
+    assert board.zobrist == zobrist_hash(board.data)
+
+    for evolved in [board.evolve(), board.evolve_n(5), board.evolve_tiled(4)]:
+        # the hash is updated from the parent only once it is needed
+        assert evolved._zobrist is None
+        assert evolved.zobrist == zobrist_hash(evolved.data)
+
+    tiled = board.evolve_tiled(4)
+    for _ in range(4):
+        assert tiled.zobrist == zobrist_hash(tiled.data)
+        tiled = tiled.evolve_tiled(4)
+
+    board.clear()
+
+    assert board.zobrist == zobrist_hash(board.data) == 0
+
+
+def test_board_zobrist_parent_modified(pattern: Pattern):
+    board = Board.new(width=12, height=12)
+    board.place_pattern(pattern, 1, 1)
+    assert board.zobrist == zobrist_hash(board.data)
+
+    evolved = board.evolve()
+    expected = zobrist_hash(evolved.data)
+
+    # the evolved board keeps the cells of the parent, editing the parent must not change its hash
+    board.toggle_cell(0, 0)
+    board.place_pattern(pattern, 6, 6)
+
+    assert evolved.zobrist == expected
+    assert board.zobrist == zobrist_hash(board.data)
+
+
+def test_board_zobrist_equality(pattern: Pattern):
+    board = Board.new(width=8, height=8)
+    board.place_pattern(pattern, 2, 2)
+    wide = Board(board.data.astype(np.uint16))
+    moved = Board.new(width=8, height=8)
+    moved.place_pattern(pattern, 3, 2)
+
+    # the hash depends on the cells, not on the dtype
+    assert board.zobrist == wide.zobrist
+    assert board.zobrist != moved.zobrist
+    assert not board.is_equal(moved)
+
+
+def test_board_evolve_population_stats():
+    board = Board.new(width=7, height=7, players=2)
+    board.data[2, 1:4] = 1
+    board.data[6, 6] = 2
+
+    assert board.births() is None
+    assert board.count_alive_cells() == 4
+
+    evolved = board.evolve()
+
+    # the blinker turns around and the lonely cell of player 2 dies
+    assert evolved.count_alive_cells() == 3
+    assert list(evolved.player_counts()[1:]) == [3, 0]
+    assert list(evolved.births()[1:]) == [2, 0]
+    assert list(evolved.deaths()[1:]) == [2, 1]
+
+
+@pytest.mark.parametrize("evolve", [Board.evolve, lambda board: board.evolve_tiled(4), lambda board: board.evolve_n(3)])
+def test_board_evolve_transitions(evolve):
+    rng = np.random.default_rng(0)
+    board = Board(np.where(rng.random((16, 13)) < 0.4, rng.integers(1, 4, (16, 13)), 0).astype(np.uint8))
+
+    for _ in range(3):
+        evolved = evolve(board)
+        expected = transition_counts(board.data, evolved.data)
+
+        # the transitions are counted only once they are needed
+        assert evolved._transitions is None
+        assert evolved.count_alive_cells() == np.count_nonzero(evolved.data)
+        assert np.array_equal(evolved.transitions[:len(expected), :len(expected)], expected)
+        # the next generation takes the cells which kept their player from these counts
+        assert np.array_equal(evolved.player_counts()[:len(expected)], expected.sum(axis=0))
+        board = evolved
+
+
+def test_board_toggle_cell_population():
+    board = Board.new(width=4, height=4)
+
+    assert board.count_alive_cells() == 0
+
+    board.toggle_cell(1, 1, 3)
+    board.toggle_cell(2, 2)
+
+    assert list(board.player_counts()) == [14, 1, 0, 1]
+
+    board.toggle_cell(1, 1)
+
+    assert board.count_alive_cells() == 1
+
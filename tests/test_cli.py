@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from game_of_life.cli import load_input, main, tournament_main
+from game_of_life.engine.board import Board
+from game_of_life.engine.pattern import Pattern
+from game_of_life.engine.statistics import load_statistics
+from game_of_life.utils.path_manager import PathManager
+
+
+@pytest.fixture
+def database(tmp_path):
+    path_manager = PathManager(tmp_path)
+    Pattern(np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]]), name="Glider").save(path_manager)
+
+    board = Board.new(8, 8)
+    board.place_pattern(Pattern(np.ones((1, 3), dtype=np.uint8), name="Blinker"), 2, 3)
+    board.save(path_manager.get_board_path("Blinker Board"))
+
+    return tmp_path
+
+
+def test_load_input(database):
+    name, board = load_input("Glider", root=database, width=20, height=10)
+    assert name == "glider"
+    assert (board.height, board.width) == (10, 20)
+    assert board.count_alive_cells() == 5
+
+    name, board = load_input("blinker board", root=database)
+    assert name == "blinker_board"
+    assert (board.height, board.width) == (8, 8)
+
+    with pytest.raises(ValueError):
+        load_input("Glider", root=database, width=2, height=2)
+
+    with pytest.raises(ValueError):
+        load_input("Missing", root=database)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_main_runs_inputs(database, tmp_path, capsys, processes):
+    output = tmp_path / "results"
+    code = main(["--root", str(database), "--all-boards", "--all-patterns", "-n", "12", "--stop-on-cycle", "-o", str(output), "-j", str(processes)])
+    assert code == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+
+    # the blinker repeats after two generations, the glider runs all steps
+    blinker = Board.load(output / "blinker_board.npy")
+    assert blinker.count_alive_cells() == 3
+    assert "\t2\t3\t0\t2\t" in lines[1]
+
+    statistics = load_statistics(output / "glider_statistics.npz")
+    assert list(statistics["generation"]) == list(range(13))
+    assert np.all(statistics["population"][:, 0] == 5)
+
+
+def test_main_reports_cycles_without_stopping(database, tmp_path, capsys):
+    code = main(["--root", str(database), "Blinker Board", "-n", "12", "-o", str(tmp_path / "results")])
+    assert code == 0
+
+    # the blinker runs all steps, its cycle is still reported
+    lines = capsys.readouterr().out.splitlines()
+    assert "\t12\t3\t0\t2\t" in lines[1]
+
+
+def test_main_reports_failures(database, tmp_path, capsys):
+    code = main(["--root", str(database), "Missing", "Glider", "-n", "3", "-o", str(tmp_path / "results"), "--statistics-format", "csv"])
+    assert code == 1
+
+    captured = capsys.readouterr()
+    assert "Missing" in captured.err
+    assert (tmp_path / "results" / "glider_statistics.csv").exists()
+
+
+def test_cli_does_not_import_kivy():
+    code = "import sys, game_of_life.cli; sys.exit(any(name.split('.')[0] == 'kivy' for name in sys.modules))"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_tournament_main(database, tmp_path, capsys):
+    Pattern(np.array([[1, 1], [1, 1]]), name="Block").save(PathManager(database))
+
+    results = tmp_path / "tournament.jsonl"
+    code = tournament_main(["--root", str(database), "-r", str(results), "-n", "10", "--width", "20", "--height", "10"])
+    assert code == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split("\t") == ["pattern", "wins", "draws", "losses"]
+    assert len(lines) == 3
+    assert len(results.read_text().splitlines()) == 3
@@ -0,0 +1,55 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.ensemble import Ensemble
+from game_of_life.engine.game import Game
+
+
+def random_boards(count: int, boundary: str) -> list[Board]:
+    rng = np.random.default_rng(count)
+    return [
+        Board(np.where(rng.random((8, 9)) < rng.random(), rng.integers(1, 3, (8, 9)), 0), boundary=boundary)
+        for _ in range(count)
+    ]
+
+
+def test_ensemble_finished_boards():
+    blinker = Board.new(width=5, height=5)
+    blinker.data[2, 1:4] = 1
+    block = Board.new(width=5, height=5)
+    block.data[1:3, 1:3] = 2
+    empty = Board.new(width=5, height=5)
+
+    ensemble = Ensemble.from_boards([blinker, block, empty])
+
+    assert np.array_equal(ensemble.finished, [False, False, True])
+
+    ensemble.step()
+
+    assert np.array_equal(ensemble.finished, [False, True, True])
+    assert np.array_equal(ensemble.alive_counts, [3, 4, 0])
+    assert np.array_equal(ensemble.generations, [1, 1, 0])
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+def test_ensemble_matches_games(boundary: str):
+    boards = random_boards(12, boundary)
+    ensemble = Ensemble.from_boards(boards)
+    ensemble.run(20)
+
+    for index, board in enumerate(boards):
+        game = Game(board=board, steps=20)
+        while game.can_go_next() and game.i < game.steps:
+            game.next_step()
+
+        assert ensemble.generations[index] == game.i
+        assert ensemble.finished[index] == (not game.can_go_next())
+        assert ensemble.alive_counts[index] == game.board.count_alive_cells()
+        assert np.array_equal(ensemble.board(index).data, game.board.data)
+
+
+def test_ensemble_mixed_boundaries():
+    with pytest.raises(ValueError):
+        Ensemble.from_boards([Board.new(), Board.new(boundary="wrap")])
@@ -0,0 +1,212 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.config import JUMP_HASHLIFE, JUMP_STEPS
+from game_of_life.engine import board as board_module
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+
+
+def blinker() -> Board:
+    board = Board.new(width=5, height=5)
+    board.data[2, 1:4] = 1
+    return board
+
+
+def test_game_next_and_previous_step():
+    board = blinker()
+    game = Game(board=board)
+
+    assert game.can_go_next()
+    assert not game.can_go_previous()
+
+    game.next_step()
+
+    assert game.i == 1
+    assert game.can_go_previous()
+    assert np.array_equal(game.board.data, board.evolve().data)
+
+    game.previous_step()
+
+    assert game.i == 0
+    assert np.array_equal(game.board.data, board.data)
+
+
+def test_game_next_steps():
+    board = blinker()
+    game = Game(board=board)
+
+    game.next_steps(5)
+
+    assert game.i == 5
+    assert np.array_equal(game.board.data, board.evolve().data)
+
+    game.previous_step()
+
+    assert game.i == 0
+    assert np.array_equal(game.board.data, board.data)
+
+
+def test_game_detects_blinker_cycle():
+    board = blinker()
+    game = Game(board=board, steps=100, stop_on_cycle=True)
+
+    while game.run_step():
+        pass
+
+    assert game.found_cycle()
+    assert game.transient == 0
+    assert game.period == 2
+    assert game.i == 2
+
+
+def test_game_skips_cycle_detection_by_default():
+    game = Game(board=blinker(), steps=10)
+
+    while game.run_step():
+        pass
+
+    assert game.i == 10
+    assert not game.detect_cycles
+    assert not game.found_cycle()
+    assert game.generation_index == {}
+    assert game.board._zobrist is None
+
+
+def test_game_detects_cycle_without_stopping():
+    game = Game(board=blinker(), steps=10, detect_cycles=True)
+
+    while game.run_step():
+        pass
+
+    # the cycle is reported, but the game runs all steps
+    assert game.i == 10
+    assert game.transient == 0
+    assert game.period == 2
+
+
+def test_game_detects_cycle_after_transient():
+    # a pre-block becomes a block after one generation
+    board = Board.new(width=6, height=6)
+    board.data[2, 2:4] = 1
+    board.data[3, 2] = 1
+    game = Game(board=board, detect_cycles=True)
+
+    for _ in range(4):
+        game.next_step()
+
+    assert game.transient == 1
+    assert game.period == 1
+
+
+def test_game_cycle_confirms_hash_collision(monkeypatch: pytest.MonkeyPatch):
+    # every board has the same hash, only the exact compare can tell them apart
+    monkeypatch.setattr(board_module, "zobrist_keys", lambda rows, cols, players: np.zeros(len(rows), dtype=np.uint64))
+    board = Board.new(width=8, height=8)
+    board.data[1:4, 1:4] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    game = Game(board=board, detect_cycles=True)
+
+    for _ in range(3):
+        game.next_step()
+
+    assert not game.found_cycle()
+
+    # a real cycle is still found among the colliding generations
+    game = Game(board=blinker(), detect_cycles=True)
+
+    for _ in range(3):
+        game.next_step()
+
+    assert game.transient == 0
+    assert game.period == 2
+
+
+def test_game_seek():
+    rng = np.random.default_rng(0)
+    board = Board((rng.random((20, 20)) < 0.4).astype(np.uint8))
+    boards = [board]
+    for _ in range(50):
+        boards.append(boards[-1].evolve())
+
+    game = Game(board=board, checkpoint_interval=8)
+
+    for generation in [37, 12, 50, 0, 49, 23]:
+        game.seek(generation)
+
+        assert game.i == generation
+        assert game.board.is_equal(boards[generation])
+
+    # one checkpoint per interval up to the furthest generation reached
+    assert sorted(game.checkpoints) == [0, 8, 16, 24, 32, 40, 48]
+
+    game.previous_step()
+
+    assert game.i == 22
+    assert game.board.is_equal(boards[22])
+
+
+def test_game_keeps_checkpoints_by_default():
+    game = Game(board=blinker(), steps=250)
+
+    while game.run_step():
+        pass
+
+    assert game.i == 250
+    assert sorted(game.checkpoints) == [0, 100, 200]
+
+    game.seek(101)
+
+    assert game.board.is_equal(blinker().evolve())
+
+
+def test_game_without_checkpoints_goes_back_through_history():
+    game = Game(board=blinker(), checkpoint_interval=None)
+
+    game.seek(30)
+
+    # going back would replay all generations from the original board
+    assert list(game.checkpoints) == [0]
+    assert not game.can_go_previous()
+
+    game.next_step()
+
+    assert game.can_go_previous()
+    game.previous_step()
+    assert game.i == 30
+    assert not game.can_go_previous()
+
+
+def test_game_seek_after_jump():
+    board = Board.new(width=20, height=20)
+    board.data[9:11, 9:11] = 1
+    game = Game(board=board, checkpoint_interval=4)
+
+    game.jump(3)
+    game.seek(3)
+
+    assert game.i == 3
+    assert game.board.is_equal(board)
+    assert sorted(game.checkpoints) == [0, 8]
+
+    with pytest.raises(ValueError):
+        game.seek(-1)
+
+
+@pytest.mark.parametrize("x0, boundary, engine", [(12, "fill", JUMP_HASHLIFE), (1, "fill", JUMP_STEPS), (12, "wrap", JUMP_STEPS)])
+def test_game_jump_equals_stepping(x0: int, boundary: str, engine: str):
+    board = Board.new(width=30, height=30, boundary=boundary)
+    # glider heading to the bottom right corner
+    board.data[12, x0 + 1] = board.data[13, x0 + 2] = 1
+    board.data[14, x0:x0 + 3] = 1
+    game = Game(board=board)
+
+    # close to the edge or on a torus, the jump falls back to stepping instead of cropping the HashLife result
+    assert game.jump(3) == engine
+    assert game.i == 8
+    assert game.board.is_equal(board.evolve_n(8))
+
+    # the glider moved closer to the edge than the longer jump could reach
+    assert game.jump(4) == JUMP_STEPS
+    assert game.i == 24
+    assert game.board.is_equal(board.evolve_n(24))
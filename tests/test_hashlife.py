@@ -0,0 +1,118 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.config import JUMP_HASHLIFE
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.hashlife import HashLife
+from game_of_life.engine.pattern import Pattern
+from game_of_life.engine.sparse_board import SparseBoard
+
+
+@pytest.fixture
+def pattern():
+    return Pattern(np.array([[0, 0, 1], [1, 0, 1], [0, 1, 1]]), name="Glider")
+
+
+def test_hashlife_roundtrip(pattern: Pattern):
+    board = Board.new(width=10, height=7)
+    board.place_pattern(pattern, 4, 2, player=2)
+
+    universe = HashLife()
+    universe.load_board(board)
+
+    assert universe.count_alive_cells() == 5
+    assert universe.bounding_box() == (2, 4, 4, 6)
+    assert np.array_equal(universe.to_board(7, 10).data, board.data)
+
+
+def test_hashlife_rejects_multiple_players():
+    board = Board(np.array([[1, 2], [0, 0]]))
+
+    with pytest.raises(ValueError):
+        HashLife().load_board(board)
+
+
+@pytest.mark.parametrize("generations", [1, 3, 4, 7, 16])
+def test_hashlife_step_matches_board(generations: int):
+    rng = np.random.default_rng(generations)
+    board = Board.new(width=64, height=64)
+    board.data[26:38, 26:38] = rng.random((12, 12)) < 0.4
+
+    universe = HashLife()
+    universe.load_board(board)
+    universe.step(generations)
+
+    for _ in range(generations):
+        board = board.evolve()
+
+    assert universe.generation == generations
+    assert np.array_equal(universe.to_board(64, 64).data, board.data)
+
+
+def test_hashlife_glider_travels(pattern: Pattern):
+    universe = HashLife()
+    universe.load_pattern(pattern, x0=0, y0=0)
+    universe.step_pow2(10)
+
+    # a glider moves by one cell diagonally every four generations
+    assert universe.count_alive_cells() == 5
+    assert universe.bounding_box() == (256, 256, 258, 258)
+    assert np.array_equal(universe.to_pattern("Glider").data, pattern.data)
+
+
+def test_hashlife_cache_eviction(pattern: Pattern):
+    universe = HashLife(cache_size=50)
+    universe.load_pattern(pattern)
+    universe.step(1000)
+
+    assert universe.cache_info()["results"] <= 50
+    assert universe.count_alive_cells() == 5
+
+
+def test_game_jump(pattern: Pattern):
+    board = Board.new(width=20, height=20)
+    board.place_pattern(pattern, 8, 8)
+
+    game = Game(board=board)
+
+    # the glider is far enough from the edges, so HashLife computes the jump
+    assert game.jump(3) == JUMP_HASHLIFE
+
+    expected = board
+    for _ in range(8):
+        expected = expected.evolve()
+
+    assert game.i == 8
+    assert game.can_go_previous()
+    assert np.array_equal(game.board.data, expected.data)
+
+
+def test_game_jump_unbounded(pattern: Pattern):
+    board = Board.new(width=20, height=20)
+    board.place_pattern(pattern, 12, 12)
+    plane = SparseBoard.from_board(board)
+
+    game = Game(board=board)
+
+    for step in range(1, 4):
+        assert game.jump(4, unbounded=True) == JUMP_HASHLIFE
+
+        for _ in range(16):
+            plane = plane.evolve()
+
+        # the board is a window of the plane, the glider leaving it is not turned into a block at the edge
+        assert game.i == 16 * step
+        assert np.array_equal(game.board.data, plane.to_board(0, 0, 20, 20).data)
+
+    # the glider flew out of the window but lives on in the universe
+    assert game.board.count_alive_cells() == 0
+    assert game.hashlife.count_alive_cells() == 5
+
+    game.seek(16)
+
+    assert np.array_equal(game.board.data, game.checkpoints[16].data)
+
+    with pytest.raises(ValueError):
+        Game(board=Board.new(width=20, height=20, boundary="wrap")).jump(3, unbounded=True)
@@ -0,0 +1,105 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.history import Delta, History, Keyframe
+from game_of_life.engine.rule import Rule
+
+
+def random_board(seed: int = 0, size: int = 32) -> Board:
+    rng = np.random.default_rng(seed)
+    return Board(np.where(rng.random((size, size)) < 0.3, rng.integers(1, 3, (size, size)), 0).astype(np.uint8))
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 4, 32])
+def test_history_push_and_pop(keyframe_interval: int):
+    history = History(keyframe_interval=keyframe_interval, memory_budget=None)
+    boards = [random_board()]
+    for _ in range(10):
+        boards.append(boards[-1].evolve())
+
+    for step, board in enumerate(boards):
+        history.push(board, step)
+
+    assert len(history) == 11
+    assert sum(isinstance(entry, Keyframe) for entry in history.entries) == -(-11 // keyframe_interval)
+
+    for step in reversed(range(11)):
+        board, popped_step = history.pop()
+
+        assert popped_step == step
+        assert board.is_equal(boards[step])
+
+    assert len(history) == 0
+    assert history.last() is None
+
+
+def test_history_deltas_are_small():
+    board = Board.new(width=100, height=100)
+    board.data[50, 49:52] = 1
+    history = History(keyframe_interval=10, memory_budget=None)
+
+    for step in range(10):
+        history.push(board, step)
+        board = board.evolve()
+
+    keyframe, *deltas = history.entries
+
+    assert all(isinstance(delta, Delta) for delta in deltas)
+    # a blinker changes 4 cells per generation
+    assert all(len(delta.indices) == 4 for delta in deltas)
+    assert history.nbytes < 2 * keyframe.nbytes
+
+
+def test_history_memory_budget():
+    board = random_board(size=16)
+    history = History(keyframe_interval=2, memory_budget=3 * board.data.nbytes)
+
+    for step in range(20):
+        history.push(board, step)
+        board = board.evolve()
+
+        assert history.memory_usage() <= 3 * board.data.nbytes or len(history) <= 2
+
+    # the oldest generations were dropped, the newest ones are still available
+    assert isinstance(history.entries[0], Keyframe)
+    assert history.entries[0].step > 0
+    assert history.pop()[1] == 19
+
+
+def test_history_generations_ages():
+    rule = Rule.parse("B2/S/C4")
+    board = Board.new(width=8, height=8)
+    board.data[3, 3:5] = 1
+    boards = [board]
+    for _ in range(4):
+        boards.append(boards[-1].evolve(rule=rule))
+
+    history = History(keyframe_interval=8, memory_budget=None)
+    for step, board in enumerate(boards):
+        history.push(board, step)
+
+    for step in reversed(range(5)):
+        board, _ = history.pop()
+
+        assert board.is_equal(boards[step])
+
+
+def test_game_previous_steps_from_history():
+    board = random_board()
+    game = Game(board=board, history_keyframe_interval=3)
+
+    for _ in range(7):
+        game.next_step()
+
+    expected = board
+    for _ in range(4):
+        expected = expected.evolve()
+
+    for _ in range(3):
+        game.previous_step()
+
+    assert game.i == 4
+    assert game.board.is_equal(expected)
@@ -0,0 +1,63 @@
+import os
+import signal
+
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.parallel import ParallelEvolver
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+@pytest.mark.parametrize("processes", [1, 3])
+def test_parallel_evolver_matches_evolve(boundary: str, processes: int):
+    rng = np.random.default_rng(processes)
+    board = Board(np.where(rng.random((17, 13)) < 0.4, rng.integers(1, 3, (17, 13)), 0), boundary=boundary)
+
+    with ParallelEvolver(board, processes=processes) as evolver:
+        for steps in (1, 4):
+            evolver.run(steps)
+            for _ in range(steps):
+                board = board.evolve()
+            assert np.array_equal(evolver.board().data, board.data)
+
+
+def test_parallel_evolver_dead_worker():
+    board = Board.new(width=12, height=12)
+    board.data[5, 4:7] = 1
+
+    with ParallelEvolver(board, processes=2) as evolver:
+        evolver.workers[1].terminate()
+        evolver.workers[1].join()
+
+        with pytest.raises(RuntimeError, match=f"exited with code {-signal.SIGTERM}"):
+            evolver.run(3)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGSTOP"), reason="requires stopping a process")
+def test_parallel_evolver_stuck_worker():
+    board = Board.new(width=12, height=12)
+    board.data[5, 4:7] = 1
+
+    with ParallelEvolver(board, processes=2, timeout=0.5) as evolver:
+        stuck = evolver.workers[1]
+        os.kill(stuck.pid, signal.SIGSTOP)
+        try:
+            with pytest.raises(RuntimeError, match="timed out"):
+                evolver.run(3)
+        finally:
+            os.kill(stuck.pid, signal.SIGCONT)
+
+
+def test_game_run_parallel():
+    board = Board.new(width=12, height=12)
+    board.data[5, 4:7] = 1
+
+    game = Game(board=board)
+    game.run_parallel(3, processes=2)
+
+    assert game.i == 3
+    assert game.can_go_previous()
+    assert np.array_equal(game.board.data, board.evolve().data)
@@ -63,3 +63,11 @@ def test_reflect_vertical(pattern):
     pattern.reflect_vertical()
 
     assert np.array_equal(pattern.data, np.array([[0, 1, 1], [1, 0, 1], [0, 0, 1]]))
+
+
+def test_pattern_compact_dtype(pattern):
+    box = np.array([[0, 0, 0], [0, 7, 7], [0, 0, 0]], dtype=np.int64)
+
+    assert Pattern.new(box, name="Domino").data.dtype == np.uint8
+    assert pattern.assign_to_player(player=2).data.dtype == pattern.data.dtype
+    assert pattern.assign_to_player(player=300).data.max() == 300
@@ -0,0 +1,128 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board, evolve_vectorized
+from game_of_life.engine.game import Game
+from game_of_life.engine.rule import Rule
+
+
+@pytest.mark.parametrize("rulestring", ["B3/S23", "b3/s23", "S23/B3", "23/3", "B3/S23/C2", "R1,C0,M0,S2..3,B3..3,NM"])
+def test_parse_conway(rulestring: str):
+    rule = Rule.parse(rulestring)
+
+    assert rule.is_conway()
+    assert str(rule) == "B3/S23"
+
+
+@pytest.mark.parametrize("rulestring", ["B36/S23", "B2/S/C3", "R5,C0,M1,S34..58,B34..45,NM", "R2,C4,M0,S1..2,S5..6,B3..3,NM"])
+def test_parse_round_trip(rulestring: str):
+    rule = Rule.parse(rulestring)
+
+    assert Rule.parse(str(rule)) == rule
+    assert not rule.is_conway()
+
+
+def test_parse_generations():
+    rule = Rule.parse("345/2/4")
+
+    assert rule.survive == (3, 4, 5)
+    assert rule.birth == (2,)
+    assert rule.states == 4
+
+
+@pytest.mark.parametrize("rulestring", ["B9/S23", "X3/Y23", "R5,C0,M1,S34..58,B34..45,NN", "R1,C0,M0,S2..9,B3..3,NM", "R0,C0,M0,S0..0,B1..1,NM"])
+def test_parse_invalid(rulestring: str):
+    with pytest.raises(ValueError):
+        Rule.parse(rulestring)
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+@pytest.mark.parametrize("players", [1, 3])
+def test_rule_conway_matches_evolve_vectorized(boundary: str, players: int):
+    rng = np.random.default_rng(players)
+    data = np.where(rng.random((20, 23)) < 0.4, rng.integers(1, players + 1, (20, 23)), 0).astype(np.uint8)
+
+    new_data, ages = Rule.parse("B3/S23").step(data, boundary)
+
+    assert ages is None
+    assert np.array_equal(new_data, evolve_vectorized(data, boundary))
+
+
+def test_rule_highlife_replicator():
+    board = Board.new(width=12, height=12)
+    board.data[4:7, 4:7] = [[0, 1, 1], [1, 0, 1], [1, 1, 0]]
+    board.data[7, 4] = 1
+
+    rule = Rule.parse("B36/S23")
+    highlife = board.evolve(rule=rule)
+    conway = board.evolve()
+
+    # the cell with 6 neighbors is born only in HighLife
+    assert highlife.data[5, 5] == 1
+    assert conway.data[5, 5] == 0
+
+
+def test_rule_generations_decay():
+    # Brian's Brain, every alive cell dies at once and decays for one generation
+    rule = Rule.parse("B2/S/C3")
+    board = Board.new(width=6, height=6)
+    board.data[2, 2:4] = 1
+
+    board = board.evolve(rule=rule)
+
+    assert np.array_equal(np.argwhere(board.data), [[1, 2], [1, 3], [3, 2], [3, 3]])
+    assert np.array_equal(np.argwhere(board.ages), [[2, 2], [2, 3]])
+
+    board = board.evolve(rule=rule)
+
+    # the dying cells cannot be born again and vanish afterwards
+    assert board.data[2, 2] == 0 and board.data[2, 3] == 0
+    assert np.array_equal(np.argwhere(board.ages), [[1, 2], [1, 3], [3, 2], [3, 3]])
+
+
+@pytest.mark.parametrize("boundary", ["fill", "wrap"])
+def test_rule_larger_than_life_matches_direct_sum(boundary: str):
+    rule = Rule.parse("R3,C0,M1,S10..20,B12..16,NM")
+    rng = np.random.default_rng(0)
+    data = (rng.random((17, 19)) < 0.3).astype(np.uint8)
+
+    padded = np.pad(data, 3, mode="wrap" if boundary == "wrap" else "constant").astype(int)
+    counts = sum(padded[3 + dr:3 + dr + 17, 3 + dc:3 + dc + 19] for dr in range(-3, 4) for dc in range(-3, 4))
+    expected = np.where(data != 0, (counts >= 10) & (counts <= 20), (counts >= 12) & (counts <= 16))
+
+    new_data, _ = rule.step(data, boundary)
+
+    assert np.array_equal(new_data != 0, expected)
+
+
+def test_rule_larger_than_life_majority():
+    rule = Rule.parse("R2,C0,M1,S1..25,B1..25,NM")
+    data = np.zeros((5, 9), dtype=np.uint8)
+    data[2, 0:2] = 1
+    data[2, 7] = 2
+
+    new_data, _ = rule.step(data)
+
+    # the left cells see two cells of player 1, the right ones see one cell of player 2
+    assert np.all(new_data[:, :4] == 1)
+    assert np.all(new_data[:, 5:] == 2)
+    assert np.all(new_data[:, 4] == 0)
+
+
+def test_game_rule():
+    board = Board.new(width=6, height=6)
+    board.data[2, 2:4] = 1
+
+    game = Game(board=board, rule="B2/S/C3")
+    game.next_steps(2)
+
+    assert game.i == 2
+    assert str(game.rule) == "B2/S/C3"
+    assert game.board.is_equal(board.evolve(rule=game.rule).evolve(rule=game.rule))
+
+    with pytest.raises(ValueError):
+        game.jump(3)
+
+    with pytest.raises(ValueError):
+        Game(board=board, rule="B36/S23", tile_size=8)
@@ -0,0 +1,112 @@
+import time
+
+import numpy as np
+import pytest
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.runner import GameRunner
+
+
+def glider_game(steps: int, frequency: int = 1000) -> Game:
+    board = Board.new(width=20, height=20, boundary="wrap")
+    board.data[0:3, 0:3] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    return Game(board=board, steps=steps, frequency=frequency)
+
+
+def wait_for_frames(runner: GameRunner, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while runner.frames.qsize() < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_runner_produces_newest_generations():
+    game = glider_game(steps=30)
+    runner = GameRunner(game, buffer_size=4)
+    runner.start()
+
+    frames = []
+    deadline = time.monotonic() + 5
+    while not (frames and frames[-1].finished) and time.monotonic() < deadline:
+        frame = runner.poll()
+        if frame is not None:
+            frames.append(frame)
+
+    runner.stop()
+
+    # generations which were not polled in time are skipped, the finished frame is never skipped
+    generations = [frame.generation for frame in frames]
+    assert generations == sorted(generations)
+    assert len(set(generations[:-1])) == len(generations) - 1
+    assert frames[-1].generation == 30 and frames[-1].finished
+    assert not any(frame.finished for frame in frames[:-1])
+
+    expected = glider_game(steps=30)
+    for frame in frames:
+        expected.seek(frame.generation)
+        assert np.array_equal(frame.board.data, expected.board.data)
+
+
+def test_runner_shows_every_generation_at_game_frequency():
+    game = glider_game(steps=10, frequency=20)
+    runner = GameRunner(game)
+    start = time.monotonic()
+    runner.start()
+
+    # poll like the Clock of the simulation screen, half a period after the frames are released
+    frames = []
+    for tick in range(1, 12):
+        time.sleep(max(0, start + (tick + 0.5) * game.time_delay - time.monotonic()))
+        frame = runner.poll()
+        if frame is not None:
+            frames.append(frame)
+
+    runner.stop()
+
+    # the fast game is not evolved ahead, so no generation is skipped
+    assert [frame.generation for frame in frames[:10]] == list(range(1, 11))
+    assert frames[-1].finished
+
+
+def test_runner_is_bounded_and_stops_consistently():
+    game = glider_game(steps=1000)
+    runner = GameRunner(game, buffer_size=3)
+    runner.start()
+
+    wait_for_frames(runner, 3)
+    time.sleep(0.1)
+
+    # the producer waits for a free slot, it holds at most one more generation than the queue
+    assert runner.frames.qsize() == 3
+    assert game.i <= 4
+
+    # the ready frames are dropped up to the newest one
+    newest = runner.poll()
+    runner.stop()
+
+    assert newest.generation == 3
+    assert not runner.is_running()
+    assert runner.poll() is None
+
+    # the game can be used again and holds the newest computed generation
+    expected = glider_game(steps=1000)
+    expected.seek(game.i)
+    assert np.array_equal(game.board.data, expected.board.data)
+
+    game.next_step()
+    game.previous_step()
+
+
+def test_runner_reports_errors():
+    game = glider_game(steps=10)
+    game.run_step = lambda: 1 / 0
+
+    runner = GameRunner(game)
+    runner.start()
+    runner._thread.join()
+
+    with pytest.raises(ZeroDivisionError):
+        runner.poll()
+
+    with pytest.raises(ValueError):
+        GameRunner(game, buffer_size=0)
@@ -0,0 +1,61 @@
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.pattern import Pattern
+from game_of_life.engine.sparse_board import SparseBoard
+
+
+@pytest.fixture
+def pattern():
+    return Pattern(np.array([[0, 0, 1], [1, 0, 1], [0, 1, 1]]), name="Glider")
+
+
+def test_sparse_board_place_pattern(pattern: Pattern):
+    board = SparseBoard.new()
+    board.place_pattern(pattern, -5, 10, player=2)
+
+    assert board.count_alive_cells() == 5
+    assert board.bounding_box() == (10, -5, 12, -3)
+    assert board.get_cell(10, -3) == 2
+    assert board.get_cell(10, -5) == 0
+    assert np.array_equal(board.to_board().data, pattern.assign_to_player(2).data)
+
+
+def test_sparse_board_toggle_cell():
+    board = SparseBoard.new()
+    board.toggle_cell(3, -7, value=2)
+
+    assert board.get_cell(3, -7) == 2
+    assert board.count_alive_cells() == 1
+
+    board.toggle_cell(3, -7)
+
+    assert board.count_alive_cells() == 0
+    assert board.bounding_box() is None
+
+
+def test_sparse_board_glider_leaves_origin(pattern: Pattern):
+    board = SparseBoard.new()
+    board.place_pattern(pattern, 0, 0)
+
+    for _ in range(400):
+        board = board.evolve()
+
+    # unlike on a bounded board, the glider never dies at an edge
+    assert board.count_alive_cells() == 5
+    assert board.bounding_box() == (100, 100, 102, 102)
+
+
+@pytest.mark.parametrize("players", [1, 2, 3])
+def test_sparse_board_evolve_matches_board(players: int):
+    rng = np.random.default_rng(players)
+    board = Board.new(width=60, height=60)
+    board.data[22:38, 22:38] = np.where(rng.random((16, 16)) < 0.4, rng.integers(1, players + 1, (16, 16)), 0)
+    sparse = SparseBoard.from_board(board, x0=-30, y0=-30)
+
+    for _ in range(10):
+        board = board.evolve()
+        sparse = sparse.evolve()
+        assert np.array_equal(sparse.to_board(x0=-30, y0=-30, width=60, height=60).data, board.data)
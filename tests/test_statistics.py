@@ -0,0 +1,99 @@
+import csv
+
+import pytest
+
+import numpy as np
+
+from game_of_life.engine.board import Board
+from game_of_life.engine.game import Game
+from game_of_life.engine.statistics import StatisticsCollector, bounding_box, load_statistics
+
+
+def two_player_board() -> Board:
+    board = Board.new(width=8, height=8, players=2)
+    # blinker of player 1 and a block of player 2
+    board.data[2, 1:4] = 1
+    board.data[5:7, 5:7] = 2
+    return board
+
+
+def test_bounding_box():
+    board = np.zeros((6, 7), dtype=np.uint8)
+
+    assert bounding_box(board) == (-1, -1, -1, -1)
+
+    board[1, 5] = 1
+    board[4, 2] = 2
+
+    assert bounding_box(board) == (1, 2, 4, 5)
+
+
+def test_statistics_record():
+    collector = StatisticsCollector(players=2)
+    game = Game(board=two_player_board(), statistics=collector)
+
+    game.next_step()
+    game.run_step()
+
+    arrays = collector.to_arrays()
+
+    assert list(arrays["generation"]) == [1, 2]
+    assert arrays["population"].tolist() == [[3, 4], [3, 4]]
+    assert arrays["births"].tolist() == [[2, 0], [2, 0]]
+    assert arrays["deaths"].tolist() == [[2, 0], [2, 0]]
+    assert arrays["captures"].tolist() == [[0, 0], [0, 0]]
+    assert arrays["bounding_box"].tolist() == [[1, 2, 6, 6], [2, 1, 6, 6]]
+
+
+def test_statistics_captures():
+    # the cell of player 2 survives with two neighbors of player 1, so player 1 takes it over
+    board = Board(np.array([
+        [1, 1, 0],
+        [0, 2, 0],
+        [0, 0, 0],
+    ], dtype=np.uint8))
+    collector = StatisticsCollector(players=2)
+
+    collector.record(board.evolve(), 1)
+
+    assert collector.to_arrays()["captures"].tolist() == [[1, 0]]
+
+
+def test_statistics_ring_buffer():
+    collector = StatisticsCollector(players=1, capacity=4)
+    board = two_player_board()
+
+    for generation in range(10):
+        collector.record(board, generation)
+
+    assert len(collector) == 4
+    assert list(collector.to_arrays()["generation"]) == [6, 7, 8, 9]
+
+
+@pytest.mark.parametrize("extension", ["npz", "csv"])
+def test_statistics_flush(tmp_path, extension: str):
+    path = str(tmp_path / f"statistics.{extension}")
+    collector = StatisticsCollector(players=2, capacity=3, path=path)
+    game = Game(board=two_player_board(), statistics=collector)
+
+    for _ in range(7):
+        game.next_step()
+    collector.close()
+
+    if extension == "npz":
+        arrays = load_statistics(path)
+
+        assert list(arrays["generation"]) == list(range(1, 8))
+        assert arrays["population"].shape == (7, 2)
+        assert arrays["bounding_box"].shape == (7, 4)
+    else:
+        with open(path) as file:
+            rows = list(csv.reader(file))
+
+        assert rows[0][:3] == ["generation", "population_1", "population_2"]
+        assert [int(row[0]) for row in rows[1:]] == list(range(1, 8))
+
+
+def test_statistics_invalid_path():
+    with pytest.raises(ValueError):
+        StatisticsCollector(players=1, path="statistics.json")
@@ -0,0 +1,35 @@
+import numpy as np
+
+from game_of_life.gui.consts import COLORS
+from game_of_life.visualization.texture import board_to_rgba, build_palette
+
+
+def test_build_palette():
+    palette = build_palette(COLORS)
+
+    assert palette.shape == (len(COLORS), 4)
+    assert palette.dtype == np.uint8
+    assert list(palette[1]) == [51, 153, 255, 255]
+
+
+def test_board_to_rgba():
+    palette = build_palette(COLORS)
+    board = np.array([[0, 1, 2], [3, 0, 1]], dtype=np.uint8)
+
+    pixels = board_to_rgba(board, palette)
+
+    assert pixels.shape == (2, 3, 4)
+    # the bottom row of the board is the first row of the texture
+    assert np.array_equal(pixels[0], palette[[3, 0, 1]])
+    assert np.array_equal(pixels[1], palette[[0, 1, 2]])
+
+    out = np.zeros((2, 3, 4), dtype=np.uint8)
+    assert board_to_rgba(board, palette, out=out) is out
+    assert np.array_equal(out, pixels)
+
+
+def test_board_to_rgba_cycles_player_colors():
+    palette = build_palette(COLORS)
+    board = np.array([[4, 5, 0]], dtype=np.uint16)
+
+    assert np.array_equal(board_to_rgba(board, palette)[0], palette[[1, 2, 0]])
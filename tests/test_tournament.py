@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pytest
+
+from game_of_life.engine.pattern import Pattern
+from game_of_life.engine.rule import Rule
+from game_of_life.engine.tournament import Tournament, decide_winner, place_players, play_match
+
+
+@pytest.fixture
+def patterns():
+    return [
+        Pattern(np.array([[1, 1, 1]]), name="Blinker"),
+        Pattern(np.array([[1, 1], [1, 1]]), name="Block"),
+        Pattern(np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]]), name="Glider"),
+    ]
+
+
+def test_place_players(patterns):
+    board = place_players(patterns[:2], width=10, height=5)
+
+    assert np.array_equal(board.data[2, 1:4], [1, 1, 1])
+    assert np.array_equal(board.data[1:3, 6:8], [[2, 2], [2, 2]])
+    assert list(board.player_counts()) == [43, 3, 4]
+
+    with pytest.raises(ValueError):
+        place_players(patterns, width=6, height=5)
+
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23"])
+def test_play_match_matches_full_evolution(patterns, rule):
+    result = play_match([patterns[2], patterns[0]], steps=60, rule=rule, width=16, height=12)
+
+    board = place_players([patterns[2], patterns[0]], width=16, height=12)
+    counts = [np.pad(board.player_counts(), (0, 3))[1:3]]
+    for _ in range(60):
+        board = board.evolve(rule=Rule.parse(rule))
+        counts.append(np.pad(board.player_counts(), (0, 3))[1:3])
+
+    assert result["patterns"] == ["Glider", "Blinker"]
+    assert result["final"] == counts[-1].tolist()
+    assert result["integrated"] == np.sum(counts, axis=0).tolist()
+
+
+def test_decide_winner():
+    assert decide_winner([3, 5]) == 2
+    assert decide_winner([4, 4]) == 0
+    assert decide_winner([0, 0, 1]) == 3
+
+
+def test_tournament_resumes(patterns, tmp_path):
+    path = tmp_path / "results.jsonl"
+    tournament = Tournament(patterns, path, steps=20, width=16, height=8)
+
+    results = tournament.run()
+    assert len(results) == 6
+    assert tournament.pending(results) == []
+
+    # keep two results and a line cut off in the middle
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(lines[:3]) + "\n" + lines[3][:10])
+
+    resumed = tournament.run(processes=2)
+    assert len(resumed) == 6
+    assert sorted(map(json.dumps, resumed)) == sorted(map(json.dumps, results))
+    assert len(path.read_text().splitlines()) == 7
+
+    standings = tournament.standings(resumed)
+    assert sum(row["wins"] + row["draws"] + row["losses"] for row in standings) == 12
+
+    with pytest.raises(ValueError):
+        Tournament(patterns, path, steps=30, width=16, height=8).run()
+
+
+def test_tournament_rejects_invalid_settings(patterns, tmp_path):
+    with pytest.raises(ValueError):
+        Tournament(patterns, tmp_path / "results.jsonl", scoring="best")
+
+    with pytest.raises(ValueError):
+        Tournament(patterns + [patterns[0]], tmp_path / "results.jsonl")
@@ -1,6 +1,6 @@
 import numpy as np
 
-from game_of_life.utils.utils import crop_box, fill_nonzero, get_players, keep_only_number, safe_8_neighborhood
+from game_of_life.utils.utils import compact, count_players, crop_box, fill_nonzero, get_players, keep_only_number, safe_8_neighborhood, select_dtype
 from game_of_life.config import BOARD_DTYPE
 
 
@@ -26,14 +26,14 @@ def test_fill_nonzero():
         [0, 3, 1, -1],
         [0, 0, 0, 0],
         [0, 4, 0, 0],
-    ], dtype=BOARD_DTYPE)
+    ], dtype=np.int32)
 
     reference_box = np.array([
         [2, 0, 2, 0],
         [0, 2, 2, 2],
         [0, 0, 0, 0],
         [0, 2, 0, 0],
-    ], dtype=BOARD_DTYPE)
+    ], dtype=np.int32)
 
     assert np.array_equal(fill_nonzero(input_box, fill_value=2), reference_box)
 
@@ -69,6 +69,20 @@ def test_get_players():
     assert np.array_equal(get_players(input_box), reference_players)
 
 
+def test_count_players():
+    input_box = np.array([
+        [1, 0, 4, 0],
+        [0, 1, 0, 1],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+    ], dtype=BOARD_DTYPE)
+
+    # players which do not appear on the board are skipped, just as the dead cells
+    assert np.array_equal(count_players(input_box), get_players(input_box))
+    assert np.array_equal(count_players(input_box), [1, 4])
+    assert len(count_players(np.zeros((3, 3), dtype=BOARD_DTYPE))) == 0
+
+
 def test_safe_8_neighborhood_in():
     input_box = np.array([
         [1, 0, 2, 0],
@@ -101,3 +115,21 @@ def test_safe_8_neighborhood_out():
     ], dtype=BOARD_DTYPE)
 
     assert np.array_equal(safe_8_neighborhood(input_box, r=1, c=3), reference_box)
+
+
+def test_select_dtype():
+    assert select_dtype(3) == np.uint8
+    assert select_dtype(255) == np.uint8
+    assert select_dtype(256) == np.uint16
+    assert select_dtype(70000) == np.uint32
+
+
+def test_compact():
+    input_box = np.array([
+        [0, 1, 0],
+        [2, 0, 300],
+    ], dtype=np.int64)
+
+    assert compact(input_box).dtype == np.uint16
+    assert compact(input_box[:, :2]).dtype == np.uint8
+    assert np.array_equal(compact(input_box), input_box)